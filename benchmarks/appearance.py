@@ -0,0 +1,166 @@
+# file mygame/benchmarks/appearance.py
+"""
+Microbenchmark of describing a room of 200 things, before and after the
+appearance output moved to utils/templates.py. From the game directory:
+
+    python -m benchmarks.appearance
+
+'before' and 'after' put the description together from the same sorted
+exits, people and groups of things. 'before' is the old way, kept here:
+every member of a group was given its plural though only the first was
+used, and the text was grown with += and joined by the old
+list_to_string. 'after' is the way utils.appearance does it now.
+
+'render_cold' is a whole look at the room with no cached view, which is
+what a room costs when someone has just come or gone, and 'render_cached'
+a second look at an unchanged room.
+"""
+
+from benchmarks.latin import rate
+from utils import appearance
+from utils.latin_language.get_numbered_name import get_numbered_name
+from utils.latin_language.list_to_string import list_to_string
+from utils.templates import join
+
+ROOM_SIZE = 200
+
+# Things in the room: ROOM_SIZE of them, half in four groups and half
+# each on its own
+LEMMATA = ['gladius', 'lucerna', 'pōculum', 'tunica', 'saccus', 'lapis', 'mālum', 'ānulus']
+
+class _Handler:
+    """ Just enough of an Attribute/ndb handler for the stand-ins. """
+
+    def __getattr__(self, name):
+        return None
+
+class _Locks:
+
+    def get(self, access_type):
+        return appearance.OPEN_VIEW
+
+    def check_lockstring(self, accessing_obj, lockstring):
+        return False
+
+class _Sessions:
+
+    def all(self):
+        return []
+
+class _Thing:
+    """ A stand-in for a Rēs, Persōna, Exitus or Locus. """
+
+    def __init__(self, key, location=None, destination=None, has_account=False):
+        self.id = id(self)
+        self.key = key
+        self.db = _Handler()
+        self.db.formae = {'nom_pl': [key + 'ī']}
+        self.ndb = _Handler()
+        self.locks = _Locks()
+        self.sessions = _Sessions()
+        self.contents = []
+        self.destination = destination
+        self.has_account = has_account
+        self.location = location
+        if location is not None:
+            location.contents.append(self)
+
+    def get_display_name(self, looker, **kwargs):
+        return self.key
+
+    def is_typeclass(self, typeclass, exact=False):
+        return False
+
+    def access(self, accessing_obj, access_type):
+        return True
+
+    def msg(self, *args, **kwargs):
+        pass
+
+def make_room():
+    room = _Thing('forum')
+    room.db.desc = "Forum magnum et plēnum est."
+    looker = _Thing('Gaius', location=room, has_account=True)
+    for direction in ('ad septentriōnēs', 'ad merīdiem', 'ad orientem'):
+        _Thing(direction, location=room, destination=room)
+    for name in ('Marcus', 'Quīntus', 'Titus'):
+        _Thing(name, location=room, has_account=True)
+    for i in range(ROOM_SIZE):
+        _Thing(LEMMATA[i % len(LEMMATA)] + (str(i) if i % 2 else ''), location=room)
+    return room, looker
+
+def _old_list_to_string(inlist, endsep="et"):
+    endsep = " " + endsep
+    if not inlist:
+        return ""
+    if len(inlist) == 1:
+        return str(inlist[0])
+    return ", ".join(str(v) for v in inlist[:-1]) + "%s %s" % (endsep, inlist[-1])
+
+def _group(room, looker):
+    """ The exits, people and grouped things of room, as appearance does. """
+
+    view = appearance._build(room, looker)
+    users = [string for con, string in view['users'] if con is not looker]
+    return view['exit_strings'], users, view['things']
+
+def before(room, looker, exit_strings, users, things):
+    thing_strings = []
+    for key, itemlist in sorted(things.items()):
+        nitem = len(itemlist)
+        if nitem == 1:
+            key, _ = get_numbered_name(itemlist[0], nitem, looker, key=key)
+            if itemlist[0].db.ardēns:
+                key = "|y(ardēns)|n " + key
+            if itemlist[0].db.vīsus:
+                key = itemlist[0].db.vīsus
+        else:
+            key = [get_numbered_name(item, nitem, looker, key=key)[1] for item in itemlist][0]
+        thing_strings.append(key)
+
+    string = "\n|c%s|n\n" % room.get_display_name(looker)
+    desc = room.db.desc
+    if desc:
+        string += "%s\n" % desc
+    if exit_strings:
+        string += "\n|wAd hōs locōs īre licet:|n\n " + _old_list_to_string(exit_strings) + "\n"
+    if users or thing_strings:
+        string += "\n|wEcce:|n\n " + _old_list_to_string(users + thing_strings)
+    return string
+
+def after(room, looker, exit_strings, users, things):
+    thing_strings = appearance._thing_strings(things, looker)
+    users = users + thing_strings
+    desc = room.db.desc
+    return join(
+            appearance.NAME(name=room.get_display_name(looker)),
+            desc and appearance.DESC(desc=desc),
+            exit_strings and appearance.EXITS(exits=list_to_string(exit_strings)),
+            users and appearance.CONTENTS(contents=list_to_string(users)),
+            )
+
+def render_cold(room, looker):
+    room.ndb.appearance_cache = None
+    return appearance.return_appearance(room, looker)
+
+def run():
+    room, looker = make_room()
+    grouped = _group(room, looker)
+
+    assert before(room, looker, *grouped) == after(room, looker, *grouped) == render_cold(room, looker)
+
+    return {
+            'before': rate(lambda: before(room, looker, *grouped)),
+            'after': rate(lambda: after(room, looker, *grouped)),
+            'render_cold': rate(lambda: render_cold(room, looker)),
+            'render_cached': rate(lambda: appearance.return_appearance(room, looker)),
+            }
+
+def main():
+    results = run()
+    print(f"(renders/sec of a room of {ROOM_SIZE} things)")
+    for name, value in results.items():
+        print(f"{name:16} {value:12,.1f}   {value / results['before']:6.2f}x before")
+
+if __name__ == '__main__':
+    main()
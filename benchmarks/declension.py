@@ -0,0 +1,153 @@
+# file mygame/benchmarks/declension.py
+"""
+Timings for declining third-declension nouns.
+
+Run from the game directory with
+
+    python -m benchmarks.declension
+
+'before' is the old third_declension, which imported cltk inside the method
+and syllabified the nominative and genitive on every call; it is only timed
+when cltk is installed. 'after' is DeclineNoun.third_declension as it is
+now, with count_syllables and I_STEMS. Both decline the whole paradigm, so
+the two sides do the same work.
+
+Cold start is measured in a fresh interpreter (import plus the first noun);
+steady state is the per-noun cost once everything is loaded and warm, with
+the paradigm cache bypassed so the declension itself is what gets timed.
+"""
+
+import subprocess
+import sys
+import timeit
+
+LEMMATA = [
+        ('rēx', 'rēgis', 'māre'),
+        ('lūmen', 'lūminis', 'neutrum'),
+        ('Opiter', 'Opitris', 'māre'),
+        ('Caesō', 'Caesōnis', 'māre'),
+        ('Sertor', 'Sertōris', 'māre'),
+        ('nox', 'noctis', 'muliebre'),
+        ('mīles', 'mīlitis', 'māre'),
+        ('hostis', 'hostis', 'māre'),
+        ('corpus', 'corporis', 'neutrum'),
+        ('legiō', 'legiōnis', 'muliebre'),
+        ]
+
+COLD_BEFORE = """
+from benchmarks.declension import before
+from utils.latin_language.decline_noun import DeclineNoun
+before(DeclineNoun('rēx', 'rēgis', 'māre'))
+"""
+
+COLD_AFTER = """
+from benchmarks.declension import after
+from utils.latin_language.decline_noun import DeclineNoun
+after(DeclineNoun('rēx', 'rēgis', 'māre'))
+"""
+
+def before(word):
+    """
+    The third declension of word as it was done with cltk.
+    """
+
+    from cltk.phonology.lat.syllabifier import syllabify
+
+    vowels = ['a','e','i','o','u','ā','ē','ī','ō','ū']
+
+    base = word.id_declension()[1]
+
+    forms = [word.nom,word.gen]
+
+    endings = ['ī','em','e','blah','ēs','um','ibus','ēs','ibus','ēs']
+
+    for i in endings:
+        forms.append(base + i)
+
+    forms[5] = word.nom
+
+    nom_syllable = len(syllabify(word.nom))
+    gen_syllable = len(syllabify(word.gen))
+
+    i_stem = False
+
+    if nom_syllable == gen_syllable:
+        if word.nom[-2:] in ['is', 'es']:
+            i_stem = True
+    elif word.nom[-1] in ['x', 's']:
+        if base[-1] not in vowels and base[-2] not in vowels:
+            i_stem = True
+
+    if i_stem == True:
+        forms[7] = forms[7][:-2] + 'i' + forms[7][-2:]
+
+    if word.gender == 'neutrum':
+        forms[5] = word.nom
+        forms[3] = word.nom
+        forms[6] = base + 'a'
+        forms[9] = base + 'a'
+        forms[11] = base + 'a'
+        if word.nom[-1] == 'e' or word.nom[-2:] in ['al','ar']:
+            forms[4] = base + 'ī'
+            forms[6] = base + 'ia'
+            forms[7] = base + 'ium'
+            forms[9] = base + 'ia'
+            forms[11] = base + 'ia'
+    return forms
+
+def after(word):
+    """
+    The third declension of word as it is done now.
+    """
+
+    return word.third_declension()
+
+def cold_start(snippet, repeat=5):
+    """
+    Best wall time of running snippet in a brand new interpreter.
+    """
+
+    statement = f"subprocess.run([sys.executable, '-c', {snippet!r}], check=True)"
+    return min(timeit.repeat(statement, globals=globals(), number=1, repeat=repeat))
+
+def steady(decline, number):
+    """
+    Best time per noun of declining LEMMATA with decline.
+    """
+
+    from utils.latin_language.decline_noun import DeclineNoun
+
+    words = [DeclineNoun(*lemma) for lemma in LEMMATA]
+
+    def run():
+        for word in words:
+            decline(word)
+
+    run()
+    return min(timeit.repeat(run, number=number, repeat=5)) / (number * len(LEMMATA))
+
+def main(number=2000):
+
+    try:
+        import cltk
+        have_cltk = True
+    except ImportError:
+        have_cltk = False
+
+    interpreter = cold_start("pass")
+    print(f"bare interpreter start:  {interpreter * 1000:8.1f} ms")
+
+    if have_cltk:
+        print(f"cold start, before:      {cold_start(COLD_BEFORE) * 1000:8.1f} ms")
+    else:
+        print("cold start, before:      cltk not installed, skipped")
+    print(f"cold start, after:       {cold_start(COLD_AFTER) * 1000:8.1f} ms")
+
+    if have_cltk:
+        print(f"steady state, before:    {steady(before, number) * 1e6:8.2f} µs/noun")
+    else:
+        print("steady state, before:    cltk not installed, skipped")
+    print(f"steady state, after:     {steady(after, number) * 1e6:8.2f} µs/noun")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+# file mygame/benchmarks/latin.py
+"""
+Benchmarks for the Latin layer, runnable offline (no database or running
+server needed). From the game directory:
+
+    python -m benchmarks.latin                 # print the numbers
+    python -m benchmarks.latin --save          # also write them as the baseline
+    python -m benchmarks.latin --compare       # compare with the saved baseline
+
+What is measured:
+
+    decline_*      declining every lemma in world/prototypes.py and every
+                   gens and praenōmen in gens_class_praenomina.name_data,
+                   one at a time (cold cache), through the paradigm cache
+                   (warm) and in bulk with decline_many
+    lexicon_*      building a lexicon file and reading paradigms back from it
+    paradigm_bytes memory held per paradigm dictionary
+    which_one_N    resolving a target in a room of N objects, looking in the
+                   room and the caller as the commands do, with the form
+                   index already built (warm) and built from scratch (cold)
+    check_case_N   checking the case of that target
+
+Rooms are filled with lightweight stand-ins carrying the same key, aliases,
+db.formae and ndb a Rēs would have; the real typeclasses need a database.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from utils.latin_language import lexicon
+from utils.latin_language.check_grammar import check_case
+from utils.latin_language.decline_noun import (
+        DeclineNoun, clear_paradigm_cache, decline_many)
+from utils.latin_language.normalize import normalize, NORMALIZED
+from utils.latin_language.which_one import which_one
+from utils.latin_language.form_index import within
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+ROOM_SIZES = (10, 100, 1000)
+
+# The object searched for in the synthetic rooms; no prototype uses it
+TARGET = ('pōculum', 'pōculī', 'neutrum')
+
+class _Handler:
+    """ Just enough of an Attribute/ndb handler for the stand-ins. """
+
+    def __getattr__(self, name):
+        return None
+
+class _Aliases:
+    """ Just enough of an alias handler for the stand-ins. """
+
+    def __init__(self, forms):
+        self._aliases = {form.lower() for form in forms}
+        self._normalized = {normalize(form) for form in forms}
+
+    def all(self):
+        return list(self._aliases | self._normalized)
+
+    def get(self, category=None, return_list=False):
+        return list(self._normalized if category == NORMALIZED else self._aliases)
+
+class _Thing:
+    """ A stand-in for a Rēs, Persōna or Locus. """
+
+    def __init__(self, key, formae=None, location=None):
+        self.key = key
+        self.db = _Handler()
+        self.db.formae = {label: [form] for label, form in (formae or {}).items()}
+        self.ndb = _Handler()
+        self.aliases = _Aliases((formae or {}).values())
+        self.contents = []
+        self.location = location
+        if location is not None:
+            location.contents.append(self)
+
+    def msg(self, *args, **kwargs):
+        pass
+
+def rate(function, repeat=5, min_time=0.2):
+    """
+    Calls per second of function, best of repeat runs of at least min_time.
+    """
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+
+    return number / best
+
+def bench_declension(lemmata):
+    results = {}
+
+    def cold():
+        clear_paradigm_cache()
+        for lemma in lemmata:
+            DeclineNoun(*lemma).make_paradigm()
+
+    def warm():
+        for lemma in lemmata:
+            DeclineNoun(*lemma).make_paradigm()
+
+    results['decline_cold'] = rate(cold) * len(lemmata)
+    warm()
+    results['decline_warm'] = rate(warm) * len(lemmata)
+    results['decline_many'] = rate(lambda: decline_many(lemmata)) * len(lemmata)
+
+    clear_paradigm_cache()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    paradigms = [DeclineNoun(*lemma).make_paradigm() for lemma in lemmata]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    results['paradigm_bytes'] = grown / len(paradigms)
+
+    return results
+
+def bench_lexicon(lemmata):
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        lexicon.close()
+        lexicon.connect(os.path.join(directory, 'lexicon.db'))
+        start = time.perf_counter()
+        lexicon.build_lexicon(lemmata)
+        results['lexicon_build_s'] = time.perf_counter() - start
+
+        def lookups():
+            for lemma in lemmata:
+                lexicon.lookup(*lemma)
+
+        results['lexicon_lookup'] = rate(lookups) * len(lemmata)
+        lexicon.close()
+
+    return results
+
+def make_room(size, lemmata):
+    """
+    A room holding size - 1 objects drawn from lemmata, the TARGET and a
+    caller, with the caller's inventory empty.
+    """
+
+    room = _Thing('locus')
+    caller = _Thing('Gaius Iūlius', location=room)
+
+    for i in range(size - 1):
+        nom, gen, gender = lemmata[i % len(lemmata)]
+        _Thing(nom, DeclineNoun(nom, gen, gender).make_paradigm(), location=room)
+
+    target = _Thing(TARGET[0], DeclineNoun(*TARGET).make_paradigm(), location=room)
+
+    return room, caller, target
+
+def bench_rooms(lemmata):
+    results = {}
+    acc = DeclineNoun(*TARGET).make_paradigm()['acc_sg']
+
+    for size in ROOM_SIZES:
+        room, caller, target = make_room(size, lemmata)
+        stuff = within(room, caller)
+
+        assert which_one(acc, caller, stuff)[0] is target
+
+        def cold():
+            room.ndb.form_index = None
+            which_one(acc, caller, stuff)
+
+        results[f'which_one_{size}'] = rate(lambda: which_one(acc, caller, stuff))
+        results[f'which_one_cold_{size}'] = rate(cold)
+        results[f'check_case_{size}'] = rate(lambda: check_case(caller, target, acc, 'acc_sg'))
+
+    return results
+
+def run():
+    lemmata = list(dict.fromkeys(lexicon.known_lemmata()))
+
+    results = {'lemmata': len(lemmata)}
+    results.update(bench_declension(lemmata))
+    results.update(bench_lexicon(lemmata))
+    results.update(bench_rooms(lemmata))
+
+    return results
+
+def report(results, baseline=None):
+    for name, value in results.items():
+        line = f"{name:24} {value:16,.1f}" if value >= 100 else f"{name:24} {value:16.4f}"
+        if baseline and name in baseline and baseline[name]:
+            line += f"   {value / baseline[name]:6.2f}x baseline"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Latin layer.")
+    parser.add_argument('--save', action='store_true', help="write the results as the baseline")
+    parser.add_argument('--compare', action='store_true', help="compare with the saved baseline")
+    parser.add_argument('--baseline', default=BASELINE, help="baseline file")
+    options = parser.parse_args()
+
+    results = run()
+
+    baseline = None
+    if options.compare and os.path.exists(options.baseline):
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+
+    print("(ops/sec unless stated otherwise; decline_* and lexicon_lookup per lemma)")
+    report(results, baseline)
+
+    if options.save:
+        with open(options.baseline, 'w') as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+
+if __name__ == '__main__':
+    main()
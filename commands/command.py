@@ -7,6 +7,8 @@ Commands describe the input the account can do to the game.
 
 from evennia.commands.command import Command as BaseCommand
 
+from utils import permissions, writebehind
+
 # from evennia import default_cmds
 
 
@@ -86,7 +88,8 @@ class MuxCommand(Command):
         This hook is called after the command has finished executing
         (after self.func()).
         """
-        pass
+        writebehind.flush()
+        permissions.changed()
 
     def parse(self):
         """
@@ -23,6 +23,29 @@ from commands.vestīre import VestītaPersōnaCmdSet
 # from commands.iussa_rērum import Ligā
 from world.tb_basic import BattleCmdSet
 from commands.tempus import Tempus
+from utils import permissions
+
+
+class CmdPerm(default_cmds.CmdPerm):
+    __doc__ = default_cmds.CmdPerm.__doc__
+
+    def func(self):
+        """
+        Change permissions, then have builder status worked out again.
+        """
+        super().func()
+        permissions.changed()
+
+
+class CmdQuell(default_cmds.CmdQuell):
+    __doc__ = default_cmds.CmdQuell.__doc__
+
+    def func(self):
+        """
+        Quell or unquell, then have builder status worked out again.
+        """
+        super().func()
+        permissions.changed()
 
 
 class CharacterCmdSet(default_cmds.CharacterCmdSet):
@@ -42,6 +65,7 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         #
         # any commands you add below will overload the default ones.
         #
+        self.add(CmdPerm())
 
 class PersōnaCmdSet(default_cmds.CharacterCmdSet):
     """
@@ -74,6 +98,10 @@ class PersōnaCmdSet(default_cmds.CharacterCmdSet):
         # For ingame_python
         #
         self.add(CmdCallback())
+        #
+        # Clearing cached builder status on permission changes
+        #
+        self.add(CmdPerm())
 
 
 class AccountCmdSet(default_cmds.AccountCmdSet):
@@ -94,6 +122,7 @@ class AccountCmdSet(default_cmds.AccountCmdSet):
         #
         # any commands you add below will overload the default ones.
         #
+        self.add(CmdQuell())
 
 
 class UnloggedinCmdSet(default_cmds.UnloggedinCmdSet):
@@ -7,6 +7,7 @@ Iussa describe the Latin commands and syntax for interacting with the world
 """
 import datetime 
 from django.conf import settings
+from django.db import transaction
 
 from evennia.commands.default import muxcommand
 from evennia.utils import create, gametime
@@ -18,11 +19,15 @@ from evennia.commands.default.building import ObjManipCommand
 from unidecode import unidecode
 from random import choice, randint
 
-from utils.latin_language.adjective_agreement import us_a_um
+from utils.latin_language.adjective_agreement import adjective, agree, relative
 from utils.latin_language.which_one import which_one
-from utils.latin_language.check_grammar import check_case
-from utils.latin_language.free_hands import free_hands, put_into_hand, take_out_of_hand
+from utils.latin_language.form_index import within
+from utils import appearance, bulk, containers, equipment, hands, light, load, permissions, status, writebehind
+from utils.broadcast import broadcast, render
+from utils.latin_language.check_grammar import check_case, assign_cases
+from utils.latin_language.free_hands import put_into_hand, take_out_of_hand
 from utils.latin_language.gens_class_praenomina import name_data
+from utils.latin_language.list_to_string import list_to_string
 
 from typeclasses.locī import Locus
 from typeclasses.exitūs import Exitus
@@ -41,12 +46,15 @@ class MuxCommand(muxcommand.MuxCommand):
         This hook is called after the command has finished executing
         (after self.func())
         """
+        writebehind.flush()
+        permissions.changed()
         caller = self.caller
         if hasattr(caller, 'db'):
             if caller.db.pv:
                 prompt = f"|wVīta: {caller.db.pv['nunc']}/{caller.db.pv['max']}) |n"
 
                 caller.msg(prompt)
+                status.push(caller)
             else:
                 pass
         else:
@@ -75,16 +83,9 @@ class Spectā(MuxCommand):
         caller = self.caller
 
         # If it's dark, they can't see
-        if caller.location.db.āter:
-            lūx = False
-            contents = caller.contents + caller.location.contents
-            for con in contents:
-                if con.db.ardēns == True:
-                    lūx = True
-
-            if lūx == False:
-                caller.msg("Nihil per tenebrās vidēre potes.")
-                return
+        if not light.can_see(caller):
+            caller.msg("Nihil per tenebrās vidēre potes.")
+            return
 
         # checking out the room
         if not self.args:
@@ -100,8 +101,7 @@ class Spectā(MuxCommand):
 
         # looking at a thing
         else:
-            stuff = caller.location.contents + caller.contents
-            target, self.args = which_one(self.args, caller, stuff)
+            target, self.args = which_one(self.args, caller, within(caller.location, caller))
             if not target:
                 caller.msg(f"'{self.args}' nōn invēnistī!")
                 return
@@ -123,9 +123,11 @@ class Cape(MuxCommand):
 
     Usage:
         cape <rem>
+        cape omnia [<rēs>]
+        cape <numerus> <rēs>
 
     Lets you move an object from the location you occupy into your
-    inventory.
+    inventory, or as many as your hands and strength allow.
     """
 
     key = "cape"
@@ -145,17 +147,20 @@ class Cape(MuxCommand):
             if caller.db.Latin:
                 latin_caller = True
 
+        # Take many things at once
+        many = bulk.parse(self.args)
+        if many:
+            self.take_many(caller, *many)
+            return
+
         # Return an error if there are too many or too few arguments
         if len(self.arglist) != 1:
             caller.msg("Quid capere velis?")
             return
 
-        # Make a list of objects in the caller's location:
-        stuff = caller.location.contents
-
         # Check to see if more than one object has the target's name;
         # Return the target and the args
-        target, self.args = which_one(self.args, caller, stuff)
+        target, self.args = which_one(self.args, caller, within(caller.location))
         if not target:
             caller.msg(f"'{self.args}' nōn invēnistī!")
             return
@@ -190,9 +195,9 @@ class Cape(MuxCommand):
         # If the object and the caller are Latin objects, follow through with
         # evaluating caller's ability to carry anything else
         if latin_caller and latin_target:
-            current_carry = caller.db.toll_fer['ferēns']
+            current_carry = load.carried(caller)
             carry_max = caller.db.toll_fer['max']
-            target_mass = target.db.physical['massa']
+            target_mass = load.mass(target)
 
             # Make sure proper syntax was used
             if check_case(caller, target, self.args, 'acc_sg') == False:
@@ -206,23 +211,20 @@ class Cape(MuxCommand):
 
             # Check to see if hands are free;
             # If so, put into dominant hand, if free
-            if len(caller.db.manibus_plēnīs) >= 2:
+            if not hands.free(caller):
                 caller.msg("Manūs tuae sunt plēnae!")
                 return
 
             put_into_hand(caller, target)
-            caller.db.toll_fer['ferēns'] += target_mass
 
-            caller.msg(f"{target.db.formae['acc_sg'][0]} cēpistī.")
-            caller.location.msg_contents(
-                    f"{caller.key} {target.db.formae['acc_sg'][0]} cēpit.",
-                    exclude=caller
+            broadcast(caller.location, caller, target,
+                    to_actor="{target:acc_sg} cēpistī.",
+                    to_room="{actor} {target:acc_sg} cēpit.",
                     )
         else:
-            caller.msg(f"{target.key} cēpistī.")
-            caller.location.msg_contents(
-                    f"{caller.key} {target.key} cēpit.",
-                    exclude=caller
+            broadcast(caller.location, caller, target,
+                    to_actor="{target} cēpistī.",
+                    to_room="{actor} {target} cēpit.",
                     )
 
         # Account for ligatures
@@ -231,18 +233,72 @@ class Cape(MuxCommand):
             ligature = target
 
             if ligature.db.ligāns:
-                ligature_sex = ligature.db.sexus
                 bound_entity = None
-                for s in stuff:
+                for s in caller.location.contents:
                     if s.dbref == ligature.db.ligāns:
                         bound_entity = s
 
-                bound_entity.db.descriptive_name = f"{bound_entity.name} {ligature.db.formae['abl_sg'][0]} ligāt{us_a_um('nom_sg',bound_entity.db.sexus)} qu{'em' if ligature_sex == 'māre' else 'am' if ligature_sex == 'muliebre' else 'od'} {caller.name} tenet"
+                bound_entity.db.descriptive_name = f"{bound_entity.name} {ligature.db.formae['abl_sg'][0]} {agree('ligāt', bound_entity)} {relative(ligature, 'acc_sg')} {caller.name} tenet"
+                appearance.changed(bound_entity.location)
 
         # move target to inventory if possible
         target.move_to(caller, quiet=True)
         target.at_get(caller)
 
+    def take_many(self, caller, count, form):
+        """
+        Take the things meant by count and form, as many as the caller
+        has hands for and can carry.
+        """
+
+        stuff = [thing for thing in caller.location.contents if thing != caller]
+        things = bulk.select(caller, count, form, stuff)
+        if things is None:
+            return
+
+        # Ligatures binding someone are taken one at a time
+        things = [thing for thing in things
+                if thing.access(caller, "get") and not thing.db.ligāns and thing.at_before_get(caller)]
+        if not things:
+            caller.msg("Nihil est quod capere possīs.")
+            return
+
+        # Work out what can be taken before anything moves
+        free = len(hands.free(caller))
+        carry = load.carried(caller)
+        carry_max = caller.db.toll_fer['max']
+        taken, refusal = [], None
+        for thing in things:
+            if len(taken) >= free:
+                refusal = "Manūs tuae sunt plēnae!"
+                break
+            mass = load.mass(thing)
+            if carry + mass > carry_max:
+                refusal = "Tantum ponderis ferre nōn potes!"
+                continue
+            carry += mass
+            taken.append(thing)
+
+        if not taken:
+            if refusal:
+                caller.msg(refusal)
+            return
+
+        with transaction.atomic():
+            for thing in taken:
+                put_into_hand(caller, thing)
+                thing.move_to(caller, quiet=True)
+                thing.at_get(caller)
+            writebehind.flush()
+
+        broadcast(caller.location, caller,
+                to_actor="{things} cēpistī.",
+                to_room="{actor} {things} cēpit.",
+                things=bulk.describe(taken),
+                )
+        if refusal:
+            caller.msg(refusal)
+
 class Relinque(MuxCommand):
     """
     Get rid of something
@@ -271,15 +327,14 @@ class Relinque(MuxCommand):
         if hasattr(caller, 'db'):
             if caller.db.latin:
                 latin_caller = True
-                current_carry = caller.db.toll_fer['ferēns']
+                current_carry = load.carried(caller)
         
         if not self.arglist or len(self.arglist) != 1:
             caller.msg("Quid relinquere velis?")
             return
 
         # Ensure the intended object is targeted
-        stuff = caller.contents
-        target, self.args = which_one(self.args, caller, stuff)
+        target, self.args = which_one(self.args, caller, within(caller))
         if not target:
             caller.msg(f"'{self.args}' nōn invēnistī!")
             return
@@ -308,14 +363,14 @@ class Relinque(MuxCommand):
     #        if target.db.geritur:
     #            target.remove(caller,quiet=True)
 
-            # Lighten the callers toll_fer['ferēns']
-            target_mass = target.db.physical['massa']
-            caller.db.toll_fer['ferēns'] -= target_mass
 
         # Move object to caller's location
         target.move_to(caller.location, quiet=True)
-        caller.msg(f"{target_direct_object_name} relīquistī.")
-        caller.location.msg_contents(f"{caller.name} {target_direct_object_name} relīquit.", exclude=caller)
+        broadcast(caller.location, caller,
+                to_actor="{thing} relīquistī.",
+                to_room="{actor} {thing} relīquit.",
+                thing=target_direct_object_name,
+                )
 
         # call the object script's at_drop() method.
         target.at_drop(caller)
@@ -354,7 +409,7 @@ class Da(MuxCommand):
         if hasattr(caller, 'db'):
             if caller.db.latin:
                 latin_caller = True
-                caller_carry = caller.db.toll_fer['ferēns']
+                caller_carry = load.carried(caller)
 
         # Ensure proper number of items in command
         if len(self.arglist) != 2:
@@ -375,11 +430,16 @@ class Da(MuxCommand):
 
         everything = possessions + things_in_room
 
-        entity_1, arg1 = which_one(self.arglist[0], caller, everything)
+        # Tell the gift (accusative) from the recipient (dative) by their
+        # inflection where possible
+        by_case = assign_cases(self.arglist, ('acc_sg', 'dat_sg'), everything)
+        args = by_case if by_case else self.arglist
+
+        entity_1, arg1 = which_one(args[0], caller, everything)
         if not entity_1:
             caller.msg(f"'{arg1}' nōn invēnistī!")
             return
-        entity_2, arg2 = which_one(self.arglist[1], caller, everything)
+        entity_2, arg2 = which_one(args[1], caller, everything)
         if not entity_2:
             caller.msg(f"'{arg2}' nōn invēnistī!")
             return
@@ -394,7 +454,7 @@ class Da(MuxCommand):
             caller.msg("Cui dare voluistī?")
             return
 
-        if entity_1 in possessions:
+        if by_case or entity_1 in possessions:
             target = entity_1
             target_arg = arg1
             recipient = entity_2
@@ -405,6 +465,14 @@ class Da(MuxCommand):
             recipient = entity_1
             recipient_arg = arg1
 
+        if target not in possessions:
+            caller.msg("Quid dare voluistī?")
+            return
+
+        if recipient not in potential_recipients:
+            caller.msg("Cui dare voluistī?")
+            return
+
         # Check whether target is Latin Object
         if hasattr(target, 'db'):
             if target.db.latin:
@@ -415,13 +483,13 @@ class Da(MuxCommand):
                     return
 
                 # Establish target object's status
-                target_mass = target.db.physical['massa']
+                target_mass = load.mass(target)
                 target_acc_sg = target.db.formae['acc_sg'][0]
 
         # Ensure caller is either holding the target or has a free hand
         if latin_caller and latin_target:
             if not target.db.tenētur:
-                if len(caller.db.manibus_plēnīs) >= 2:
+                if not hands.free(caller):
                     caller.msg("Manūs tuae sunt plēnae!")
                     return
 
@@ -434,26 +502,26 @@ class Da(MuxCommand):
         if hasattr(recipient, 'db'):
             if recipient.db.latin:
                 latin_recipient = True
-                recipient_carry = recipient.db.toll_fer['ferēns']
+                recipient_carry = load.carried(recipient)
 
                 # Ensure caller referred to recipient in the dative case
                 if check_case(caller, recipient, recipient_arg, 'dat_sg') == False:
                     return
 
                 # Establish recipient's status and encumberance
-                recipient_carry = recipient.db.toll_fer['ferēns']
+                recipient_carry = load.carried(recipient)
                 recipient_max = recipient.db.toll_fer['max']
                 recipient_dat_sg = recipient.db.formae['dat_sg'][0]
 
                 # If recipient's too weak, or if hands are full:
-                if len(recipient.db.manibus_plēnīs) >= 2:
+                if not hands.free(recipient):
                     caller.msg(f"Manūs {recipient.db.formae['gen_sg'][0]} sunt plēnae!")
-                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare conāt{us_a_um('nom_sg',caller.db.sexus)}, sed manūs tuae plēnae sunt.")
+                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare {agree('conāt', caller)}, sed manūs tuae plēnae sunt.")
                     return
 
                 if recipient_carry + target_mass > recipient_max:
                     caller.msg(f"{recipient.key} tantum ponderis ferre nōn potest!")
-                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare conāt{us_a_um('nom_sg',caller.db.sexus)}, sed tū tantum ponderis ferre nōn potes!")
+                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare {agree('conāt', caller)}, sed tū tantum ponderis ferre nōn potes!")
                     return
 
         # calling at_before_give hook method
@@ -470,10 +538,8 @@ class Da(MuxCommand):
         # Adjust encumberance and occupied hands for latin participants
         if latin_target and latin_caller:
             take_out_of_hand(caller, target)
-            caller.db.toll_fer['ferēns'] -= target_mass
         if latin_target and latin_recipient:
             put_into_hand(recipient, target)
-            recipient.db.toll_fer['ferēns'] += target_mass
 
         target.move_to(recipient, quiet=True)
         recipient.msg(f"{caller.key} tibi {target_acc_sg} dedit.")
@@ -979,7 +1045,7 @@ class Nascātur(MuxCommand):
                         ]
                     )
 
-        caller.location.msg_contents(f"{nōmina} nāt{us_a_um('nom_sg',self.sexus)} est!")
+        caller.location.msg_contents(f"{nōmina} {adjective('nāt', 'nom_sg', self.sexus)} est!")
 
 
 
@@ -989,8 +1055,10 @@ class Pōne(MuxCommand):
 
     Usage:
         pōne <rem> in <rem>
+        pōne omnia in <rem>
 
-    Store things in containers
+    Store things in containers. 'omnia' puts in everything you hold
+    that fits.
     """
 
     key = "pōne"
@@ -1024,26 +1092,28 @@ class Pōne(MuxCommand):
             intended_container = self.arglist[2]
 
         # identify target
-        possessions = caller.contents
-        target, intended_target = which_one(intended_target,caller,possessions)
-        if not target:
-            caller.msg(f"'{intended_target}' nōn invēnistī!")
-            return
+        everything = intended_target == 'omnia'
+        if everything:
+            target = None
+        else:
+            target, intended_target = which_one(intended_target,caller,within(caller))
+            if not target:
+                caller.msg(f"'{intended_target}' nōn invēnistī!")
+                return
 
-        # check grammar of Latin objects
-        if hasattr(target, 'db'):
-            if target.db.latin:
-                if check_case(caller, target, intended_target, 'acc_sg') == False:
-                    return
+            # check grammar of Latin objects
+            if hasattr(target, 'db'):
+                if target.db.latin:
+                    if check_case(caller, target, intended_target, 'acc_sg') == False:
+                        return
 
-        # ensure object is in hands
-        if not target.db.tenētur:
-            caller.msg(f"{target.db.formae['acc_sg'][0]} nōn tenēs!")
-            return
+            # ensure object is in hands
+            if not target.db.tenētur:
+                caller.msg(f"{target.db.formae['acc_sg'][0]} nōn tenēs!")
+                return
 
         # identify container
-        stuff = caller.contents + caller.location.contents
-        container, intended_container = which_one(intended_container,caller,stuff)
+        container, intended_container = which_one(intended_container,caller,within(caller, caller.location))
         if not container:
             caller.msg(f"'{intended_container}' nōn invēnistī!")
             return
@@ -1059,6 +1129,10 @@ class Pōne(MuxCommand):
             caller.msg(f"{container.key} nihil tenēre potest!")
             return
 
+        if everything:
+            self.put_everything(caller, container)
+            return
+
         # don't let something be put into itself!
         if target == container:
             caller.msg(f"{target.name} in sē pōnī nōn potest!")
@@ -1066,58 +1140,71 @@ class Pōne(MuxCommand):
 
         # Don't let a ligature bound to someone else be put into a bag
         if target.db.ligāns:
-            caller.msg(f"{target.name} in aliquō ligāt{us_a_um('nom_sg',target.db.sexus)} condī nōn potest.")
+            caller.msg(f"{target.name} in aliquō {agree('ligāt', target)} condī nōn potest.")
             return
 
         # Manage volume and dimensions of target and container
-        target_volume = target.db.physical['litra']
-        container_max_volume = container.db.capax['max_vol']
-        container_remaining_volume = container.db.capax['rem_vol']
+        reason = containers.fits(container, target)
+        if reason:
+            caller.msg(self.refusal(target, container, reason))
+            return
+
+        # Make the move happen; the move hooks take the target's room from
+        # the container and add its mass, and if the caller holds the
+        # container, leave their load as it was
+        broadcast(caller.location, caller, target,
+                to_actor="{target:acc_sg} in {container:acc_sg} posuistī.",
+                to_room="{actor} {target:acc_sg} in {container:acc_sg} posuit.",
+                container=container,
+                )
+        take_out_of_hand(caller,target)
+        target.move_to(container, quiet=True)
 
-        if target_volume > container_remaining_volume:
-            caller.msg(f"Magnitūdō {target.db.formae['gen_sg'][0]} est māior quam spatium in {container.db.formae['abl_sg'][0]}.")
-            return
+        return
 
-        if target.db.physical['rigēns'] == True:
-            target_dimensions = [
-                    target.db.physical['x'],
-                    target.db.physical['y'],
-                    target.db.physical['z'],
-                    ]
-            container_dimensions = [
-                    container.db.capax['x'],
-                    container.db.capax['y'],
-                    container.db.capax['z'],
-                    ]
-            target_dimensions.sort()
-            container_dimensions.sort()
-            # Allow for objects sticking at most half out of container
-            if target_dimensions[2] / 2 > container.db.capax['y'] and target_dimensions[2] > container_dimensions[2]:
-                caller.msg(f"{container.name} satis alt{us_a_um('nom_sg',container.db.sexus)} nōn est!")
-                return
-            elif target_dimensions[1] > container_dimensions[1] or target_dimensions[0] > container_dimensions[0]:
-                caller.msg(f"Forma {target.db.formae['gen_sg'][0]} ad {container.db.formae['acc_sg'][0]} apt{us_a_um('nom_sg',target.db.sexus)} nōn est!")
-                return
+    def refusal(self, target, container, reason):
+        """
+        Why target does not go into container, as told to the caller.
+        """
 
-        # Make the move happen
-        caller.msg(f"{target.db.formae['acc_sg'][0]} in {container.db.formae['acc_sg'][0]} posuistī.")
-        caller.location.msg_contents(f"{caller.name} {target.db.formae['acc_sg'][0]} in {container.db.formae['acc_sg'][0]} posuit.",exclude=caller)
-        container.db.capax['rem_vol'] -= target.db.physical['litra']
-        take_out_of_hand(caller,target)
-        target.move_to(container, quiet=True)
+        if reason == containers.VOLUME:
+            return f"Magnitūdō {target.db.formae['gen_sg'][0]} est māior quam spatium in {container.db.formae['abl_sg'][0]}."
+        if reason == containers.HEIGHT:
+            return f"{container.name} satis {agree('alt', container)} nōn est!"
+        return f"Forma {target.db.formae['gen_sg'][0]} ad {container.db.formae['acc_sg'][0]} {agree('apt', target)} nōn est!"
+
+    def put_everything(self, caller, container):
+        """
+        Put everything the caller holds that fits into container at once.
+        """
 
-        # If container isn't rigid, increase its volume
-        if not container.db.physical['rigēns']:
-            container.db.physical['litra'] += target.db.physical['litra']
+        held = [thing for thing in caller.contents
+                if thing.db.tenētur and thing != container and not thing.db.ligāns]
+        if not held:
+            caller.msg("Nihil tenēs quod pōnere possīs!")
+            return
 
-        # If caller isn't holding the container, fix the encumberance
-        if container not in possessions:
-            caller.db.toll_fer['ferēns'] -= target.db.physical['massa']
+        packed, refused = containers.plan(container, held)
+        for target, reason in refused:
+            caller.msg(self.refusal(target, container, reason))
+        if not packed:
+            return
 
-        # adjust the mass of the container
-        container.db.physical['massa'] += target.db.physical['massa']
+        # Move everything and store the new state of the container and
+        # the caller's load together
+        with transaction.atomic():
+            for target in packed:
+                take_out_of_hand(caller, target)
+                target.move_to(container, quiet=True)
+            writebehind.flush()
 
-        return
+        things = list_to_string([render("{thing:acc_sg}", thing=target) for target in packed])
+        broadcast(caller.location, caller,
+                to_actor="{things} in {container:acc_sg} posuistī.",
+                to_room="{actor} {things} in {container:acc_sg} posuit.",
+                things=things,
+                container=container,
+                )
 
 class Excipe(MuxCommand):
     """
@@ -1158,8 +1245,7 @@ class Excipe(MuxCommand):
             intended_container = self.arglist[2]
 
         # identify container
-        stuff = caller.contents + caller.location.contents
-        container, intended_container = which_one(intended_container,caller,stuff)
+        container, intended_container = which_one(intended_container,caller,within(caller, caller.location))
         if not container:
             caller.msg(f"'{intended_container}' nōn invēnistī!")
             return
@@ -1176,8 +1262,7 @@ class Excipe(MuxCommand):
             return
 
         # identify target
-        contents = container.contents
-        target, intended_target = which_one(intended_target,caller,contents)
+        target, intended_target = which_one(intended_target,caller,within(container))
         if not target:
             caller.msg(f"'{intended_target}' nōn invēnistī!")
             return
@@ -1215,9 +1300,9 @@ class Excipe(MuxCommand):
         # If the object and the caller are Latin objects, follow through with
         # evaluating caller's ability to carry anything else
         if latin_caller and latin_target:
-            current_carry = caller.db.toll_fer['ferēns']
+            current_carry = load.carried(caller)
             carry_max = caller.db.toll_fer['max']
-            target_mass = target.db.physical['massa']
+            target_mass = load.mass(target)
 
             # Check to see if character can carry any more weight;
             # Add target mass to burden if caller can carry more
@@ -1227,13 +1312,11 @@ class Excipe(MuxCommand):
 
             # Check to see if hands are free;
             # If so, put into dominant hand, if free
-            if len(caller.db.manibus_plēnīs) >= 2:
+            if not hands.free(caller):
                 caller.msg("Manūs tuae sunt plēnae!")
                 return
 
             put_into_hand(caller, target)
-            if container.location != caller:
-                caller.db.toll_fer['ferēns'] += target_mass
 
             caller.msg(f"{target.db.formae['acc_sg'][0]} ex {container.db.formae['abl_sg'][0]} cēpistī.")
             caller.location.msg_contents(
@@ -1251,13 +1334,6 @@ class Excipe(MuxCommand):
         target.move_to(caller, quiet=True)
         target.at_get(caller)
 
-        # If non-rigid container, reduce its volume
-        if container.db.physical['rigēns']:
-            container.db.physical['litra'] -= target.db.physical['litra']
-
-        # Remove the mass of the target from the mass of the container
-        container.db.physical['massa'] -= target.db.physical['massa']
-
 class Inspice(MuxCommand):
     """
     Look inside of a container
@@ -1289,8 +1365,7 @@ class Inspice(MuxCommand):
         intended_container = self.arglist[1]
 
         # identify container
-        stuff = caller.contents + caller.location.contents
-        container, intended_container = which_one(intended_container,caller,stuff)
+        container, intended_container = which_one(intended_container,caller,within(caller, caller.location))
         if not container:
             caller.msg(f"'{intended_container}' nōn invēnistī!")
             return
@@ -1345,9 +1420,9 @@ class Tenē(MuxCommand):
             return
 
         hand_specified = False
-        hands = ['dextrā','dextra','sinistrā','sinistra']
+        hand_words = ['dextrā','dextra','sinistrā','sinistra']
         for arg in self.arglist:
-            if arg in hands:
+            if arg in hand_words:
                 hand_specified = arg
                 break
 
@@ -1370,12 +1445,10 @@ class Tenē(MuxCommand):
 #        no_hands = arguments.remove(hand_specified)
 #        intended_target = no_hands[0]
 
-        stuff = caller.location.contents
-        for con in caller.contents:
-            if con.db.tenētur:
-                stuff.append(con)
-
-        target, intended_target = which_one(intended_target,caller,stuff)
+        # What is in the room, or in the caller's hands
+        held = equipment.held(caller)
+        here = within(caller.location, caller, accept=lambda thing: thing.location != caller or thing in held)
+        target, intended_target = which_one(intended_target,caller,here)
         if not target:
             caller.msg(f"'{intended_container}' nōn invēnistī!")
             return
@@ -1388,7 +1461,7 @@ class Tenē(MuxCommand):
         if target.db.tenētur == hand_specified:
             caller.msg(f"{target.db.formae['acc_sg'][0]} illā manū iam tenēs!")
             return
-        elif hand_specified in caller.db.manibus_plēnīs:
+        elif hands.in_hand(caller, hand_specified):
             caller.msg(f"Illa manus aliquid iam tenet!")
             return
 
@@ -1411,22 +1484,15 @@ class Tenē(MuxCommand):
 
         # Put into hand
         if target.db.tenētur:
-            caller.db.manibus_vacuīs.append(target.db.tenētur)
-            caller.db.manibus_vacuīs.remove(hand_specified)
-            caller.db.manibus_plēnīs.remove(target.db.tenētur)
-            caller.db.manibus_plēnīs.append(hand_specified)
-            target.db.tenētur = hand_specified
+            hands.hold(caller, target, hand_specified)
         else:
-            if target.db.physical['massa'] + caller.db.toll_fer['ferēns'] > caller.db.toll_fer['max']:
+            if load.mass(target) + load.carried(caller) > caller.db.toll_fer['max']:
                 caller.msg("Tantum ponderis ferre nōn potes!")
                 return
             else:
-                target.db.tenētur = hand_specified
+                hands.hold(caller, target, hand_specified)
                 target.move_to(caller,quiet=True)
                 target.at_get(caller)
-                caller.db.manibus_plēnīs.append(hand_specified)
-                caller.db.manibus_vacuīs.remove(hand_specified)
-                caller.db.toll_fer['ferēns'] += target.db.physical['massa']
 
         # Account for ligatures
         ligature = None
@@ -1435,12 +1501,12 @@ class Tenē(MuxCommand):
 
             if ligature.db.ligāns:
                 bound_entity = None
-                ligature_sex = ligature.db.sexus
-                for s in stuff:
+                for s in caller.location.contents + held:
                     if s.dbref == ligature.db.ligāns:
                         bound_entity = s
 
-                bound_entity.db.descriptive_name = f"{bound_entity.name} {ligature.db.formae['abl_sg'][0]} ligāt{us_a_um('nom_sg',bound_entity.db.sexus)} qu{'em' if ligature_sex == 'māre' else 'am' if ligature_sex =='muliebre' else 'od'} {caller.name} tenet"
+                bound_entity.db.descriptive_name = f"{bound_entity.name} {ligature.db.formae['abl_sg'][0]} {agree('ligāt', bound_entity)} {relative(ligature, 'acc_sg')} {caller.name} tenet"
+                appearance.changed(bound_entity.location)
 
         caller.msg(f"{target.db.formae['acc_sg'][0]} {hand_specified} tenēs.")
         caller.location.msg_contents(f"{caller.name} {target.db.formae['acc_sg'][0]} {hand_specified} tenet.",exclude=caller)
@@ -1481,34 +1547,41 @@ class Ligā(MuxCommand):
         everything = caller.location.contents + possessions
 
 
-        ligature = False
         # Make sure that caller is holding a ligature
-        for p in possessions:
-            if p.db.tenētur and p.typename == 'Ligātūra':
-                ligature = p
+        ligature = equipment.holding(caller, 'Ligātūra')
 
         if not ligature:
             caller.msg('Nūllum tenēs quō ligāre potes.')
             return
 
-        # Idnetify ligature and target
-        entity1, arg1 = which_one(arg1, caller, everything)
-        if not entity1:
-            caller.msg(f"'{arg1}' nōn invēnistī!")
-            return
-        entity2, arg2 = which_one(arg2, caller, everything)
-        if not entity2:
-            caller.msg(f"'{arg2}' nōn invēnistī!")
-            return
+        # Idnetify ligature and target, by inflection if it is clear
+        # which is the accusative and which the ablative
+        by_case = assign_cases([arg1, arg2], ('acc_sg', 'abl_sg'), everything)
 
-        if entity1 in [ligature]:
-            target = entity2
-            target_arg = arg2
-            ligature_arg = arg1
+        if by_case:
+            target, target_arg = which_one(by_case[0], caller, everything)
+            if not target:
+                caller.msg(f"'{target_arg}' nōn invēnistī!")
+                return
+            ligature_arg = by_case[1].split('-')[-1].strip().lower()
         else:
-            target = entity1
-            target_arg = arg1
-            ligature_arg = arg2
+            entity1, arg1 = which_one(arg1, caller, everything)
+            if not entity1:
+                caller.msg(f"'{arg1}' nōn invēnistī!")
+                return
+            entity2, arg2 = which_one(arg2, caller, everything)
+            if not entity2:
+                caller.msg(f"'{arg2}' nōn invēnistī!")
+                return
+
+            if entity1 in [ligature]:
+                target = entity2
+                target_arg = arg2
+                ligature_arg = arg1
+            else:
+                target = entity1
+                target_arg = arg1
+                ligature_arg = arg2
 
         # Don't let a ligature bind itself
         if target == ligature:
@@ -1534,19 +1607,18 @@ class Ligā(MuxCommand):
         target.db.ligāta = ligature.dbref
         ligature.db.ligāns = target.dbref
 
-        target_acc = target.db.formae['acc_sg'][0]
         ligature_abl = ligature.db.formae['abl_sg'][0]
         caller_nom = caller.db.formae['nom_sg'][0]
-        ligature_sexus = ligature.db.sexus
 
-        caller.msg(f"{target_acc} {ligature_abl} ligāvistī.")
-        target.msg(f"{caller_nom} tē {ligature_abl} ligāvit.")
-        caller.location.msg_contents(
-                f"{caller_nom} {target_acc} {ligature_abl} ligāvit", 
-                exclude=(caller,target)
+        broadcast(caller.location, caller, target,
+                to_actor="{target:acc_sg} {instrument:abl_sg} ligāvistī.",
+                to_target="{actor:nom_sg} tē {instrument:abl_sg} ligāvit.",
+                to_room="{actor:nom_sg} {target:acc_sg} {instrument:abl_sg} ligāvit",
+                instrument=ligature,
                 )
 
-        target.db.descriptive_name = f"{target.name} {ligature_abl} ligāt{us_a_um('nom_sg',target.db.sexus)} qu{'em' if ligature_sexus == 'māre' else 'am' if ligature_sexus == 'muliebre' else 'od'} tenet {caller_nom}" 
+        target.db.descriptive_name = f"{target.name} {ligature_abl} {agree('ligāt', target)} {relative(ligature, 'acc_sg')} tenet {caller_nom}" 
+        appearance.changed(target.location)
 
 class Solve(MuxCommand):
     """
@@ -1590,9 +1662,16 @@ class Solve(MuxCommand):
             caller.msg("Nihil hīc ligātum est!")
             return
 
-        # Idnetify ligature and target
-        entity1, arg1 = which_one(arg1, caller, bound_objects)
-        entity2, arg2 = which_one(arg2, caller, bound_objects)
+        # Idnetify ligature and target, by inflection if it is clear
+        # which is the accusative and which the ablative
+        by_case = assign_cases([arg1, arg2], ('acc_sg', 'abl_sg'), everything)
+
+        if by_case:
+            entity1, arg1 = which_one(by_case[0], caller, bound_objects)
+            entity2, arg2 = None, by_case[1].split('-')[-1].strip().lower()
+        else:
+            entity1, arg1 = which_one(arg1, caller, bound_objects)
+            entity2, arg2 = which_one(arg2, caller, bound_objects)
 
         if entity1:
             target = entity1
@@ -1618,19 +1697,71 @@ class Solve(MuxCommand):
         target.db.ligāta = False
         ligature.db.ligāns = False
 
-        target_acc = target.db.formae['acc_sg'][0]
-        ligature_abl = ligature.db.formae['abl_sg'][0]
-        caller_nom = caller.db.formae['nom_sg'][0]
-        ligature_sexus = ligature.db.sexus
-
-        caller.msg(f"{target_acc} {ligature_abl} solvistī.")
-        target.msg(f"{caller_nom} tē {ligature_abl} solvit.")
-        caller.location.msg_contents(
-                f"{caller_nom} {target_acc} {ligature_abl} solvit", 
-                exclude=(caller,target)
+        broadcast(caller.location, caller, target,
+                to_actor="{target:acc_sg} {instrument:abl_sg} solvistī.",
+                to_target="{actor:nom_sg} tē {instrument:abl_sg} solvit.",
+                to_room="{actor:nom_sg} {target:acc_sg} {instrument:abl_sg} solvit",
+                instrument=ligature,
                 )
 
         target.db.descriptive_name = False
+        appearance.changed(target.location)
+
+class AccendeExstingue(MuxCommand):
+    """
+    Light or put out a lamp, a torch or a hearth
+
+    Usage:
+        accende <rem>
+        exstingue <rem>
+
+    """
+
+    key = "accende"
+    aliases = ["exstingue"]
+    locks = "cmd:all()"
+    help_category = "Iussa Latīna"
+    auto_help = True
+
+    def func(self):
+        """ implements the command """
+
+        caller = self.caller
+        lighting = self.cmdstring != "exstingue"
+
+        if not self.args or len(self.arglist) != 1:
+            caller.msg("Quid accendere velis?" if lighting else "Quid exstinguere velis?")
+            return
+
+        target, self.args = which_one(self.args, caller, within(caller, caller.location))
+        if not target:
+            caller.msg(f"'{self.args}' nōn invēnistī!")
+            return
+
+        if check_case(caller, target, self.args, 'acc_sg') == False:
+            return
+
+        if not target.db.inflammābilis:
+            caller.msg(f"{target.db.formae['acc_sg'][0]} accendere nōn potes.")
+            return
+
+        # light.accende and light.exstingue keep the dark-room counts right
+        if lighting:
+            if not light.accende(target):
+                caller.msg(f"{target.db.formae['nom_sg'][0]} iam ardet.")
+                return
+            broadcast(caller.location, caller, target,
+                    to_actor="{target:acc_sg} accendistī.",
+                    to_room="{actor:nom_sg} {target:acc_sg} accendit.",
+                    )
+        else:
+            if not light.exstingue(target):
+                caller.msg(f"{target.db.formae['nom_sg'][0]} nōn ardet.")
+                return
+            broadcast(caller.location, caller, target,
+                    to_actor="{target:acc_sg} exstīnxistī.",
+                    to_room="{actor:nom_sg} {target:acc_sg} exstīnxit.",
+                    )
 
 class Quaerātur(MuxCommand):
     """
@@ -1698,6 +1829,38 @@ class Quaerātur(MuxCommand):
 
         caller.msg(message)
 
+class Pondera(MuxCommand):
+    """
+    Weigh again every container and what every character carries
+
+    Usage:
+        pondera
+
+    Works out the mass of each container from what is in it, and each
+    character's load from what they actually carry, and stores them,
+    reporting any that were wrong.
+    """
+
+    key = "pondera"
+    locks = "cmd:perm(Builder)"
+    help_category = "Iussa Administrātōrum"
+    auto_help = True
+
+    def func(self):
+        """
+        Recounts the masses and loads.
+        """
+
+        caller = self.caller
+
+        repaired = load.repair()
+        if not repaired:
+            caller.msg("Omnia pondera recta sunt.")
+            return
+
+        lines = [f"{character.key}: {old} -> {new}" for character, old, new in repaired]
+        caller.msg(f"Pondera {len(repaired)} corrēxistī:\n " + "\n ".join(lines))
+
 class IussaLatīnaCmdSet(default_cmds.CharacterCmdSet):
     """
     Command set for the Latin commands.
@@ -1721,6 +1884,7 @@ class IussaLatīnaCmdSet(default_cmds.CharacterCmdSet):
         self.add(Tenē())
         self.add(Ligā())
         self.add(Solve())
+        self.add(AccendeExstingue())
         self.add(AperīClaudeIānuam())
 
 class IussaAdministrātōrumCmdSet(default_cmds.CharacterCmdSet):
@@ -1740,3 +1904,4 @@ class IussaAdministrātōrumCmdSet(default_cmds.CharacterCmdSet):
         self.add(Nascātur())
         self.add(Aperiātur())
         self.add(Quaerātur())
+        self.add(Pondera())
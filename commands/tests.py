@@ -5,9 +5,18 @@ from evennia.utils import create
 
 from utils.sample_objs import sample_obj, sample_char, sample_room
 from utils.latin_language.adjective_agreement import us_a_um
+from unittest import TestCase
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from utils.hands import hold, release, free, full
+from utils.broadcast import broadcast, render
+from utils import status, writebehind
+from utils.templates import Template, join, template
+from utils.latin_language.list_to_string import list_to_string
 
 from typeclasses.persōnae import Persōna
-from typeclasses.rēs import Rēs, Ligātūra
+from typeclasses.rēs import Rēs, Ligātūra, Inflammābilis
 from typeclasses.locī import Locus
 from typeclasses.vestīmenta import Vestīmentum
 from typeclasses.exitūs import Exitus
@@ -160,7 +169,7 @@ class ContainerTestCase(CommandTest):
                 )
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'])
-        self.assertEqual(self.char1.db.manibus_plēnīs[0],self.char1.db.handedness)
+        self.assertEqual(full(self.char1)[0],self.char1.db.handedness)
         self.assertEqual(self.obj5.db.physical['massa'],5)
 
     def test_excipe_held_container(self):
@@ -168,9 +177,7 @@ class ContainerTestCase(CommandTest):
         self.char1.db.location = self.room1.dbref
         self.obj2.location = self.char1
         self.obj1.location = self.obj2
-        self.obj2.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
+        hold(self.char1, self.obj2, self.char1.db.handedness)
 
         self.obj2.db.physical['massa'] += self.obj1.db.physical['massa']
         self.char1.db.toll_fer['ferēns'] = self.obj2.db.physical['massa']
@@ -184,10 +191,28 @@ class ContainerTestCase(CommandTest):
                 )
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'] + self.obj2.db.physical['massa'])
-        self.assertEqual(len(self.char1.db.manibus_plēnīs),2)
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),0)
+        self.assertEqual(len(full(self.char1)),2)
+        self.assertEqual(len(free(self.char1)),0)
         self.assertEqual(self.obj1.location,self.char1)
         self.assertTrue(self.obj1.db.tenētur)
+        self.assertEqual(self.obj2.db.physical['massa'],2)
+
+    def test_pondera_container(self):
+        """ Put the mass of a container with something in it right """
+        self.char1.db.location = self.room1.dbref
+        self.obj5.location = self.room1.dbref
+        self.obj1.location = self.obj5
+        self.obj5.db.physical['massa'] += self.obj1.db.physical['massa']
+
+        # The first weighing finds nothing wrong and notes the empty mass
+        self.call(Pondera(), "")
+        self.assertEqual(self.obj5.db.physical['massa'],6)
+        self.assertEqual(self.obj5.db.physical['massa_vacua'],5)
+
+        # Drift is put right from then on
+        self.obj5.db.physical['massa'] = 9
+        self.call(Pondera(), "")
+        self.assertEqual(self.obj5.db.physical['massa'],6)
 
     def test_inspice_smtg_in_container_no_desc(self):
         """ Set up external container with object for char1 to get """
@@ -221,15 +246,11 @@ class ContainerTestCase(CommandTest):
         """ Set char1 up with an object to place in sack """
         self.char1.db.location = self.room1.dbref
         self.obj4.location = self.char1
-        self.obj4.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj4, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
 
         self.obj2.location = self.char1
-        self.obj2.tenētur = char1_off_hand
-        self.char1.db.manibus_plēnīs.append(char1_off_hand)
-        self.char1.db.manibus_vacuīs.remove(char1_off_hand)
+        hold(self.char1, self.obj2, char1_off_hand)
 
         # Establish encumberence
         self.char1.db.toll_fer['ferēns'] = self.obj4.db.physical['massa'] + self.obj2.db.physical['massa']
@@ -243,15 +264,11 @@ class ContainerTestCase(CommandTest):
         """ Set char1 up with an object to place in sack """
         self.char1.db.location = self.room1.dbref
         self.obj3.location = self.char1
-        self.obj3.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj3, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
 
         self.obj2.location = self.char1
-        self.obj2.tenētur = char1_off_hand
-        self.char1.db.manibus_plēnīs.append(char1_off_hand)
-        self.char1.db.manibus_vacuīs.remove(char1_off_hand)
+        hold(self.char1, self.obj2, char1_off_hand)
 
         # Establish encumberence
         self.char1.db.toll_fer['ferēns'] = self.obj3.db.physical['massa'] + self.obj2.db.physical['massa']
@@ -265,15 +282,11 @@ class ContainerTestCase(CommandTest):
         """ Set char1 up with an object to place in sack """
         self.char1.db.location = self.room1.dbref
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
 
         self.obj2.location = self.char1
-        self.obj2.tenētur = char1_off_hand
-        self.char1.db.manibus_plēnīs.append(char1_off_hand)
-        self.char1.db.manibus_vacuīs.remove(char1_off_hand)
+        hold(self.char1, self.obj2, char1_off_hand)
 
         # Establish encumberence
         self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa'] + self.obj2.db.physical['massa']
@@ -287,8 +300,8 @@ class ContainerTestCase(CommandTest):
         # Make sure target location has changed
         self.assertEqual(self.obj1.location,self.obj2)
         # Make sure hands are freed up
-        self.assertEqual(self.char1.db.manibus_vacuīs[0],self.char1.db.handedness)
-        self.assertEqual(self.char1.db.manibus_plēnīs[0],char1_off_hand)
+        self.assertEqual(free(self.char1)[0],self.char1.db.handedness)
+        self.assertEqual(full(self.char1)[0],char1_off_hand)
         # Make sure target is no longer held
         self.assertFalse(self.obj1.db.tenētur)
         self.assertEqual(self.obj2.db.physical['massa'],3)
@@ -298,10 +311,8 @@ class ContainerTestCase(CommandTest):
         """ Set char1 up with an object to place in sack """
         self.char1.db.location = self.room1.dbref
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
 
         self.obj5.location = self.room1.dbref
 
@@ -317,14 +328,44 @@ class ContainerTestCase(CommandTest):
         # Make sure target location has changed
         self.assertEqual(self.obj1.location,self.obj5)
         # Make sure hands are freed up
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),2)
-        self.assertEqual(len(self.char1.db.manibus_plēnīs),0)
+        self.assertEqual(len(free(self.char1)),2)
+        self.assertEqual(len(full(self.char1)),0)
         # Make sure target is no longer held
         self.assertFalse(self.obj1.db.tenētur)
         # Make sure mass of target no part of encumberance
         self.assertEqual(self.char1.db.toll_fer['ferēns'],0)
         self.assertEqual(self.obj5.db.physical['massa'],6)
 
+    def test_pōne_omnia(self):
+        """ Set char1 up with two objects, only one of which fits """
+        self.char1.db.location = self.room1.dbref
+        self.obj1.location = self.char1
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
+
+        self.obj3.location = self.char1
+        hold(self.char1, self.obj3, char1_off_hand)
+
+        self.obj5.location = self.room1.dbref
+
+        # Establish encumberence
+        self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa'] + self.obj3.db.physical['massa']
+
+        self.call(Pōne(),
+                f"omnia in {self.obj5.db.formae['acc_sg'][0]}",
+                f"Magnitūdō {self.obj3.db.formae['gen_sg'][0]} est māior quam spatium in {self.obj5.db.formae['abl_sg'][0]}." +
+                f"|{self.obj1.db.formae['acc_sg'][0]} in {self.obj5.db.formae['acc_sg'][0]} posuistī." +
+                f"|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+
+        # Only what fits has moved
+        self.assertEqual(self.obj1.location,self.obj5)
+        self.assertEqual(self.obj3.location,self.char1)
+        self.assertFalse(self.obj1.db.tenētur)
+        self.assertEqual(self.obj3.db.tenētur,char1_off_hand)
+        self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj3.db.physical['massa'])
+        self.assertEqual(self.obj5.db.physical['massa'],6)
+        self.assertEqual(self.obj5.db.capax['rem_vol'],24 - self.obj1.db.physical['litra'])
+
 class SpectāTestCase(CommandTest):
     """ Test case for 'spectā' (behold) """
 
@@ -483,6 +524,30 @@ class SpectāTestCase(CommandTest):
                 f"|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']}) "
                 )
 
+    def test_spectā_dark_room(self):
+        """ Only a lamp in the room or carried by the looker lights it, while it burns """
+        self.room1.db.āter = True
+        lamp = create.create_object(Inflammābilis, key="lucerna", location=self.char2, home=self.room1,
+                attributes=[
+                    ('formae', {'nom_sg': ['lucerna'], 'gen_sg': ['lucernae']}),
+                    ('sexus', 'muliebre'),
+                    ])
+
+        self.call(Spectā(), '', "Nihil per tenebrās vidēre potes.")
+
+        lamp.move_to(self.char1, quiet=True)
+        self.assertNotIn("tenebrās", self.call(Spectā(), ''))
+
+        lamp.move_to(self.room1, quiet=True)
+        self.assertNotIn("tenebrās", self.call(Spectā(), ''))
+
+        self.call(AccendeExstingue(), 'lucernam', "lucernam exstīnxistī.", cmdstring="exstingue")
+        self.call(Spectā(), '', "Nihil per tenebrās vidēre potes.")
+
+        self.call(AccendeExstingue(), 'lucernam', "lucernam accendistī.")
+        self.assertNotIn("tenebrās", self.call(Spectā(), ''))
+        self.call(AccendeExstingue(), 'lucernam', "lucerna iam ardet.")
+
     def test_spectā_targeting_object(self):
         self.char1.location = self.room1.dbref
         self.obj1.location = self.room1.dbref
@@ -516,7 +581,7 @@ class SpectāTestCase(CommandTest):
         self.char1.location = self.room1.dbref
         self.char2.location = self.room1.dbref
         self.obj1.location = self.char2
-        self.obj1.db.tenētur = self.char2.db.handedness
+        hold(self.char2, self.obj1, self.char2.db.handedness)
 
         # Grammatically masculine target
         self.call(Spectā(), self.char2.db.formae['acc_sg'][0], f"{self.char2.get_display_name(self.char1)}" + '\n' +
@@ -547,7 +612,7 @@ class SpectāTestCase(CommandTest):
         self.obj1.location = self.char2
         self.obj1.db.geritur = True
         self.obj2.location = self.char2
-        self.obj2.db.tenētur = self.char2.db.handedness
+        hold(self.char2, self.obj2, self.char2.db.handedness)
 
         # Try looking at someone wearing and holding something
         self.call(Spectā(), self.char2.db.formae['acc_sg'][0], f"{self.char2.get_display_name(self.char1)}" + '\n' +
@@ -731,16 +796,14 @@ class GettingDroppingGivingTestCase(CommandTest):
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'])
         self.assertEqual(self.obj1.db.tenētur,'sinistrā')
-        self.assertEqual(self.char1.db.manibus_plēnīs,['sinistrā'])
-        self.assertEqual(self.char1.db.manibus_vacuīs,['dextrā'])
+        self.assertEqual(full(self.char1),['sinistrā'])
+        self.assertEqual(free(self.char1),['dextrā'])
         self.assertEqual(self.obj1.location,self.char1)
 
     def test_tenē_internal(self):
         self.char1.db.location = self.room1.dbref
         self.obj1.db.location = self.char1
-        self.obj1.db.tenētur = 'dextrā'
-        self.char1.db.manibus_plēnīs.append('dextrā')
-        self.char1.db.manibus_vacuīs.remove('dextrā')
+        hold(self.char1, self.obj1, 'dextrā')
         self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa']
 
         self.call(Tenē(),
@@ -751,16 +814,14 @@ class GettingDroppingGivingTestCase(CommandTest):
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'])
         self.assertEqual(self.obj1.db.tenētur,'sinistrā')
-        self.assertEqual(self.char1.db.manibus_plēnīs,['sinistrā'])
-        self.assertEqual(self.char1.db.manibus_vacuīs,['dextrā'])
+        self.assertEqual(full(self.char1),['sinistrā'])
+        self.assertEqual(free(self.char1),['dextrā'])
         self.assertEqual(self.obj1.db.location,self.char1)
 
     def test_tenē_already_holding(self):
         self.char1.db.location = self.room1.dbref
         self.obj1.db.location = self.char1
-        self.obj1.db.tenētur = 'sinistrā'
-        self.char1.db.manibus_plēnīs.append('sinistrā')
-        self.char1.db.manibus_vacuīs.remove('sinistrā')
+        hold(self.char1, self.obj1, 'sinistrā')
         self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa']
 
         self.call(Tenē(),
@@ -771,16 +832,14 @@ class GettingDroppingGivingTestCase(CommandTest):
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'])
         self.assertEqual(self.obj1.db.tenētur,'sinistrā')
-        self.assertEqual(self.char1.db.manibus_plēnīs,['sinistrā'])
-        self.assertEqual(self.char1.db.manibus_vacuīs,['dextrā'])
+        self.assertEqual(full(self.char1),['sinistrā'])
+        self.assertEqual(free(self.char1),['dextrā'])
 
     def test_tenē_hand_full(self):
         self.char1.db.location = self.room1.dbref
         self.obj1.db.location = self.room1.dbref
         self.obj2.db.location = self.char1
-        self.obj2.db.tenētur = 'sinistrā'
-        self.char1.db.manibus_plēnīs.append('sinistrā')
-        self.char1.db.manibus_vacuīs.remove('sinistrā')
+        hold(self.char1, self.obj2, 'sinistrā')
         self.char1.db.toll_fer['ferēns'] = self.obj2.db.physical['massa']
 
         self.call(Tenē(),
@@ -791,17 +850,15 @@ class GettingDroppingGivingTestCase(CommandTest):
 
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj2.db.physical['massa'])
         self.assertFalse(self.obj1.db.tenētur)
-        self.assertEqual(self.char1.db.manibus_plēnīs,['sinistrā'])
-        self.assertEqual(self.char1.db.manibus_vacuīs,['dextrā'])
+        self.assertEqual(full(self.char1),['sinistrā'])
+        self.assertEqual(free(self.char1),['dextrā'])
 
     def test_relinque(self):
         """ Set char1 up with an object to drop """
         self.char1.db.location = self.room1.dbref
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
 
         # Establish encumberence
         self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa']
@@ -817,21 +874,15 @@ class GettingDroppingGivingTestCase(CommandTest):
         """ Set characters in same place, char1 w/ full hands, char2 w/ 1 obj """
         self.char1.db.location = self.room1.dbref
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        char1_off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
         self.obj2.location = self.char1
-        self.obj2.tenētur = char1_off_hand
-        self.char1.db.manibus_plēnīs.append(char1_off_hand)
-        self.char1.db.manibus_vacuīs.remove(char1_off_hand)
+        hold(self.char1, self.obj2, char1_off_hand)
 
         self.char2.db.location = self.room1.dbref
         self.obj3.location = self.char2
-        self.obj3.tenētur = self.char2.db.handedness
-        self.char2.db.manibus_plēnīs.append(self.char2.db.handedness)
-        self.char2.db.manibus_vacuīs.remove(self.char2.db.handedness)
-        char2_off_hand = self.char2.db.manibus_vacuīs[0]
+        hold(self.char2, self.obj3, self.char2.db.handedness)
+        char2_off_hand = free(self.char2)[0]
 
         # Establish base encumberance
         self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa'] + self.obj2.db.physical['massa']
@@ -849,14 +900,24 @@ class GettingDroppingGivingTestCase(CommandTest):
         self.assertEqual(self.char1.db.toll_fer['ferēns'], self.obj2.db.physical['massa'])
 
         # Check that hands have been freed up and occupied
-        self.assertIn(self.char2.db.handedness, self.char2.db.manibus_plēnīs)
-        self.assertEqual(len(self.char2.db.manibus_vacuīs), 0)
-        self.assertEqual(len(self.char1.db.manibus_vacuīs), 1)
-        self.assertEqual(len(self.char1.db.manibus_plēnīs), 1)
+        self.assertIn(self.char2.db.handedness, full(self.char2))
+        self.assertEqual(len(free(self.char2)), 0)
+        self.assertEqual(len(free(self.char1)), 1)
+        self.assertEqual(len(full(self.char1)), 1)
 
         # Make sure you can't give something to someone whose hands are full
         self.call(Da(), f"{self.obj2.db.formae['acc_sg'][0]} {self.char2.db.formae['dat_sg'][0]}", f"Manūs {self.char2.db.formae['gen_sg'][0]} sunt plēnae!|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
 
+    def test_da_dative_first(self):
+        """ The recipient can come first; the cases tell the roles apart """
+        self.char1.db.location = self.room1.dbref
+        self.obj1.location = self.char1
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        self.char2.db.location = self.room1.dbref
+
+        self.call(Da(), f"{self.char2.db.formae['dat_sg'][0]} {self.obj1.db.formae['acc_sg'][0]}", f"{self.obj1.db.formae['acc_sg'][0]} {self.char2.db.formae['dat_sg'][0]} dedistī.|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+        self.assertEqual(self.obj1.location, self.char2)
+
     def test_cape_relinque(self):
         hands = ['sinistrā', 'dextrā']
         hands.remove(self.char1.db.handedness)
@@ -878,7 +939,7 @@ class GettingDroppingGivingTestCase(CommandTest):
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'])
 
         # Ensure that dominant hand does the picking up
-        self.assertIn(self.char1.db.handedness,self.char1.db.manibus_plēnīs)
+        self.assertIn(self.char1.db.handedness,full(self.char1))
 
         # See if we get the success message for picking up a second object
         self.call(Cape(), self.obj2.db.formae['acc_sg'][0], f"{self.obj2.db.formae['acc_sg'][0]} cēpistī.|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
@@ -887,10 +948,10 @@ class GettingDroppingGivingTestCase(CommandTest):
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'] + self.obj2.db.physical['massa'])
 
         # Make sure full hands = 2
-        self.assertIn(off_hand,self.char1.db.manibus_plēnīs)
+        self.assertIn(off_hand,full(self.char1))
 
         # Make sure empty hands = 0
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),0)
+        self.assertEqual(len(free(self.char1)),0)
 
         # Make sure something can't be picked up with both hands full
         self.call(Cape(), self.obj3.db.formae['acc_sg'][0], "Manūs tuae sunt plēnae!")
@@ -902,10 +963,50 @@ class GettingDroppingGivingTestCase(CommandTest):
         self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj2.db.physical['massa'])
 
         # Make sure that the hand holding the object has been freed up
-        self.assertIn(self.char1.db.handedness,self.char1.db.manibus_vacuīs)
-        self.assertEqual(len(self.char1.db.manibus_plēnīs),1)
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),1)
-        self.assertIn(off_hand,self.char1.db.manibus_plēnīs)
+        self.assertIn(self.char1.db.handedness,free(self.char1))
+        self.assertEqual(len(full(self.char1)),1)
+        self.assertEqual(len(free(self.char1)),1)
+        self.assertIn(off_hand,full(self.char1))
+
+    def test_cape_relinque_omnia(self):
+        # Take as much as two hands hold, and say why the rest was left
+        self.call(Cape(), "omnia", f"{self.obj1.db.formae['acc_sg'][0]} et {self.obj2.db.formae['acc_sg'][0]} cēpistī.|Manūs tuae sunt plēnae!|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+
+        self.assertEqual(self.obj1.location, self.char1)
+        self.assertEqual(self.obj2.location, self.char1)
+        self.assertEqual(self.obj3.location, self.room1)
+        self.assertEqual(len(free(self.char1)),0)
+        self.assertEqual(self.char1.db.toll_fer['ferēns'],self.obj1.db.physical['massa'] + self.obj2.db.physical['massa'])
+
+        # Drop everything at once
+        self.call(Relinque(), "omnia", f"{self.obj1.db.formae['acc_sg'][0]} et {self.obj2.db.formae['acc_sg'][0]} relīquistī.|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+
+        self.assertEqual(self.obj1.location, self.room1)
+        self.assertEqual(self.obj2.location, self.room1)
+        self.assertEqual(len(full(self.char1)),0)
+        self.assertEqual(self.char1.db.toll_fer['ferēns'], 0)
+
+        # Ask for more than there are
+        self.call(Cape(), f"2 {self.obj1.db.formae['acc_pl'][0]}", f"Nōn sunt 2, sed 1!|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+
+    def test_da_omnia(self):
+        self.char1.db.location = self.room1.dbref
+        self.obj1.location = self.char1
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        char1_off_hand = free(self.char1)[0]
+        self.obj3.location = self.char1
+        hold(self.char1, self.obj3, char1_off_hand)
+        self.char2.db.location = self.room1.dbref
+
+        self.char1.db.toll_fer['ferēns'] = self.obj1.db.physical['massa'] + self.obj3.db.physical['massa']
+
+        self.call(Da(), f"omnia {self.char2.db.formae['dat_sg'][0]}", f"{self.obj1.db.formae['acc_sg'][0]} et {self.obj3.db.formae['acc_sg'][0]} {self.char2.db.formae['dat_sg'][0]} dedistī.|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})")
+
+        self.assertEqual(self.obj1.location, self.char2)
+        self.assertEqual(self.obj3.location, self.char2)
+        self.assertEqual(len(free(self.char1)),2)
+        self.assertEqual(len(full(self.char2)),2)
+        self.assertEqual(self.char2.db.toll_fer['ferēns'],self.obj1.db.physical['massa'] + self.obj3.db.physical['massa'])
 
 class IndueExueTestCase(CommandTest):
     """ Test case for 'indue' (wear) and 'exue' (take off) """
@@ -978,16 +1079,12 @@ class IndueExueTestCase(CommandTest):
         """ Put on an article of clothing that is held and take off one worn """
         # set up objects
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = self.char1.db.handedness
-        self.char1.db.manibus_plēnīs = [self.char1.db.handedness]
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        off_hand = self.char1.db.manibus_vacuīs[0]
+        hold(self.char1, self.obj1, self.char1.db.handedness)
+        off_hand = free(self.char1)[0]
     
 
         self.obj2.location = self.char1
-        self.obj2.db.tenētur = off_hand
-        self.char1.db.manibus_plēnīs.append(off_hand)
-        self.char1.db.manibus_vacuīs = []
+        hold(self.char1, self.obj2, off_hand)
 
         self.obj3.location = self.char1
         self.obj3.db.geritur = True
@@ -1002,8 +1099,8 @@ class IndueExueTestCase(CommandTest):
         # make sure that held item is out of hands
         self.assertFalse(self.obj1.db.tenētur)
         self.assertTrue(self.obj1.db.geritur)
-        self.assertIn(self.char1.db.handedness,self.char1.db.manibus_vacuīs)
-        self.assertEqual(len(self.char1.db.manibus_plēnīs),1)
+        self.assertIn(self.char1.db.handedness,free(self.char1))
+        self.assertEqual(len(full(self.char1)),1)
         self.assertEqual(self.char1.db.toll_fer['ferēns'],mass_carried)
 
         """ Take off an article of clothing """
@@ -1012,38 +1109,33 @@ class IndueExueTestCase(CommandTest):
         # make sure that after taking something off it's in hands
         self.assertEqual(self.obj1.db.tenētur,self.char1.db.handedness)
         self.assertFalse(self.obj1.db.geritur)
-        self.assertIn(self.char1.db.handedness,self.char1.db.manibus_plēnīs)
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),0)
+        self.assertIn(self.char1.db.handedness,full(self.char1))
+        self.assertEqual(len(free(self.char1)),0)
         self.assertEqual(self.char1.db.toll_fer['ferēns'],mass_carried)
 
         # Make sure that with full hands you can't take something off
         self.call(Exue(), self.obj3.db.formae['acc_sg'][0],f'Manūs tuae sunt plēnae!|Vīta: {self.char1.db.pv["nunc"]}/{self.char1.db.pv["max"]})') 
         self.assertTrue(self.obj3.db.geritur)
-        self.assertEqual(len(self.char1.db.manibus_plēnīs),2)
-        self.assertEqual(len(self.char1.db.manibus_vacuīs),0)
+        self.assertEqual(len(full(self.char1)),2)
+        self.assertEqual(len(free(self.char1)),0)
         self.assertEqual(self.char1.db.toll_fer['ferēns'],mass_carried)
 
     def test_relinque_exue(self):
         """ Drop something that is worn """
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = 'dextrā'
+        hold(self.char1, self.obj1, 'dextrā')
         self.obj2.location = self.char1
-        self.obj2.db.tenētur = 'sinistrā'
+        hold(self.char1, self.obj2, 'sinistrā')
         self.obj3.location = self.char1
         self.obj3.db.geritur = True
 
-        self.char1.db.manibus_plēnīs = ['sinistrā','dextrā']
-        self.char1.db.manibus_vacuīs = []
-
 
         # Can't take off & drop if hands are full
         self.call(Relinque(), self.obj3.db.formae['acc_sg'][0],
                 f'Manūs tuae sunt plēnae!|Vīta: {self.char1.db.pv["nunc"]}/{self.char1.db.pv["max"]})') 
 
         # Free up one hand
-        self.char1.db.manibus_vacuīs.append(self.obj1.db.tenētur)
-        self.char1.db.manibus_plēnīs.remove(self.obj1.db.tenētur)
-        self.obj1.db.tenētur = False
+        release(self.char1, self.obj1)
         self.obj1.location = self.room1
 
         # Drop something worn
@@ -1053,24 +1145,19 @@ class IndueExueTestCase(CommandTest):
     def test_da_exue(self):
         """ Give something that is worn """
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = 'dextrā'
+        hold(self.char1, self.obj1, 'dextrā')
         self.obj2.location = self.char1
-        self.obj2.db.tenētur = 'sinistrā'
+        hold(self.char1, self.obj2, 'sinistrā')
         self.obj3.location = self.char1
         self.obj3.db.geritur = True
 
-        self.char1.db.manibus_plēnīs = ['sinistrā','dextrā']
-        self.char1.db.manibus_vacuīs = []
-
 
         # Can't take off & give if hands are full
         self.call(Da(), f"{self.obj3.db.formae['acc_sg'][0]} {self.char2.db.formae['dat_sg'][0]}",
                 f'Manūs tuae sunt plēnae!|Vīta: {self.char1.db.pv["nunc"]}/{self.char1.db.pv["max"]})') 
 
         # Free up one hand
-        self.char1.db.manibus_vacuīs.append(self.obj1.db.tenētur)
-        self.char1.db.manibus_plēnīs.remove(self.obj1.db.tenētur)
-        self.obj1.db.tenētur = False
+        release(self.char1, self.obj1)
         self.obj1.location = self.room1
 
         # Drop something worn
@@ -1171,10 +1258,7 @@ class LigāTestCase(CommandTest):
         self.char1.db.location = self.room1.dbref
         self.char2.db.location = self.room1.dbref
         self.obj1.location = self.char1
-        self.obj1.db.tenētur = True
-
-        self.char1.db.manibus_vacuīs.remove(self.char1.db.handedness)
-        self.char1.db.manibus_plēnīs.append(self.char1.db.handedness)
+        hold(self.char1, self.obj1, self.char1.db.handedness)
         
 
         # Try to use the lorum without holding it
@@ -1190,3 +1274,207 @@ class LigāTestCase(CommandTest):
                 f"|Vīta: {self.char1.db.pv['nunc']}/{self.char1.db.pv['max']})"
                 )
 
+def listener(key, formae=None):
+    """ Something that can be named in a message and sent one. """
+    obj = Mock(key=key)
+    obj.db.formae = formae
+    return obj
+
+class BroadcastTestCase(TestCase):
+    """ Reporting an event to the actor, the target and onlookers """
+
+    def setUp(self):
+        self.actor = listener("Gaius", {'nom_sg': ['Gaius'], 'acc_sg': ['Gaium']})
+        self.target = listener("Marcus", {'nom_sg': ['Marcus'], 'acc_sg': ['Marcum']})
+        self.onlooker = listener("Titus")
+        self.gladius = listener("gladius", {'abl_sg': ['gladiō']})
+        self.room = Mock(contents=[self.actor, self.target, self.onlooker])
+
+    def test_three_ways(self):
+        broadcast(self.room, self.actor, self.target,
+                to_actor="{target:acc_sg} {instrument:abl_sg} ligāvistī.",
+                to_target="{actor:nom_sg} tē {instrument:abl_sg} ligāvit.",
+                to_room="{actor:nom_sg} {target:acc_sg} {instrument:abl_sg} ligāvit.",
+                instrument=self.gladius,
+                )
+
+        self.actor.msg.assert_called_once_with("Marcum gladiō ligāvistī.", from_obj=self.actor)
+        self.target.msg.assert_called_once_with("Gaius tē gladiō ligāvit.", from_obj=self.actor)
+        self.onlooker.msg.assert_called_once_with(
+                text=("Gaius Marcum gladiō ligāvit.", {}), from_obj=self.actor)
+
+    def test_target_without_own_message_sees_room(self):
+        broadcast(self.room, self.actor, self.target,
+                to_actor="{target:acc_sg} vīdistī.",
+                to_room="{actor} {target:acc_sg} vīdit.",
+                )
+
+        self.target.msg.assert_called_once_with(text=("Gaius Marcum vīdit.", {}), from_obj=self.actor)
+        self.onlooker.msg.assert_called_once_with(text=("Gaius Marcum vīdit.", {}), from_obj=self.actor)
+        self.actor.msg.assert_called_once_with("Marcum vīdistī.", from_obj=self.actor)
+
+    def test_exclude(self):
+        broadcast(self.room, self.actor, to_room="{actor} abit.", exclude=self.onlooker)
+
+        self.onlooker.msg.assert_not_called()
+        self.actor.msg.assert_not_called()
+        self.target.msg.assert_called_once_with(text=("Gaius abit.", {}), from_obj=self.actor)
+
+    def test_slots(self):
+        # a missing case, or an object without forms, gives the key
+        self.assertEqual(render("{thing:dat_sg}", thing=self.gladius), "gladius")
+        self.assertEqual(render("{thing:acc_sg}", thing=self.onlooker), "Titus")
+        self.assertEqual(render("{thing} {verb}", thing="gladium", verb="cēpit"), "gladium cēpit")
+
+class TemplateTestCase(TestCase):
+    """ Message templates and the helpers that put messages together """
+
+    def test_slots(self):
+        self.assertEqual(Template("{a} {b.x} {c[0]} {d:acc_sg}").slots, {'a', 'b', 'c', 'd'})
+        self.assertEqual(Template("nihil").slots, frozenset())
+
+    def test_fill(self):
+        exits = Template("Ad hōs locōs īre licet: {exits}")
+
+        self.assertEqual(exits(exits="in cubiculum"), "Ad hōs locōs īre licet: in cubiculum")
+        self.assertEqual(exits.render({'exits': "forās"}), "Ad hōs locōs īre licet: forās")
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            Template("{exits")
+
+    def test_compiled_once(self):
+        self.assertIs(template("{actor} abit."), template("{actor} abit."))
+
+    def test_join(self):
+        self.assertEqual(join("Ātrium\n", "", None, "Ecce: gladius"), "Ātrium\nEcce: gladius")
+        self.assertEqual(join(), "")
+
+    def test_list_to_string(self):
+        self.assertEqual(list_to_string([]), "")
+        self.assertEqual(list_to_string(["gladius"]), "gladius")
+        self.assertEqual(list_to_string(["gladius", "scūtum"]), "gladius et scūtum")
+        self.assertEqual(list_to_string([1, 2, 3]), "1, 2 et 3")
+        self.assertEqual(list_to_string([1, 2, 3], endsep="aut"), "1, 2 aut 3")
+        self.assertEqual(list_to_string([1, 2, 3], endsep=""), "1, 2, 3")
+        self.assertEqual(list_to_string([1, 2], addquote=True), '"1" et "2"')
+
+class StatusTestCase(TestCase):
+    """ Pushing only the status values that changed """
+
+    def setUp(self):
+        self.session = Mock()
+        self.character = Mock(ndb=SimpleNamespace(status=None))
+        self.character.sessions.all.return_value = [self.session]
+        self.now = {
+                'pv': {'nunc': 10, 'max': 12},
+                'toll_fer': {'ferēns': 2.5, 'max': 40},
+                'manūs': 2,
+                'combat_actionsleft': None,
+                }
+        patcher = patch.object(status, 'current', lambda character: dict(self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sent(self):
+        return [call.kwargs['status'][1] for call in self.session.data_out.call_args_list]
+
+    def test_first_push_sends_everything(self):
+        self.assertEqual(status.push(self.character), self.now)
+        self.assertEqual(self.sent(), [self.now])
+
+    def test_only_changes_sent(self):
+        status.push(self.character)
+        self.now['pv'] = {'nunc': 7, 'max': 12}
+        self.now['manūs'] = 1
+
+        self.assertEqual(status.push(self.character), {'pv': {'nunc': 7, 'max': 12}, 'manūs': 1})
+        self.assertEqual(self.sent()[-1], {'pv': {'nunc': 7, 'max': 12}, 'manūs': 1})
+
+    def test_nothing_changed(self):
+        status.push(self.character)
+
+        self.assertEqual(status.push(self.character), {})
+        self.assertEqual(len(self.sent()), 1)
+
+    def test_forget(self):
+        status.push(self.character)
+        status.forget(self.character)
+
+        self.assertEqual(status.push(self.character), self.now)
+
+    def test_no_sessions(self):
+        self.character.sessions.all.return_value = []
+
+        self.assertEqual(status.push(self.character), {})
+        self.assertIsNone(self.character.ndb.status)
+
+class WriteBehindTestCase(LocalEvenniaTest):
+    """ Changes to keys of dict Attributes, saved together at the flush """
+
+    def setUp(self):
+        super().setUp()
+        writebehind._pending.clear()
+        self.obj1.db.physical = {'massa': 1.0, 'litra': 2.0}
+
+    def tearDown(self):
+        writebehind._pending.clear()
+        super().tearDown()
+
+    def test_put(self):
+        writebehind.put(self.obj1, 'physical', 'massa', 3.0)
+
+        self.assertEqual(writebehind.value(self.obj1, 'physical', 'massa'), 3.0)
+        self.assertEqual(self.obj1.db.physical['massa'], 1.0)
+
+        writebehind.flush()
+
+        self.assertEqual(self.obj1.db.physical, {'massa': 3.0, 'litra': 2.0})
+        self.assertFalse(writebehind._pending)
+
+    def test_add(self):
+        writebehind.add(self.obj1, 'physical', 'massa', 0.5)
+        writebehind.add(self.obj1, 'physical', 'massa', 0.25)
+        writebehind.add(self.obj1, 'physical', 'pondus', 4)
+
+        self.assertEqual(writebehind.value(self.obj1, 'physical', 'massa'), 1.75)
+        self.assertEqual(writebehind.value(self.obj1, 'physical', 'pondus'), 4)
+
+    def test_value_default(self):
+        self.assertEqual(writebehind.value(self.obj1, 'physical', 'pondus', 0), 0)
+        self.assertIsNone(writebehind.value(self.obj1, 'capax', 'rem_vol'))
+
+    def test_flush_saves_each_attribute_once(self):
+        writebehind.add(self.obj1, 'physical', 'massa', 1.0)
+        writebehind.put(self.obj1, 'physical', 'litra', 5.0)
+
+        with patch.object(self.obj1.attributes, 'add', wraps=self.obj1.attributes.add) as add:
+            writebehind.flush()
+
+        add.assert_called_once_with('physical', {'massa': 2.0, 'litra': 5.0})
+
+    def test_flush_skips_unchanged(self):
+        writebehind.put(self.obj1, 'physical', 'massa', 1.0)
+
+        with patch.object(self.obj1.attributes, 'add') as add:
+            writebehind.flush()
+
+        add.assert_not_called()
+
+    def test_flush_skips_deleted(self):
+        writebehind.put(self.obj2, 'physical', 'massa', 1.0)
+        self.obj2.delete()
+
+        writebehind.flush()
+
+        self.assertFalse(writebehind._pending)
+
+    def test_before_flush(self):
+        checkpoint = Mock()
+        self.addCleanup(writebehind._checkpoints.remove, checkpoint)
+
+        self.assertIs(writebehind.before_flush(checkpoint), checkpoint)
+        writebehind.before_flush(checkpoint)
+        writebehind.flush()
+
+        checkpoint.assert_called_once_with()
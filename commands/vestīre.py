@@ -7,12 +7,17 @@
 # COMMANDS START HERE
 
 from commands.iussa import MuxCommand
+from django.db import transaction
+
 from evennia import default_cmds
 from evennia.utils import evtable
 from utils.latin_language.which_one import which_one
-from utils.latin_language.check_grammar import check_case
+from utils.latin_language.form_index import within
+from utils import appearance, bulk, equipment, hands, load, writebehind
+from utils.broadcast import broadcast
+from utils.latin_language.check_grammar import check_case, assign_cases
 from utils.latin_language.free_hands import take_out_of_hand, put_into_hand
-from utils.latin_language.adjective_agreement import us_a_um
+from utils.latin_language.adjective_agreement import agree, relative
 from typeclasses.vestīmenta import CLOTHING_TYPE_LIMIT, CLOTHING_OVERALL_LIMIT, get_worn_clothes, single_type_count
 
 from evennia.utils.search import search_object
@@ -49,8 +54,7 @@ class Indue(MuxCommand):
         # JI (12/7/19) Commenting out following line, adding my which_one function
         # and copying the commented out line with self.arglist[0] replaced by target
         # clothing = self.caller.search(self.arglist[0], candidates=self.caller.contents)
-        stuff = self.caller.contents
-        target, self.args = which_one(self.args,self.caller,stuff)
+        target, self.args = which_one(self.args,self.caller,within(self.caller))
         # JI (12/7/19) Going to see about bypassing the following in preference of the above
         # clothing = self.caller.search(target, candidates=self.caller.contents)
         clothing = target
@@ -132,8 +136,7 @@ class Exue(MuxCommand):
         # to deal with Latin issues. Commenting out original and adapting by
         # changing self.args to target.
         # clothing = self.caller.search(self.args, candidates=self.caller.contents)
-        stuff = self.caller.contents
-        target, self.args = which_one(self.args,self.caller,stuff)
+        target, self.args = which_one(self.args,self.caller,within(self.caller))
         # JI (12/7/9) commenting out the below in preference of the above
         # clothing = self.caller.search(target, candidates=self.caller.contents)
         clothing = target
@@ -224,6 +227,7 @@ class CmdCover(MuxCommand):
             "%s covers %s with %s." % (self.caller, to_cover.name, cover_with.name)
         )
         to_cover.db.covered_by = cover_with
+        equipment.changed(self.caller)
 
 
 class CmdUncover(MuxCommand):
@@ -268,6 +272,7 @@ class CmdUncover(MuxCommand):
             return
         self.caller.location.msg_contents("%s uncovers %s." % (self.caller, to_uncover.name))
         to_uncover.db.covered_by = None
+        equipment.changed(self.caller)
 
 class Habeō(MuxCommand):
     """
@@ -325,9 +330,12 @@ class Da(MuxCommand):
     Usage:
         da <rem> <alicuī>
         da <alicuī> <rem>
+        da omnia [<rēs>] <alicuī>
+        da <numerus> <rēs> <alicuī>
 
     gives an item from your inventory to another character,
-    placing it in their inventory
+    placing it in their inventory; or as many as they have hands for
+    and can carry. Worn clothes are not given with 'omnia'.
     """
 
     key = "da"
@@ -352,7 +360,20 @@ class Da(MuxCommand):
         if hasattr(caller, 'db'):
             if caller.db.latin:
                 latin_caller = True
-                caller_carry = caller.db.toll_fer['ferēns']
+                caller_carry = load.carried(caller)
+
+        # Give many things at once; the recipient is the word after or
+        # before them
+        many = None
+        if len(self.arglist) in (2, 3):
+            many = bulk.parse(" ".join(self.arglist[:-1]))
+            recipient_arg = self.arglist[-1]
+            if not many:
+                many = bulk.parse(" ".join(self.arglist[1:]))
+                recipient_arg = self.arglist[0]
+        if many:
+            self.give_many(caller, recipient_arg, *many)
+            return
 
         # Ensure proper number of items in command
         if len(self.arglist) != 2:
@@ -373,11 +394,16 @@ class Da(MuxCommand):
 
         everything = possessions + things_in_room
 
-        entity_1, arg1 = which_one(self.arglist[0], caller, everything)
+        # Tell the gift (accusative) from the recipient (dative) by their
+        # inflection where possible
+        by_case = assign_cases(self.arglist, ('acc_sg', 'dat_sg'), everything)
+        args = by_case if by_case else self.arglist
+
+        entity_1, arg1 = which_one(args[0], caller, everything)
         if not entity_1:
             caller.msg(f"'{arg1}' nōn invēnistī!")
             return
-        entity_2, arg2 = which_one(self.arglist[1], caller, everything)
+        entity_2, arg2 = which_one(args[1], caller, everything)
         if not entity_2:
             caller.msg(f"'{arg2}' nōn invēnistī!")
             return
@@ -392,7 +418,7 @@ class Da(MuxCommand):
             caller.msg("Cui dare voluistī?")
             return
 
-        if entity_1 in possessions:
+        if by_case or entity_1 in possessions:
             target = entity_1
             target_arg = arg1
             recipient = entity_2
@@ -403,6 +429,14 @@ class Da(MuxCommand):
             recipient = entity_1
             recipient_arg = arg1
 
+        if target not in possessions:
+            caller.msg("Quid dare voluistī?")
+            return
+
+        if recipient not in potential_recipients:
+            caller.msg("Cui dare voluistī?")
+            return
+
         # Check whether target is Latin Object
         if hasattr(target, 'db'):
             if target.db.latin:
@@ -413,13 +447,13 @@ class Da(MuxCommand):
                     return
 
                 # Establish target object's status
-                target_mass = target.db.physical['massa']
+                target_mass = load.mass(target)
                 target_acc_sg = target.db.formae['acc_sg'][0]
 
         # Ensure caller is either holding the target or has a free hand
         if latin_caller and latin_target:
             if not target.db.tenētur:
-                if len(caller.db.manibus_plēnīs) >= 2:
+                if not hands.free(caller):
                     caller.msg("Manūs tuae sunt plēnae!")
                     return
 
@@ -432,26 +466,26 @@ class Da(MuxCommand):
         if hasattr(recipient, 'db'):
             if recipient.db.latin:
                 latin_recipient = True
-                recipient_carry = recipient.db.toll_fer['ferēns']
+                recipient_carry = load.carried(recipient)
 
                 # Ensure caller referred to recipient in the dative case
                 if check_case(caller, recipient, recipient_arg, 'dat_sg') == False:
                     return
 
                 # Establish recipient's status and encumberance
-                recipient_carry = recipient.db.toll_fer['ferēns']
+                recipient_carry = load.carried(recipient)
                 recipient_max = recipient.db.toll_fer['max']
                 recipient_dat_sg = recipient.db.formae['dat_sg'][0]
 
                 # If recipient's too weak, or if hands are full:
-                if len(recipient.db.manibus_plēnīs) >= 2:
+                if not hands.free(recipient):
                     caller.msg(f"Manūs {recipient.db.formae['gen_sg'][0]} sunt plēnae!")
-                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare conāt{us_a_um('nom_sg',caller.db.sexus)}, sed manūs tuae plēnae sunt.")
+                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare {agree('conāt', caller)}, sed manūs tuae plēnae sunt.")
                     return
 
                 if recipient_carry + target_mass > recipient_max:
                     caller.msg(f"{recipient.key} tantum ponderis ferre nōn potest!")
-                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare conāt{us_a_um('nom_sg',caller.db.sexus)}, sed tū tantum ponderis ferre nōn potes!")
+                    recipient.msg(f"{caller.key} tibi {target_acc_sg} dare {agree('conāt', caller)}, sed tū tantum ponderis ferre nōn potes!")
                     return
 
         # calling at_before_give hook method
@@ -471,10 +505,8 @@ class Da(MuxCommand):
         # Adjust encumberance and occupied hands for latin participants
         if latin_target and latin_caller:
             take_out_of_hand(caller, target)
-            caller.db.toll_fer['ferēns'] -= target_mass
         if latin_target and latin_recipient:
             put_into_hand(recipient, target)
-            recipient.db.toll_fer['ferēns'] += target_mass
 
         target.move_to(recipient, quiet=True)
         recipient.msg(f"{caller.key} tibi {target_acc_sg} dedit.")
@@ -489,23 +521,93 @@ class Da(MuxCommand):
             bound_character = None
             possessions = caller.contents
             everything = caller.location.contents + possessions
-            ligature_sex = target.db.sexus
             for e in everything:
                 if e.dbref == target.db.ligāns:
                     bound_character = e
-            bound_character.db.descriptive_name = f"{bound_character.name} {target.db.formae['abl_sg'][0]} ligāt{us_a_um('nom_sg',bound_character.db.sexus)} qu{'em' if ligature_sex == 'māre' else 'am' if ligature_sex == 'muliebre' else 'od'} {recipient.name} tenet."
+            bound_character.db.descriptive_name = f"{bound_character.name} {target.db.formae['abl_sg'][0]} {agree('ligāt', bound_character)} {relative(target, 'acc_sg')} {recipient.name} tenet."
+            appearance.changed(bound_character.location)
 
         target.at_give(caller, recipient)
 
+    def give_many(self, caller, recipient_arg, count, form):
+        """
+        Give the things meant by count and form to the character named by
+        recipient_arg, as many as they have hands for and can carry.
+        """
+
+        potential_recipients = within(caller.location, accept=lambda r: r.typename == 'Persōna' and r != caller)
+        recipient, recipient_arg = which_one(recipient_arg, caller, potential_recipients)
+        if not recipient:
+            caller.msg(f"'{recipient_arg}' nōn invēnistī!")
+            return
+        if recipient.db.latin:
+            if check_case(caller, recipient, recipient_arg, 'dat_sg') == False:
+                return
+
+        things = bulk.select(caller, count, form, caller.contents)
+        if things is None:
+            return
+
+        # Clothes are taken off and ligatures handed over one at a time
+        things = [thing for thing in things
+                if not thing.db.geritur and not thing.db.ligāns and thing.at_before_give(caller, recipient)]
+        if not things:
+            caller.msg("Nihil habēs quod dare possīs.")
+            return
+
+        # Work out what the recipient can take before anything moves
+        given, refusal = things, None
+        if recipient.db.latin:
+            free = len(hands.free(recipient))
+            carry = load.carried(recipient)
+            carry_max = recipient.db.toll_fer['max']
+            given = []
+            for thing in things:
+                if len(given) >= free:
+                    refusal = f"Manūs {recipient.db.formae['gen_sg'][0]} sunt plēnae!"
+                    break
+                mass = load.mass(thing)
+                if carry + mass > carry_max:
+                    refusal = f"{recipient.key} tantum ponderis ferre nōn potest!"
+                    continue
+                carry += mass
+                given.append(thing)
+
+        if not given:
+            if refusal:
+                caller.msg(refusal)
+            return
+
+        with transaction.atomic():
+            for thing in given:
+                if thing.db.tenētur:
+                    take_out_of_hand(caller, thing)
+                if recipient.db.latin:
+                    put_into_hand(recipient, thing)
+                thing.move_to(recipient, quiet=True)
+                thing.at_give(caller, recipient)
+            writebehind.flush()
+
+        broadcast(caller.location, caller, recipient,
+                to_actor="{things} {target:dat_sg} dedistī.",
+                to_target="{actor} tibi {things} dedit.",
+                to_room="{actor} {things} {target:dat_sg} dedit.",
+                things=bulk.describe(given),
+                )
+        if refusal:
+            caller.msg(refusal)
+
 class Relinque(MuxCommand):
     """
     Get rid of something
     
     Usage:
         relinque <rem>
+        relinque omnia [<rēs>]
+        relinque <numerus> <rēs>
 
     Lets you move an object from your inventory into the location
-    that you currently occupy.
+    that you currently occupy. 'omnia' leaves what you wear on.
     """
 
     key = "relinque"
@@ -525,15 +627,20 @@ class Relinque(MuxCommand):
         if hasattr(caller, 'db'):
             if caller.db.latin:
                 latin_caller = True
-                current_carry = caller.db.toll_fer['ferēns']
+                current_carry = load.carried(caller)
         
+        # Drop many things at once
+        many = bulk.parse(self.args)
+        if many:
+            self.drop_many(caller, *many)
+            return
+
         if not self.arglist or len(self.arglist) != 1:
             caller.msg("Quid relinquere velis?")
             return
 
         # Ensure the intended object is targeted
-        stuff = caller.contents
-        target, self.args = which_one(self.args, caller, stuff)
+        target, self.args = which_one(self.args, caller, within(caller))
         if not target:
             caller.msg(f"'{self.args}' nōn invēnistī!")
             return
@@ -558,7 +665,7 @@ class Relinque(MuxCommand):
         # Ensure caller is either holding the target or has a free hand
         if latin_caller and latin_target:
             if not target.db.tenētur:
-                if len(caller.db.manibus_plēnīs) >= 2:
+                if not hands.free(caller):
                     caller.msg("Manūs tuae sunt plēnae!")
                     return
 
@@ -569,14 +676,14 @@ class Relinque(MuxCommand):
                 # New helper function to manage occupied hands
                 take_out_of_hand(caller,target)
 
-            # Lighten the callers toll_fer['ferēns']
-            target_mass = target.db.physical['massa']
-            caller.db.toll_fer['ferēns'] -= target_mass
 
         # Move object to caller's location
         target.move_to(caller.location, quiet=True)
-        caller.msg(f"{target_direct_object_name} relīquistī.")
-        caller.location.msg_contents(f"{caller.name} {target_direct_object_name} relīquit.", exclude=caller)
+        broadcast(caller.location, caller,
+                to_actor="{thing} relīquistī.",
+                to_room="{actor} {thing} relīquit.",
+                thing=target_direct_object_name,
+                )
 
 
         # Account for objects that are binding other objects
@@ -587,11 +694,42 @@ class Relinque(MuxCommand):
             for e in everything:
                 if e.dbref == target.db.ligāns:
                     bound_character = e
-            bound_character.db.descriptive_name = f"{bound_character.name} {target.db.formae['abl_sg'][0]} ligāt{us_a_um('nom_sg',bound_character.db.sexus)}"
+            bound_character.db.descriptive_name = f"{bound_character.name} {target.db.formae['abl_sg'][0]} {agree('ligāt', bound_character)}"
+            appearance.changed(bound_character.location)
 
         # call the object script's at_drop() method.
         target.at_drop(caller)
 
+    def drop_many(self, caller, count, form):
+        """
+        Drop the things meant by count and form, other than clothes worn.
+        """
+
+        things = bulk.select(caller, count, form, caller.contents)
+        if things is None:
+            return
+
+        # Ligatures binding someone are dropped one at a time
+        things = [thing for thing in things
+                if not thing.db.geritur and not thing.db.ligāns and thing.at_before_drop(caller)]
+        if not things:
+            caller.msg("Nihil habēs quod relinquere possīs.")
+            return
+
+        with transaction.atomic():
+            for thing in things:
+                if thing.db.tenētur:
+                    take_out_of_hand(caller, thing)
+                thing.move_to(caller.location, quiet=True)
+                thing.at_drop(caller)
+            writebehind.flush()
+
+        broadcast(caller.location, caller,
+                to_actor="{things} relīquistī.",
+                to_room="{actor} {things} relīquit.",
+                things=bulk.describe(things),
+                )
+
 
 class VestītaPersōnaCmdSet(default_cmds.CharacterCmdSet):
     """
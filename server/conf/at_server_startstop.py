@@ -16,6 +16,9 @@ at_server_cold_stop()
 
 """
 
+from utils import writebehind
+from utils.latin_language import lexicon
+
 
 def at_server_start():
     """
@@ -30,7 +33,9 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    # save what is still held back, before a reload as before a shutdown
+    writebehind.flush()
+    lexicon.close()
 
 
 def at_server_reload_start():
@@ -52,7 +57,8 @@ def at_server_cold_start():
     This is called only when the server starts "cold", i.e. after a
     shutdown or a reset.
     """
-    pass
+    # make sure every known lemma is in the lexicon before typeclasses load
+    lexicon.build_lexicon()
 
 
 def at_server_cold_stop():
@@ -50,3 +50,21 @@ as argument.
 #
 #     """
 #     pass
+
+from utils import status as _status
+
+
+def status(session, *args, **kwargs):
+    """
+    Sends the client the full status (health, load, free hands, combat
+    actions) of the character it is playing. Afterwards only changes are
+    sent; see utils/status.py.
+
+    Args:
+        session (Session): The active Session.
+
+    """
+    puppet = session.puppet
+    if puppet:
+        _status.forget(puppet)
+        _status.push(puppet)
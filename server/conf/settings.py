@@ -46,6 +46,9 @@ TIME_GAME_EPOCH = None
 
 INSTALLED_APPS += ('web.chargen',)
 
+# Declined noun paradigms, see utils/latin_language/lexicon.py
+LATIN_LEXICON_FILE = os.path.join(GAME_DIR, "server", "lexicon.db")
+
 DEBUG = True
 
 ######################################################################
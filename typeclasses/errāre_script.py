@@ -2,6 +2,8 @@
 
 from evennia import DefaultScript
 
+from utils import writebehind
+
 class ErrāreScript(DefaultScript):
 
     def at_script_creation(self):
@@ -12,3 +14,4 @@ class ErrāreScript(DefaultScript):
 
     def at_repeat(self):
         self.obj.goto_next_room()
+        writebehind.flush()
@@ -9,7 +9,9 @@ for allowing Characters to traverse the exit to its destination.
 # from evennia import DefaultExit
 from evennia.contrib.ingame_python.typeclasses import EventExit
 
-from unidecode import unidecode
+from utils.latin_language.normalize import normalize, NORMALIZED
+from utils.latin_language import form_index
+from utils import appearance, writebehind
 
 
 class Exitus(EventExit):
@@ -39,8 +41,23 @@ class Exitus(EventExit):
     """
 
     def basetype_posthook_setup(self):
-        self.aliases.add(unidecode(self.name))
+        self.aliases.add(normalize(self.name), category=NORMALIZED)
         self.db.desc = self.destination
+        form_index.reindex(self)
+        appearance.exits_changed(self.location)
+
+    def at_object_delete(self):
+        appearance.exits_changed(self.location)
+        return super().at_object_delete()
+
+    def at_traverse(self, traversing_object, target_location, **kwargs):
+        """
+        Traverse as usual, then save what the move changed: walking through
+        an exit is a command of its own and never reaches at_post_cmd.
+        """
+
+        super().at_traverse(traversing_object, target_location, **kwargs)
+        writebehind.flush()
 
     def at_failed_traverse(self, traversing_object, **kwargs):
         """
@@ -17,10 +17,13 @@ from typeclasses.exitūs import Exitus
 from evennia.utils.utils import inherits_from
 from evennia.utils import create
 
-from utils.latin_language.adjective_agreement import us_a_um, us_a_um2
-from utils.latin_language.decline_noun import DeclineNoun
+from utils.latin_language.adjective_agreement import agree
+from utils.latin_language.lexicon import paradigm
 from utils.latin_language.check_grammar import check_case
 from utils.latin_language.esse import esse
+from utils.latin_language import form_index
+from utils import appearance
+from utils.latin_language.normalize import normalize, NORMALIZED
 
 from unidecode import unidecode
 
@@ -51,8 +54,7 @@ class Iānua(Exitus):
         genitive = self.db.formae['gen_sg'][0]
         sexus = self.db.sexus
 
-        word = DeclineNoun(nom=nominative, gen=genitive, gender=sexus)
-        forms = word.make_paradigm()
+        forms = paradigm(nominative, genitive, sexus)
 
         for key, value in forms.items():
             if key in self.db.formae:
@@ -62,7 +64,8 @@ class Iānua(Exitus):
                 self.db.formae.update({key: [value]})
 
         self.db.Latin = True
-        self.aliases.add(unidecode(self.key))
+        self.aliases.add(normalize(self.key), category=NORMALIZED)
+        form_index.reindex(self)
 #        self.setdesc(nominative)
 
 
@@ -109,7 +112,7 @@ class Iānua(Exitus):
                 attempting the traversal
 
         """
-        traversing_object.msg(f"{self.db.formae['nom_sg'][0]} claus{us_a_um('nom_sg',self.db.sexus)} est")
+        traversing_object.msg(f"{self.db.formae['nom_sg'][0]} {agree('claus', self)} est")
 
 class Aperiātur(default_cmds.ObjManipCommand):
     """
@@ -168,6 +171,7 @@ class Aperiātur(default_cmds.ObjManipCommand):
                     exit_obj.destination = destination
                     if exit_aliases:
                         [exit_obj.aliases.add(alias) for alias in exit_aliases]
+                        form_index.reindex(exit_obj)
                     string += " Iter nōn iam '%s' dūcit sed '%s' agnōminibus mutātīs." % (
                         old_destination.name,
                         destination.name,
@@ -194,6 +198,7 @@ class Aperiātur(default_cmds.ObjManipCommand):
             if exit_obj:
                 # storing a destination is what makes it an exit!
                 exit_obj.destination = destination
+                appearance.exits_changed(location)
                 string = (
                     ""
                     if not exit_aliases
@@ -223,6 +228,7 @@ class Aperiātur(default_cmds.ObjManipCommand):
             if back_obj:
                 # storing a destination is what makes it an exit!
                 back_obj.destination = location
+                appearance.exits_changed(destination)
                 exit_obj.db.return_exit = back_obj
                 back_obj.db.return_exit = exit_obj
                 string = (
@@ -364,37 +370,41 @@ class AperīClaudeIānuam(default_cmds.MuxCommand):
         if unidecode(self.cmdstring) == 'aperi':
 #            if door.locks.check(self.caller, "traverse"):
             if door.db.closed == False:
-                self.caller.msg(f"{door.db.formae['nom_sg'][0]} iam apert{us_a_um2('nom_sg',door.db.sexus,noun=door)} {esse(door)}.")
+                self.caller.msg(f"{door.db.formae['nom_sg'][0]} iam {agree('apert', door)} {esse(door)}.")
                 return
             else:
                 door.setlock("traverse:true()")
                 self.caller.msg(f"{door.db.formae['acc_sg'][0]} aperuistī.")
                 door.db.closed = False
+                appearance.changed(door.location)
                 door.location.msg_contents(
-                        f"{door.db.formae['nom_sg'][0]} {door.key} ab {caller.db.formae['abl_sg'][0]} apert{us_a_um('nom_sg',door.db.sexus)} est.",
+                        f"{door.db.formae['nom_sg'][0]} {door.key} ab {caller.db.formae['abl_sg'][0]} {agree('apert', door)} {esse(door)}.",
                         exclude=caller
                         )
                 return_exit.db.closed = False
+                appearance.changed(return_exit.location)
                 return_exit.location.msg_contents(
-                        f"{return_exit.db.formae['nom_sg'][0]} {return_exit.key} apert{us_a_um('nom_sg',return_exit.db.sexus)} est."
+                        f"{return_exit.db.formae['nom_sg'][0]} {return_exit.key} {agree('apert', return_exit)} {esse(return_exit)}."
                         )
-                door.setdesc(f"{door.db.formae['nom_sg'][0]} apert{us_a_um2('nom_sg',door.db.sexus,noun=door)}")
+                door.setdesc(f"{door.db.formae['nom_sg'][0]} {agree('apert', door)}")
         # Close door
         else: # close
 #            if not door.locks.check(self.caller, "traverse"):
             if door.db.closed == True:
-                self.caller.msg(f"{door.db.formae['nom_sg'][0]} iam claus{us_a_um2('nom_sg',door.db.sexus,noun=door)} {esse(door)}")
+                self.caller.msg(f"{door.db.formae['nom_sg'][0]} iam {agree('claus', door)} {esse(door)}")
                 return
             else:
                 door.setlock("traverse:false()")
                 self.caller.msg(f"{door.db.formae['acc_sg'][0]} clausistī.")
                 door.db.closed = True
+                appearance.changed(door.location)
                 door.location.msg_contents(
-                        f"{door.db.formae['nom_sg'][0]} {door.key} ab {caller.db.formae['abl_sg'][0]} claus{us_a_um('nom_sg',door.db.sexus)} est.",
+                        f"{door.db.formae['nom_sg'][0]} {door.key} ab {caller.db.formae['abl_sg'][0]} {agree('claus', door)} {esse(door)}.",
                         exclude=caller
                         )
                 return_exit.db.closed = True
+                appearance.changed(return_exit.location)
                 return_exit.location.msg_contents(
-                        f"{return_exit.db.formae['nom_sg'][0]} {return_exit.key} claus{us_a_um('nom_sg',return_exit.db.sexus)} est."
+                        f"{return_exit.db.formae['nom_sg'][0]} {return_exit.key} {agree('claus', return_exit)} {esse(return_exit)}."
                         )
-                door.setdesc(f"{door.db.formae['nom_sg'][0]} claus{us_a_um2('nom_sg',door.db.sexus,noun=door)}")
+                door.setdesc(f"{door.db.formae['nom_sg'][0]} {agree('claus', door)}")
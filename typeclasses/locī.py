@@ -4,17 +4,15 @@ Room
 Rooms are simple containers that has no location of their own.
 
 """
-from collections import defaultdict
 
 # from evennia import DefaultRoom
 from evennia.contrib.ingame_python.typeclasses import EventRoom
 
-from utils.latin_language.populate_forms import populate_forms
-from utils.latin_language.list_to_string import list_to_string
-from utils.latin_language.get_numbered_name import get_numbered_name
+from utils.latin_language.populate_forms import populate_lemmata
+from utils import appearance, light, writebehind
+from utils.latin_language import form_index
 
 from evennia.utils import ansi, gametime
-from evennia import utils
 
 from typeclasses.persōnae import Persōna
 from typeclasses.patientēs import Patiēns
@@ -37,21 +35,15 @@ class Locus(EventRoom):
         # add all of the case endings to attributes
         if hasattr(self, 'db'):
             if self.db.formae:
-                if len(self.db.formae['nom_sg']) > 1:
-                    nōmen_nom = self.db.formae['nom_sg'][1]
-                    nōmen_gen = self.db.formae['gen_sg'][1]
-
-
-                nominative = self.db.formae['nom_sg'][0]
-                genitive = self.db.formae['gen_sg'][0]
                 sexus = self.db.sexus
 
-                populate_forms(self, nom=nominative, gen=genitive, gender=sexus)
+                # the lemma, followed by the nōmen if this is a character
+                lemmata = [
+                        (nom, gen, sexus) for nom, gen in
+                        zip(self.db.formae['nom_sg'][:2], self.db.formae['gen_sg'][:2])
+                        ]
 
-                # Check if there is a nōmen for this character
-                if len(self.db.formae['nom_sg']) > 1:
-
-                    populate_forms(self, nom=nōmen_nom, gen=nōmen_gen, gender=sexus)
+                populate_lemmata(self, lemmata)
 
                 self.db.Latin = True
     
@@ -60,7 +52,8 @@ class Locus(EventRoom):
         # Lightly editing to change "You see" to "Ecce"
         # and 'Exits' to 'Ad hos locos ire potes:'
         This formats a description. It is the hook a 'look' command
-        should call.
+        should call. The looker-independent part is cached; see
+        utils/appearance.py.
 
         Args:
             looker (Object): Object doing the looking.
@@ -68,98 +61,42 @@ class Locus(EventRoom):
                 overriding the call (unused by default).
         """
 
-
-        if not looker:
-            return ""
-
-        # If it's dark, they can't see
-        if looker.location.db.āter:
-            lūx = False
-            contents = looker.contents + looker.location.contents
-            for con in contents:
-                if con.db.ardēns == True:
-                    lūx = True
-
-            if lūx == False:
-                looker.msg("Nihil per tenebrās vidēre potes.")
-                return
-
-        # get and identify all objects
-        visible = (con for con in self.contents if con != looker and con.access(looker, "view"))
-        exits, users, things = [], [], defaultdict(list)
-        colorful_exits = []
-        # adjusted the exit name to take out the dbref so builders can
-        # click on the exits to go there
-        for con in visible:
-            key = con.get_display_name(looker)
-            if con.destination:
-                exits.append(con.key)
-                if con.is_typeclass("typeclasses.iānuae.Iānua",exact=False):
-                    if con.db.closed == True:
-                        colorful_exits.append(f"|lc{con.key}|lt|g[{con.key}]|n|le")
-                    else:
-                        colorful_exits.append(f"|lc{con.key}|lt|g{con.key}|n|le")
-                else:
-                    colorful_exits.append(f"|lc{con.key}|lt|g{con.key}|n|le")
-            elif con.has_account:
-                if con.db.ardēns:
-                    users.append("|y(ardēns)|n |c%s|n" % key)
-                else:
-                    users.append("|c%s|n" % key)
-            else:
-                # things can be pluralized
-                things[key].append(con)
-
-        # get description, build string
-        string = "\n|c%s|n\n" % self.get_display_name(looker)
-        desc = self.db.desc
-
-        if desc:
-            string += "%s\n" % desc
-
-        if exits:
-            # Changing this string so that exits appear green
-            # string += "\n|wAd hos locos potes ire:|n\n " + LatinNoun.list_to_string(exits)
-#            colorful_exits = []
-#            for exit in exits:
-#                colorful_exits.append(f"|lc{exit}|lt|g{exit}|n|le")
-            colorful_exits = sorted(colorful_exits)
-            string += "\n|wAd hōs locōs īre licet:|n\n " + list_to_string(colorful_exits) + "\n"
-        if users or things:
-            # handle pluralization of things (never pluralize users)
-            thing_strings = []
-            for key, itemlist in sorted(things.items()):
-                nitem = len(itemlist)
-                if nitem == 1:
-#                    key, _ = itemlist[0].get_numbered_name(nitem, looker, key=key)
-                    key, _ = get_numbered_name(itemlist[0], nitem, looker, key=key)
-                    if itemlist[0].db.ardēns:
-                        key = "|y(ardēns)|n " + key
-#                    if itemlist[0].db.descriptive_name:
-                    if itemlist[0].db.vīsus:
-#                        key = itemlist[0].db.descriptive_name
-                        key = itemlist[0].db.vīsus
-                else:
-#                    key = [item.get_numbered_name(nitem, looker, key=key)[1] for item in itemlist][
-                    key = [get_numbered_name(item, nitem, looker, key=key)[1] for item in itemlist][
-                        0
-                    ]
-                thing_strings.append(key)
-
-            string += "\n|wEcce:|n\n " + list_to_string(users + thing_strings)
-
-        return string
+        return appearance.return_appearance(self, looker, **kwargs)
 
     def at_object_receive(self, obj, source_location):
-        if utils.inherits_from(obj, 'typeclasses.patientēs.Patiēns'): # An NPC has entered
-            pass
-        else:
-            if utils.inherits_from(obj, 'typeclasses.persōnae.Persōna'):
-                # A PC has entered, NPC is caught above.
-                # Cause the character to look around
-                obj.execute_cmd('specta')
-                for item in self.contents:
-                    if utils.inherits_from(item, 'typeclasses.patientēs.Patiēns'):
-                        # An NPC is in the room
-                        item.at_char_entered(obj)
-                        
+        form_index.add(self, obj)
+        light.entered(self, obj)
+        appearance.changed(self)
+
+        if isinstance(obj, Patiēns): # An NPC has entered
+            self.patientēs().add(obj)
+        elif isinstance(obj, Persōna):
+            # A PC has entered, NPC is caught above.
+            # Show the character where they are, as 'spectā' would
+            description = obj.at_look(self)
+            if description:
+                obj.msg((description, {"type": "look"}), options=None)
+            for npc in list(self.patientēs()):
+                npc.at_char_entered(obj)
+            # Walking through an exit is not a MuxCommand, so send the
+            # prompt its at_post_cmd would have
+            if obj.db.pv:
+                obj.msg(f"|wVīta: {writebehind.value(obj, 'pv', 'nunc')}/{obj.db.pv['max']}) |n")
+
+    def at_object_leave(self, obj, target_location, **kwargs):
+        super().at_object_leave(obj, target_location, **kwargs)
+        form_index.remove(self, obj)
+        light.left(self, obj)
+        appearance.changed(self)
+        self.patientēs().discard(obj)
+
+    def patientēs(self):
+        """
+        The NPCs in this room, kept in ndb so that a character entering
+        does not have to look through everything here to find them.
+        """
+
+        npcs = self.ndb.patientēs
+        if npcs is None or any(npc.location != self for npc in npcs):
+            npcs = self.ndb.patientēs = {item for item in self.contents if isinstance(item, Patiēns)}
+        return npcs
@@ -21,9 +21,11 @@ from typeclasses import vestīmenta
 from typeclasses.errāre_script import ErrāreScript
 from typeclasses.rēs import Ligātūra
 
-from utils.latin_language.populate_forms import populate_forms
+from utils.latin_language.populate_forms import populate_lemmata
 from utils.latin_language.list_to_string import list_to_string
-from utils.latin_language.adjective_agreement import us_a_um
+from utils.latin_language.adjective_agreement import agree
+from utils.latin_language import form_index
+from utils import appearance, equipment, hands, light, load, permissions, status
 
 import random
 
@@ -57,21 +59,15 @@ class Persōna(EventCharacter,TBBasicCharacter):
         # add all of the case endings to attributes
         if hasattr(self, 'db'):
             if self.db.formae:
-                if len(self.db.formae['nom_sg']) > 1:
-                    nōmen_nom = self.db.formae['nom_sg'][1]
-                    nōmen_gen = self.db.formae['gen_sg'][1]
-
-
-                nominative = self.db.formae['nom_sg'][0]
-                genitive = self.db.formae['gen_sg'][0]
                 sexus = self.db.sexus
 
-                populate_forms(self, nom=nominative, gen=genitive, gender=sexus)
-
-                # Check if there is a nōmen for this character
-                if len(self.db.formae['nom_sg']) > 1:
+                # the lemma, followed by the nōmen if this is a character
+                lemmata = [
+                        (nom, gen, sexus) for nom, gen in
+                        zip(self.db.formae['nom_sg'][:2], self.db.formae['gen_sg'][:2])
+                        ]
 
-                    populate_forms(self, nom=nōmen_nom, gen=nōmen_gen, gender=sexus)
+                populate_lemmata(self, lemmata)
 
                 self.db.Latin = True
 
@@ -81,9 +77,8 @@ class Persōna(EventCharacter,TBBasicCharacter):
                 else:
                     self.db.handedness = 'dextrā'
 
-                # Set 'manibus_plēnīs' and 'manibus_vacuīs'
-                self.db.manibus_plēnīs = []
-                self.db.manibus_vacuīs = ['dextrā','sinistrā']
+                # Both hands start empty
+                self.db.manūs = dict.fromkeys(hands.HANDS)
 
                 # Set stats if not already given
                 if not self.db.ingenia:
@@ -305,6 +300,34 @@ class Persōna(EventCharacter,TBBasicCharacter):
                 present.callbacks.call("say", self, present, message, parameters=message)
 
 
+    def at_post_puppet(self, **kwargs):
+        super().at_post_puppet(**kwargs)
+        permissions.forget(self)
+        status.forget(self)
+        # now listed among the people present rather than the things
+        appearance.changed(self.location)
+
+    def at_post_unpuppet(self, account, session=None, **kwargs):
+        location = self.location
+        super().at_post_unpuppet(account, session=session, **kwargs)
+        permissions.forget(self)
+        appearance.changed(location)
+
+    def at_object_receive(self, obj, source_location, **kwargs):
+        super().at_object_receive(obj, source_location, **kwargs)
+        form_index.add(self, obj)
+        light.entered(self, obj)
+        load.entered(self, obj)
+        equipment.changed(self)
+
+    def at_object_leave(self, obj, target_location, **kwargs):
+        super().at_object_leave(obj, target_location, **kwargs)
+        form_index.remove(self, obj)
+        light.left(self, obj)
+        load.left(self, obj)
+        hands.left(self, obj)
+        equipment.changed(self)
+
     def at_before_move(self, destination):
         """
         Called just before starting to move this object to
@@ -326,7 +349,7 @@ class Persōna(EventCharacter,TBBasicCharacter):
             leash_location = ligature.location
             if leash_location.typename != 'Locus':
                 if leash_location.location == self.location and leash_location != self:
-                    self.msg(f"Ligāt{us_a_um('nom_sg',self.db.sexus)}, proficīscī nōn potes!")
+                    self.msg(f"{agree('Ligāt', self)}, proficīscī nōn potes!")
                     return False
         
         origin = self.location
@@ -357,13 +380,9 @@ class Persōna(EventCharacter,TBBasicCharacter):
 #        super().at_after_move(source_location)
 
         # Bring bound characters with you on move
-        possessions = self.contents
 
-        ligature = False
         # Make sure that caller is holding a ligature
-        for p in possessions:
-            if p.db.tenētur and p.typename == 'Ligātūra':
-                ligature = p
+        ligature = equipment.holding(self, 'Ligātūra')
 
         if ligature:
             if ligature.db.ligāns:
@@ -384,9 +403,7 @@ class Persōna(EventCharacter,TBBasicCharacter):
                 loose_ligature.move_to(self.location)
 
         if self.db.pv:
-            prompt = f"|wVīta: {self.db.pv['nunc']}/{self.db.pv['max']}"
-
-#            self.msg(prompt)
+            status.push(self)
 
     def return_appearance(self, looker, **kwargs):
             """
@@ -418,7 +435,7 @@ class Persōna(EventCharacter,TBBasicCharacter):
                 # if 'worn' is True, just append the name
                 if garment.db.geritur is True:
                     if garment.db.ardēns:
-                        worn_string_list.append(f"|yarden{'s' if garment.db.sexus == 'neutrum' else 'tem'}|n {garment.db.acc_sg[0]}")
+                        worn_string_list.append(f"|y{agree('ardent', garment, 'acc_sg', 'is_e', 'ardēns')}|n {garment.db.formae['acc_sg'][0]}")
 
                     # JI (12/7/19) append the accusative name to the description,
                     # since these will be direct objects
@@ -430,14 +447,12 @@ class Persōna(EventCharacter,TBBasicCharacter):
                     worn_string_list.append("%s %s" % (garment.name, garment.db.geritur))
 
             # get held clothes
-            possessions = self.contents
             held_list = []
-            for possession in possessions:
-                if possession.db.tenētur:
-                    if possession.db.ardēns:
-                        held_list.append(f"|y(arden{'s' if possession.db.sexus == 'neutrum' else 'tem'})|n {possession.db.formae['acc_sg'][0]}")
-                    else:
-                        held_list.append(possession.db.formae['acc_sg'][0])
+            for possession in equipment.held(self):
+                if possession.db.ardēns:
+                    held_list.append(f"|y({agree('ardent', possession, 'acc_sg', 'is_e', 'ardēns')})|n {possession.db.formae['acc_sg'][0]}")
+                else:
+                    held_list.append(possession.db.formae['acc_sg'][0])
             if desc:
                 string += f"{self.db.desc}"
             # Append held items.
@@ -448,7 +463,7 @@ class Persōna(EventCharacter,TBBasicCharacter):
                 string += "\n\n" + f"gerit: {list_to_string(worn_string_list)}."
             else:
 #                string += "|/|/%s nūd%s est!" % (self, us_a_um('nom_sg',self.db.sexus))
-                string += "\n\n" + f"{self.key} nūd{us_a_um('nom_sg',self.db.sexus)} est!"
+                string += "\n\n" + f"{self.key} {agree('nūd', self)} est!"
             return string
 
     def announce_move_from(self, destination, msg=None, mapping=None):
@@ -580,7 +595,7 @@ class Persōna(EventCharacter,TBBasicCharacter):
             builders.
 
         """
-        if self.locks.check_lockstring(looker, "perm(Builder)"):
+        if permissions.is_builder(looker):
             return "{}(#{})".format(self.name, self.id)
         elif self.db.descriptive_name:
             return self.db.ldesc
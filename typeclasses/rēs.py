@@ -8,14 +8,13 @@ the following must be specified:
 """
 # from typeclasses.inflected_noun import InflectedNoun
 #from evennia import DefaultObject
-from collections import defaultdict
 from evennia.contrib.ingame_python.typeclasses import EventObject
-from utils.latin_language.populate_forms import populate_forms
+from utils.latin_language.populate_forms import populate_lemmata
 
 from evennia.contrib.ingame_python.utils import register_events
 
-from utils.latin_language.list_to_string import list_to_string
-from utils.latin_language.get_numbered_name import get_numbered_name
+from utils import appearance, containers, light, load
+from utils.latin_language import form_index
 
 # from commands.iussa_rērum import LigātūraCmdSet
 # from commands.default_cmdsets import LigātūraCmdSet
@@ -171,30 +170,41 @@ class Rēs(EventObject):
         # add all of the case endings to attributes
         if hasattr(self, 'db'):
             if self.db.formae:
-                if len(self.db.formae['nom_sg']) > 1:
-                    nōmen_nom = self.db.formae['nom_sg'][1]
-                    nōmen_gen = self.db.formae['gen_sg'][1]
-
-
-                nominative = self.db.formae['nom_sg'][0]
-                genitive = self.db.formae['gen_sg'][0]
                 sexus = self.db.sexus
 
-                populate_forms(self, nom=nominative, gen=genitive, gender=sexus)
-
-                # Check if there is a nōmen for this character
-                if len(self.db.formae['nom_sg']) > 1:
+                # the lemma, followed by the nōmen if this is a character
+                lemmata = [
+                        (nom, gen, sexus) for nom, gen in
+                        zip(self.db.formae['nom_sg'][:2], self.db.formae['gen_sg'][:2])
+                        ]
 
-                    populate_forms(self, nom=nōmen_nom, gen=nōmen_gen, gender=sexus)
+                populate_lemmata(self, lemmata)
 
                 self.db.Latin = True
 
+    def at_object_receive(self, obj, source_location, **kwargs):
+        super().at_object_receive(obj, source_location, **kwargs)
+        form_index.add(self, obj)
+        light.entered(self, obj)
+        load.entered(self, obj)
+        containers.entered(self, obj)
+        appearance.changed(self)
+
+    def at_object_leave(self, obj, target_location, **kwargs):
+        super().at_object_leave(obj, target_location, **kwargs)
+        form_index.remove(self, obj)
+        light.left(self, obj)
+        load.left(self, obj)
+        containers.left(self, obj)
+        appearance.changed(self)
+
     def return_appearance(self, looker, **kwargs):
         """
         # Lightly editing to change "You see" to "Ecce"
         # and 'Exits' to 'Ad hos locos ire potes:'
         This formats a description. It is the hook a 'look' command
-        should call.
+        should call. The looker-independent part is cached; see
+        utils/appearance.py.
 
         Args:
             looker (Object): Object doing the looking.
@@ -202,87 +212,7 @@ class Rēs(EventObject):
                 overriding the call (unused by default).
         """
 
-
-        if not looker:
-            return ""
-
-        # If it's dark, they can't see
-        if looker.location.db.āter:
-            lūx = False
-            contents = looker.contents + looker.location.contents
-            for con in contents:
-                if con.db.ardēns == True:
-                    lūx = True
-
-            if lūx == False:
-                looker.msg("Nihil per tenebrās vidēre potes.")
-                return
-
-        # get and identify all objects
-        visible = (con for con in self.contents if con != looker and con.access(looker, "view"))
-        exits, users, things = [], [], defaultdict(list)
-        colorful_exits = []
-        # adjusted the exit name to take out the dbref so builders can
-        # click on the exits to go there
-        for con in visible:
-            key = con.get_display_name(looker)
-            if con.destination:
-                exits.append(con.key)
-                if con.is_typeclass("typeclasses.iānuae.Iānua",exact=False):
-                    if con.db.closed == True:
-                        colorful_exits.append(f"|lc{con.key}|lt|g[{con.key}]|n|le")
-                    else:
-                        colorful_exits.append(f"|lc{con.key}|lt|g{con.key}|n|le")
-                else:
-                    colorful_exits.append(f"|lc{con.key}|lt|g{con.key}|n|le")
-            elif con.has_account:
-                if con.db.ardēns:
-                    users.append("|y(ardēns)|n |c%s|n" % key)
-                else:
-                    users.append("|c%s|n" % key)
-            else:
-                # things can be pluralized
-                things[key].append(con)
-
-        # get description, build string
-        string = "\n|c%s|n\n" % self.get_display_name(looker)
-        desc = self.db.desc
-
-        if desc:
-            string += "%s\n" % desc
-
-        if exits:
-            # Changing this string so that exits appear green
-            # string += "\n|wAd hos locos potes ire:|n\n " + LatinNoun.list_to_string(exits)
-#            colorful_exits = []
-#            for exit in exits:
-#                colorful_exits.append(f"|lc{exit}|lt|g{exit}|n|le")
-            colorful_exits = sorted(colorful_exits)
-            string += "\n|wAd hōs locōs īre licet:|n\n " + list_to_string(colorful_exits) + "\n"
-        if users or things:
-            # handle pluralization of things (never pluralize users)
-            thing_strings = []
-            for key, itemlist in sorted(things.items()):
-                nitem = len(itemlist)
-                if nitem == 1:
-#                    key, _ = itemlist[0].get_numbered_name(nitem, looker, key=key)
-                    key, _ = get_numbered_name(itemlist[0], nitem, looker, key=key)
-                    if itemlist[0].db.ardēns:
-                        key = "|y(ardēns)|n " + key
-#                    if itemlist[0].db.descriptive_name:
-                    if itemlist[0].db.vīsus:
-#                        key = itemlist[0].db.descriptive_name
-                        key = itemlist[0].db.vīsus
-                else:
-#                    key = [item.get_numbered_name(nitem, looker, key=key)[1] for item in itemlist][
-                    key = [get_numbered_name(item, nitem, looker, key=key)[1] for item in itemlist][
-                        0
-                    ]
-                thing_strings.append(key)
-
-            string += "\n|wEcce:|n\n " + list_to_string(users + thing_strings)
-
-        return string
+        return appearance.return_appearance(self, looker, **kwargs)
 
 
 #    def at_get(getter):
@@ -324,4 +254,4 @@ class Inflammābilis(Rēs):
     def at_object_creation(self):
 
         self.db.inflammābilis = True
-        self.db.ardēns = True
+        light.accende(self)
@@ -5,6 +5,23 @@ from typeclasses.rēs import Rēs
 from typeclasses.locī import Locus
 from typeclasses.exitūs import Exitus
 
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+
+from utils.latin_language import lexicon
+from utils.latin_language.adjective_agreement import adjective, agree, relative
+from utils.latin_language.case_index import case_index, cases_of
+from utils.latin_language.check_grammar import assign_cases
+
+from utils.latin_language.decline_noun import (
+        DeclineNoun, I_STEMS, LABELS, RULES_VERSION, cache_forms, clear_paradigm_cache,
+        count_syllables, decline_many, paradigm_cache_info)
+from utils.latin_language.form_index import within
+from utils.latin_language.populate_forms import populate_lemmata
+
 class DefaultObjectTest(LocalEvenniaTest):
 
     ip = "212.216.139.14"
@@ -178,3 +195,261 @@ class TestObjectManager(TestObjectManager):
         self.assertEqual(obj2.attributes.get(key="phrase"), "xyzzy")
         self.assertEqual(self.obj1.attributes.get(key="phrase", category="adventure"), "plugh")
         self.assertEqual(obj2.attributes.get(key="phrase", category="adventure"), "plugh")
+
+class DeclineManyTest(TestCase):
+    """ decline_many, the bulk declension used to build the lexicon """
+
+    lemmata = [
+            ('puella', 'puellae', 'muliebre'),
+            ('rēx', 'rēgis', 'māre'),
+            ('puella', 'puellae', 'muliebre'),
+            ('lūmen', 'lūminis', 'neutrum'),
+            ]
+
+    def test_columns_line_up_with_lemmata(self):
+        columns = decline_many(self.lemmata)
+
+        self.assertEqual(list(columns), LABELS)
+        for i, lemma in enumerate(self.lemmata):
+            forms = DeclineNoun(*lemma).decline()
+            self.assertEqual([columns[label][i] for label in LABELS], forms)
+
+    def test_duplicates_keep_their_place(self):
+        columns = decline_many(self.lemmata)
+
+        self.assertEqual(columns['acc_sg'], ('puellam', 'rēgem', 'puellam', 'lūmen'))
+
+    def test_irregular_flag(self):
+        columns = decline_many([('rēx', 'rēgis', 'māre', False)])
+
+        self.assertEqual(columns['gen_pl'], ('rēgum',))
+
+    def test_empty(self):
+        self.assertEqual(decline_many([]), {label: () for label in LABELS})
+
+    def test_bypasses_paradigm_cache(self):
+        clear_paradigm_cache()
+        decline_many(self.lemmata)
+
+        self.assertEqual(paradigm_cache_info().currsize, 0)
+
+class ThirdDeclensionTest(TestCase):
+    """ count_syllables and I_STEMS, which decide the third-declension i-stems """
+
+    def test_count_syllables(self):
+        self.assertEqual(count_syllables('rēx'), 1)
+        self.assertEqual(count_syllables('rēgis'), 2)
+        self.assertEqual(count_syllables('puella'), 3)
+
+    def test_count_syllables_diphthongs(self):
+        self.assertEqual(count_syllables('Caesar'), 2)
+        self.assertEqual(count_syllables('poena'), 2)
+
+    def test_count_syllables_qu(self):
+        self.assertEqual(count_syllables('aqua'), 2)
+        self.assertEqual(count_syllables('quoque'), 2)
+
+    def test_count_syllables_consonantal_i(self):
+        self.assertEqual(count_syllables('iānua'), 3)
+        self.assertEqual(count_syllables('maior'), 2)
+        self.assertEqual(count_syllables('Iūlius'), 3)
+
+    def test_i_stems_by_rule(self):
+        # parisyllabic in -is, and two consonants before the ending
+        self.assertEqual(DeclineNoun('hostis', 'hostis', 'māre').decline()[7], 'hostium')
+        self.assertEqual(DeclineNoun('mīles', 'mīlitis', 'māre').decline()[7], 'mīlitum')
+
+    def test_i_stems_listed(self):
+        # the rule would make these i-stems
+        for nom, gen in (('canis', 'canis'), ('iuvenis', 'iuvenis')):
+            self.assertIs(I_STEMS[(nom, gen)], False)
+            self.assertEqual(DeclineNoun(nom, gen, 'māre').decline()[7], gen[:-2] + 'um')
+
+        self.assertEqual(DeclineNoun('senex', 'senis', 'māre').decline()[7], 'senum')
+        self.assertEqual(DeclineNoun('nox', 'noctis', 'muliebre').decline()[7], 'noctium')
+
+    def test_neuter_i_stems(self):
+        forms = dict(zip(LABELS, DeclineNoun('mare', 'maris', 'neutrum').decline()))
+
+        self.assertEqual(forms['abl_sg'], 'marī')
+        self.assertEqual(forms['nom_pl'], 'maria')
+        self.assertEqual(forms['gen_pl'], 'marium')
+
+class LexiconTest(TestCase):
+    """ The on-disk lexicon of paradigms """
+
+    rēx = ('rēx', 'rēgis', 'māre')
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'lexicon.db')
+        lexicon.close()
+        clear_paradigm_cache()
+
+    def tearDown(self):
+        lexicon.close()
+        clear_paradigm_cache()
+        self.directory.cleanup()
+
+    def test_paradigm_declines_and_stores(self):
+        lexicon.connect(self.path)
+
+        self.assertIsNone(lexicon.lookup(*self.rēx))
+        forms = lexicon.paradigm(*self.rēx)
+
+        self.assertEqual(forms['acc_sg'], 'rēgem')
+        self.assertEqual(lexicon.lookup(*self.rēx), forms)
+
+    def test_paradigm_reads_lexicon(self):
+        lexicon.connect(self.path)
+        lexicon.store([(*self.rēx, [f"form{i}" for i in range(len(LABELS))])])
+
+        self.assertEqual(lexicon.paradigm(*self.rēx)['acc_sg'], 'form3')
+
+    def test_paradigm_cache_first(self):
+        lexicon.connect(self.path)
+        cache_forms(*self.rēx, [f"cached{i}" for i in range(len(LABELS))])
+
+        self.assertEqual(lexicon.paradigm(*self.rēx)['acc_sg'], 'cached3')
+        self.assertIsNone(lexicon.lookup(*self.rēx))
+
+    def test_build_lexicon(self):
+        lexicon.connect(self.path)
+        lemmata = [self.rēx, ('puella', 'puellae', 'muliebre'), self.rēx]
+
+        self.assertEqual(lexicon.build_lexicon(lemmata), 2)
+        self.assertEqual(lexicon.lookup('puella', 'puellae', 'muliebre')['dat_pl'], 'puellīs')
+        self.assertEqual(lexicon.lookup(*self.rēx)['gen_pl'], 'rēgum')
+
+    def test_build_lexicon_keeps_stored(self):
+        lexicon.connect(self.path)
+        lexicon.store([(*self.rēx, [f"form{i}" for i in range(len(LABELS))])])
+        lexicon.build_lexicon([self.rēx])
+
+        self.assertEqual(lexicon.lookup(*self.rēx)['acc_sg'], 'form3')
+
+    def test_new_rules_decline_again(self):
+        # a lexicon written with older rules, and a wrong paradigm in it
+        connection = sqlite3.connect(self.path)
+        connection.execute(lexicon._CREATE)
+        connection.execute(lexicon._INSERT, (*self.rēx, *(f"old{i}" for i in range(len(LABELS)))))
+        connection.execute(f"PRAGMA user_version = {RULES_VERSION - 1}")
+        connection.commit()
+        connection.close()
+
+        connection = lexicon.connect(self.path)
+
+        self.assertEqual(lexicon.lookup(*self.rēx)['acc_sg'], 'rēgem')
+        self.assertEqual(connection.execute("PRAGMA user_version").fetchone()[0], RULES_VERSION)
+
+    def test_current_rules_left_alone(self):
+        lexicon.connect(self.path)
+        lexicon.store([(*self.rēx, [f"form{i}" for i in range(len(LABELS))])])
+        lexicon.close()
+
+        lexicon.connect(self.path)
+
+        self.assertEqual(lexicon.lookup(*self.rēx)['acc_sg'], 'form3')
+
+class CaseIndexTest(LocalEvenniaTest):
+    """ case_index and assign_cases, which tell which case a player used """
+
+    def setUp(self):
+        super().setUp()
+
+        def thing(nom, gen, sexus):
+            obj, errors = Rēs.create(
+                    nom, self.account, home=self.room1, location=self.room1,
+                    attributes=[
+                        ('formae', {'nom_sg': [nom], 'gen_sg': [gen]}),
+                        ('sexus', sexus),
+                        ])
+            return obj
+
+        self.gladius = thing('gladius', 'gladiī', 'māre')
+        self.equus = thing('equus', 'equī', 'māre')
+        self.puella = thing('puella', 'puellae', 'muliebre')
+
+    def test_case_index(self):
+        index = case_index(self.puella)
+
+        self.assertEqual(index['puellam'], {'acc_sg'})
+        self.assertEqual(index['puellae'], {'gen_sg', 'dat_sg', 'nom_pl', 'voc_pl'})
+
+    def test_cases_of_normalizes(self):
+        self.assertEqual(cases_of(self.gladius, 'Gladiō'), {'dat_sg', 'abl_sg'})
+        self.assertEqual(cases_of(self.gladius, 'gladio'), {'dat_sg', 'abl_sg'})
+        self.assertEqual(cases_of(self.gladius, 'puellam'), frozenset())
+
+    def test_case_index_dropped_with_new_forms(self):
+        self.assertEqual(cases_of(self.gladius, 'ēnsem'), frozenset())
+
+        populate_lemmata(self.gladius, [('ēnsis', 'ēnsis', 'māre')])
+
+        self.assertEqual(cases_of(self.gladius, 'ēnsem'), {'acc_sg'})
+
+    def test_assign_cases(self):
+        here = within(self.room1)
+
+        self.assertEqual(
+                assign_cases(['gladium', 'puellae'], ('dat_sg', 'acc_sg'), here),
+                ['puellae', 'gladium'])
+        self.assertEqual(
+                assign_cases(['gladiō', 'puellae'], ('dat_sg', 'abl_sg'), here),
+                ['puellae', 'gladiō'])
+
+    def test_assign_cases_numbered(self):
+        self.assertEqual(
+                assign_cases(['2-gladium', 'puellae'], ('dat_sg', 'acc_sg'), within(self.room1)),
+                ['puellae', '2-gladium'])
+
+    def test_assign_cases_ambiguous(self):
+        here = within(self.room1)
+
+        # both are dative or ablative
+        self.assertIsNone(assign_cases(['gladiō', 'equō'], ('dat_sg', 'abl_sg'), here))
+        self.assertIsNone(assign_cases(['gladium', 'hastam'], ('acc_sg', 'dat_sg'), here))
+        self.assertIsNone(assign_cases(['gladium'], ('acc_sg', 'dat_sg'), here))
+
+def noun(nom_sg, gen_sg, sexus):
+    """ Just the Attributes of a noun that agreement reads. """
+    return SimpleNamespace(db=SimpleNamespace(
+        sexus=sexus, formae={'nom_sg': [nom_sg], 'gen_sg': [gen_sg]}))
+
+class AdjectiveTest(TestCase):
+    """ Declining adjectives and participles to agree with nouns """
+
+    def test_us_a_um(self):
+        self.assertEqual(adjective('ligāt'), 'ligātus')
+        self.assertEqual(adjective('ligāt', 'nom_sg', 'muliebre'), 'ligāta')
+        self.assertEqual(adjective('ligāt', 'acc_sg', 'neutrum'), 'ligātum')
+        self.assertEqual(adjective('ligāt', 'abl_pl', 'māre'), 'ligātīs')
+
+    def test_is_e(self):
+        self.assertEqual(adjective('fort', 'nom_sg', 'muliebre', 'is_e'), 'fortis')
+        self.assertEqual(adjective('fort', 'nom_sg', 'neutrum', 'is_e'), 'forte')
+        self.assertEqual(adjective('fort', 'gen_pl', 'māre', 'is_e'), 'fortium')
+
+    def test_one_termination(self):
+        for gender in ('māre', 'muliebre', 'neutrum'):
+            self.assertEqual(adjective('ardent', 'nom_sg', gender, 'is_e', 'ardēns'), 'ardēns')
+        self.assertEqual(adjective('ardent', 'acc_sg', 'māre', 'is_e', 'ardēns'), 'ardentem')
+        self.assertEqual(adjective('ardent', 'acc_sg', 'neutrum', 'is_e', 'ardēns'), 'ardēns')
+        self.assertEqual(adjective('ardent', 'acc_pl', 'neutrum', 'is_e', 'ardēns'), 'ardentia')
+
+    def test_agree(self):
+        self.assertEqual(agree('ligāt', noun('puella', 'puellae', 'muliebre')), 'ligāta')
+        self.assertEqual(agree('apert', noun('ōstium', 'ōstiī', 'neutrum')), 'apertum')
+        self.assertEqual(agree('ardent', noun('lūmen', 'lūminis', 'neutrum'), 'acc_sg', 'is_e', 'ardēns'), 'ardēns')
+
+    def test_agree_always_plural(self):
+        soleae = noun('soleae', 'solearum', 'muliebre')
+
+        self.assertEqual(agree('ligāt', soleae), 'ligātae')
+        self.assertEqual(agree('ardent', soleae, 'acc_sg', 'is_e', 'ardēns'), 'ardentēs')
+
+    def test_relative(self):
+        self.assertEqual(relative(noun('gladius', 'gladiī', 'māre')), 'quī')
+        self.assertEqual(relative(noun('puella', 'puellae', 'muliebre'), 'acc_sg'), 'quam')
+        self.assertEqual(relative(noun('ōstium', 'ōstiī', 'neutrum'), 'voc_sg'), 'quod')
+        self.assertEqual(relative(noun('castra', 'castrōrum', 'neutrum'), 'acc_sg'), 'quae')
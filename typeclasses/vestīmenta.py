@@ -79,6 +79,7 @@ from typeclasses.rēs import Rēs
 from evennia import DefaultCharacter
 from utils.latin_language.list_to_string import list_to_string
 from utils.latin_language.free_hands import take_out_of_hand, put_into_hand
+from utils import equipment, hands
 # Renamed class to Vestīmentum
 
 # Options start here.
@@ -188,13 +189,7 @@ def get_worn_clothes(character, exclude_covered=False):
                                     the CLOTHING_TYPE_ORDER option specified
                                     in this module.
     """
-    clothes_list = []
-    for thing in character.contents:
-        # If uncovered or not excluding covered items
-        if not thing.db.covered_by or exclude_covered is False:
-            # If 'worn' is True, add to the list
-            if thing.db.geritur:
-                clothes_list.append(thing)
+    clothes_list = equipment.worn(character, exclude_covered)
     # Might as well put them in order here too.
     ordered_clothes_list = order_clothes_list(clothes_list)
     return ordered_clothes_list
@@ -221,6 +216,7 @@ class Vestīmentum(Rēs):
         # Set clothing as worn
         # JI (12/7/19) Chaging to "True" to disable "wearstyle" at least to start with
         self.db.geritur = True
+        equipment.changed(wearer)
         # Auto-cover appropirate clothing types, as specified above
         to_cover = []
         # JI (12/7/19) list to hold ablative forms
@@ -235,6 +231,7 @@ class Vestīmentum(Rēs):
                     # JI (12/7/19) list of ablative forms
                     to_cover_ablative.append(garment.db.formae['abl_sg'][0])
                     garment.db.covered_by = self
+        equipment.changed(wearer)
         # Return if quiet
         if quiet:
             return
@@ -281,7 +278,7 @@ class Vestīmentum(Rēs):
 #            wearer.msg("Manūs tuae sunt plēnae!")
 #            return
         # A more elegant check for full hands:
-        if len(wearer.db.manibus_plēnīs) >= 2:
+        if not hands.free(wearer):
             wearer.msg("Manūs tuae sunt plēnae!")
             return
 
@@ -293,14 +290,13 @@ class Vestīmentum(Rēs):
         uncovered_list_ablative = []
 
         # Check to see if any other clothes are covered by this object.
-        for thing in wearer.contents:
-            # If anything is covered by
-            if thing.db.covered_by == self:
-                thing.db.covered_by = False
-                # JI (12/9/19) changing the following from thing.name to thing
-                uncovered_list.append(thing)
-                # JI (12/7/19) Add to list of ablative forms
-                uncovered_list_ablative.append(thing.db.formae['abl_sg'][0])
+        for thing in equipment.covered_by(wearer, self):
+            thing.db.covered_by = False
+            # JI (12/9/19) changing the following from thing.name to thing
+            uncovered_list.append(thing)
+            # JI (12/7/19) Add to list of ablative forms
+            uncovered_list_ablative.append(thing.db.formae['abl_sg'][0])
+        equipment.changed(wearer)
         if len(uncovered_list) > 0:
             # JI (12/7/2019) Translated message to Latin
             remove_message = "%s %s exuit, %s apert%s." % (
@@ -330,6 +326,7 @@ class Vestīmentum(Rēs):
         location changed without getting removed.
         """
         self.db.geritur = False
+        equipment.changed(getter)
 
 
 #class ClothedCharacter(DefaultCharacter):
@@ -0,0 +1,211 @@
+# file mygame/utils/appearance.py
+"""
+The description of a room or container, shared by Rēs and Locus.
+
+Most of what 'spectā' shows does not depend on who is looking: the exits,
+the people present and the grouped list of things. That part is built once
+and kept in the container's ndb until the container changes, which is
+tracked by a version counter. Call changed(container) whenever something
+a looker would see changes without the contents of the container changing,
+e.g. a door opens or closes, a lamp is lit or put out, or an object
+gets a new descriptive_name. Moving objects in or out bumps the counter
+through at_object_receive and at_object_leave, and the list of contents
+is part of the cache key as well, so objects placed with obj.location = ...
+are picked up too. Builders and other lookers get separate views, kept side
+by side until the version moves on.
+
+The exits of a container, with their markup for both states of a door, are
+kept separately, since they change far less often than who is present:
+call exits_changed(container) when an exit is made or removed there.
+
+What is still worked out for every look is the darkness check, the
+container's own name and desc, and anything that depends on the looker:
+whether they are a builder (who see dbrefs), not listing the looker
+themselves, and objects with a view lock other than 'view:all()'.
+"""
+
+from collections import defaultdict
+
+from utils import light
+from utils.templates import Template, join
+from utils.permissions import is_builder
+from utils.latin_language.list_to_string import list_to_string
+from utils.latin_language.get_numbered_name import get_numbered_name
+
+# The view lock that lets anyone see an object
+OPEN_VIEW = "view:all()"
+
+# Exits of this typeclass are shown in brackets when closed
+DOOR = "typeclasses.iānuae.Iānua"
+
+NAME = Template("\n|c{name}|n\n")
+DESC = Template("{desc}\n")
+EXITS = Template("\n|wAd hōs locōs īre licet:|n\n {exits}\n")
+CONTENTS = Template("\n|wEcce:|n\n {contents}")
+
+def changed(container):
+    """
+    Note that the appearance of container has changed.
+    """
+
+    if container is not None:
+        container.ndb.appearance_version = (container.ndb.appearance_version or 0) + 1
+
+def exits_changed(container):
+    """
+    Note that an exit has been made in, or removed from, container.
+    """
+
+    if container is not None:
+        container.ndb.exits = None
+        changed(container)
+
+def _exit_markup(con):
+    shown = f"|lc{con.key}|lt|g{con.key}|n|le"
+    if con.is_typeclass(DOOR, exact=False):
+        return con, shown, f"|lc{con.key}|lt|g[{con.key}]|n|le"
+    return con, shown, shown
+
+def exit_list(container):
+    """
+    The exits of container as (exit, open markup, closed markup), sorted
+    by their open markup. Only doors have a different closed markup.
+    """
+
+    cached = container.ndb.exits
+    if cached is None or any(con.location != container for con, shown, closed in cached):
+        cached = container.ndb.exits = sorted(
+                (_exit_markup(con) for con in container.contents if con.destination),
+                key=lambda markup: markup[1])
+    return cached
+
+def _exit_string(con, shown, closed):
+    if closed is not shown and con.db.closed == True:
+        return closed
+    return shown
+
+def _user_string(con, key):
+    if con.db.ardēns:
+        return "|y(ardēns)|n |c%s|n" % key
+    return "|c%s|n" % key
+
+def _thing_strings(things, looker):
+    # handle pluralization of things (never pluralize users)
+    thing_strings = []
+    for key, itemlist in sorted(things.items()):
+        nitem = len(itemlist)
+        first = itemlist[0]
+        if nitem == 1:
+            key, _ = get_numbered_name(first, nitem, looker, key=key)
+            if first.db.ardēns:
+                key = "|y(ardēns)|n " + key
+            if first.db.vīsus:
+                key = first.db.vīsus
+        else:
+            # the plural is the same for the whole group
+            key = get_numbered_name(first, nitem, looker, key=key)[1]
+        thing_strings.append(key)
+    return thing_strings
+
+def _build(container, looker):
+    """
+    Sort the contents of container into exits, users and things, as seen by
+    a looker of the same builder status as looker.
+    """
+
+    exits = [(con, _exit_string(con, shown, closed)) for con, shown, closed in exit_list(container)]
+    users, things = [], defaultdict(list)
+    restricted = []
+
+    for con in container.contents:
+        if con.locks.get("view") != OPEN_VIEW:
+            restricted.append(con)
+        if con.destination:
+            continue
+        key = con.get_display_name(looker)
+        if con.has_account:
+            users.append((con, _user_string(con, key)))
+        else:
+            # things can be pluralized
+            things[key].append(con)
+
+    return {
+            'exits': exits,
+            'users': users,
+            'things': dict(things),
+            'restricted': restricted,
+            'exit_strings': [string for con, string in exits],
+            'thing_strings': _thing_strings(things, looker),
+            }
+
+def _cached(container, looker):
+    version = container.ndb.appearance_version
+    key = (
+            version,
+            is_builder(looker),
+            tuple(con.id for con in container.contents),
+            )
+
+    cache = container.ndb.appearance_cache
+    if cache is None or cache[0] != version:
+        # views of an older version of the container are no use any more;
+        # builders and everyone else keep their own views side by side
+        cache = container.ndb.appearance_cache = (version, {})
+
+    views = cache[1]
+    if key not in views:
+        views[key] = _build(container, looker)
+
+    return views[key]
+
+def return_appearance(container, looker, **kwargs):
+    """
+    This formats a description. It is the hook a 'look' command
+    should call.
+
+    Args:
+        container (Object): the room or object being looked at
+        looker (Object): Object doing the looking.
+        **kwargs (dict): Arbitrary, optional arguments for users
+            overriding the call (unused by default).
+    """
+
+    if not looker:
+        return ""
+
+    # If it's dark, they can't see
+    if not light.can_see(looker):
+        looker.msg("Nihil per tenebrās vidēre potes.")
+        return
+
+    view = _cached(container, looker)
+
+    hidden = {looker}
+    hidden.update(con for con in view['restricted'] if not con.access(looker, "view"))
+
+    exit_strings = view['exit_strings']
+    thing_strings = view['thing_strings']
+
+    if any(con in hidden for con, string in view['exits']):
+        exit_strings = [string for con, string in view['exits'] if con not in hidden]
+
+    if any(con in hidden for cons in view['things'].values() for con in cons):
+        things = {}
+        for key, cons in view['things'].items():
+            visible = [con for con in cons if con not in hidden]
+            if visible:
+                things[key] = visible
+        thing_strings = _thing_strings(things, looker)
+
+    users = [string for con, string in view['users'] if con not in hidden]
+
+    # get description, build string
+    desc = container.db.desc
+    users.extend(thing_strings)
+
+    return join(
+            NAME(name=container.get_display_name(looker)),
+            desc and DESC(desc=desc),
+            exit_strings and EXITS(exits=list_to_string(exit_strings)),
+            users and CONTENTS(contents=list_to_string(users)),
+            )
@@ -0,0 +1,91 @@
+# file mygame/utils/broadcast.py
+"""
+Telling everyone present about something that happened.
+
+Most actions are reported three ways: to the one who acts ('gladium
+cēpistī'), to the one acted upon ('Gaius tē ligāvit') and to everyone
+else in the room ('Gaius gladium cēpit'). broadcast() takes one template
+for each of these, with slots naming an object and the case it is wanted
+in, e.g.
+
+    broadcast(caller.location, caller, target,
+            to_actor="{target:acc_sg} {instrument:abl_sg} ligāvistī.",
+            to_target="{actor:nom_sg} tē {instrument:abl_sg} ligāvit.",
+            to_room="{actor:nom_sg} {target:acc_sg} {instrument:abl_sg} ligāvit",
+            instrument=ligature)
+
+Each template is filled in once, however many are listening, and the
+onlookers are all sent the same string; unlike msg_contents with a
+mapping, nothing is formatted per recipient. Delivery is still one msg()
+call per recipient, as with msg_contents, and each is sent with
+from_obj=actor so that at_msg_receive knows who acted. A slot without a case ('{actor}')
+gives the key; so does a case the object has no form for. Slots may
+also be given plain strings.
+"""
+
+from utils.templates import template as compiled
+
+class _Forms:
+    """ An object as it fills a template slot. """
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __format__(self, case):
+        if case:
+            formae = self.obj.db.formae
+            if formae and case in formae:
+                return formae[case][0]
+        return self.obj.key
+
+def _slot(value):
+    return value if isinstance(value, str) else _Forms(value)
+
+def render(template, **slots):
+    """
+    Fill in template with slots, which may be objects or strings.
+    """
+
+    return compiled(template).render({name: _slot(value) for name, value in slots.items() if value is not None})
+
+def broadcast(location, actor=None, target=None, to_actor=None, to_target=None,
+        to_room=None, exclude=(), **slots):
+    """
+    Report an event to the actor, the target and everyone else in location.
+
+    Args:
+        location (Object): where it happens; its contents see to_room
+        actor (Object): who acts, the {actor} slot; never sent to_room
+        target (Object): who or what is acted upon, the {target} slot; not
+            sent to_room if there is a to_target
+        to_actor, to_target, to_room (str): the templates, any of which
+            may be left out
+        exclude (Object or list): others who should not be sent to_room
+        **slots: further objects or strings the templates name, e.g.
+            instrument=ligature
+    """
+
+    mapping = {name: _slot(value) for name, value in slots.items() if value is not None}
+    if actor is not None:
+        mapping['actor'] = _Forms(actor)
+    if target is not None:
+        mapping['target'] = _Forms(target)
+
+    if to_actor and actor is not None:
+        actor.msg(compiled(to_actor).render(mapping), from_obj=actor)
+    if to_target and target is not None:
+        target.msg(compiled(to_target).render(mapping), from_obj=actor)
+
+    if to_room and location is not None:
+        text = compiled(to_room).render(mapping)
+        if not isinstance(exclude, (list, tuple, set)):
+            exclude = [exclude]
+        excluded = set(exclude)
+        excluded.add(actor)
+        if to_target:
+            excluded.add(target)
+        for obj in location.contents:
+            if obj not in excluded:
+                obj.msg(text=(text, {}), from_obj=actor)
@@ -0,0 +1,92 @@
+# file mygame/utils/bulk.py
+"""
+Taking, dropping and giving many things with one command:
+
+    cape omnia              everything that can be taken
+    relinque omnia gladiōs  every sword
+    cape 3 pōma             three apples
+
+parse() tells such arguments from a single thing ('cape gladium'),
+select() finds all the things meant with one lookup in the form index,
+and describe() names them in one phrase, grouping things of the same
+kind under their plural: 'gladium et 3 pōma'.
+
+The commands check hands and load for the whole lot before anything
+moves, make every move in one transaction and send one message.
+"""
+
+from utils.latin_language.case_index import cases_of
+from utils.latin_language.form_index import find
+from utils.latin_language.list_to_string import list_to_string
+
+# The word for 'everything'
+OMNIA = 'omnia'
+
+def parse(args):
+    """
+    Read args as many things. Returns (count, form), where count is None
+    for 'omnia' and form is None if no kind was named, or None if args
+    name a single thing.
+    """
+
+    words = args.split()
+    if not words or len(words) > 2:
+        return None
+    first = words[0].lower()
+    form = words[1] if len(words) == 2 else None
+
+    if first == OMNIA:
+        return None, form
+    if first.isdigit() and form and int(first) > 0:
+        return int(first), form
+    return None
+
+def select(caller, count, form, stuff, case='acc_pl'):
+    """
+    The things in stuff meant by (count, form) as parse() returned them,
+    in the order of stuff. Tells the caller and returns None if there are
+    none, or fewer than count, or form is not in case (in the singular
+    for a count of one).
+    """
+
+    if count == 1:
+        case = case.replace('_pl', '_sg')
+
+    if form is None:
+        things = list(stuff)
+    else:
+        things = find(form, stuff)
+        if not things:
+            caller.msg(f"'{form}' nōn invēnistī!")
+            return None
+        if things[0].db.formae and case not in cases_of(things[0], form):
+            caller.msg(f"(Did you mean '{things[0].db.formae[case][0]}'?)")
+            return None
+
+    if count is not None:
+        if len(things) < count:
+            caller.msg(f"Nōn sunt {count}, sed {len(things)}!")
+            return None
+        things = things[:count]
+
+    return things
+
+def describe(things, case='acc'):
+    """
+    Name things in case ('acc', 'dat', ...), those of the same kind
+    together under their plural, e.g. 'gladium et 3 pōma', in the order
+    each kind first appears.
+    """
+
+    groups = {}
+    for thing in things:
+        groups.setdefault(thing.key, []).append(thing)
+
+    names = []
+    for key, group in groups.items():
+        formae = group[0].db.formae
+        if len(group) == 1:
+            names.append(formae[f"{case}_sg"][0] if formae else key)
+        else:
+            names.append(f"{len(group)} {formae[f'{case}_pl'][0] if formae else key}")
+    return list_to_string(names)
@@ -0,0 +1,165 @@
+# file mygame/utils/containers.py
+"""
+What fits into a container (anything with a db.capax).
+
+A container's capax holds its room, max_vol and rem_vol in litres, and the
+x, y and z of its opening; a thing's physical holds its litra and, if it
+is rigid (rigēns), its own x, y and z. Rather than reading and sorting
+these on every put, the sorted dimensions of each are kept in ndb, and
+so is the room left in each container, so that fits() is a handful of
+comparisons.
+
+The room left, and the litra of a container that is not rigid and so
+swells with what is put into it, are worked out from what moves:
+entered() and left() are called from at_object_receive and
+at_object_leave of Rēs, alongside load.entered() and load.left(), which
+keep the container's massa. The live values are in ndb, seeded from
+capax['rem_vol'] and physical['litra']; checkpoint() hands those that
+have changed to utils.writebehind, which calls it before every flush.
+
+plan() decides at once which of many things go into a container, for
+'pōne omnia in <rem>'.
+"""
+
+from utils import writebehind
+
+# Why something does not fit
+VOLUME = 'volume'       # there is not room enough left
+HEIGHT = 'height'       # it is too long for the container, even half out
+SHAPE = 'shape'         # it is too wide or too thick for the opening
+
+# Containers whose room or litra have changed since the last checkpoint
+_changed = set()
+
+def _sorted(values):
+    if None in values:
+        return None
+    return tuple(sorted(values))
+
+def dimensions(obj):
+    """
+    The x, y and z of a rigid obj, smallest first, or None if obj is not
+    rigid and so takes the shape of what it is put into.
+    """
+
+    cached = obj.ndb.dimensions
+    if cached is None:
+        physical = obj.db.physical or {}
+        if physical.get('rigēns'):
+            cached = _sorted([physical.get('x'), physical.get('y'), physical.get('z')])
+        cached = cached or ()
+        obj.ndb.dimensions = cached
+    return cached or None
+
+def opening(container):
+    """
+    The x, y and z of container's opening, smallest first, and its y,
+    which is how far a thing may stick out of it.
+    """
+
+    cached = container.ndb.opening
+    if cached is None:
+        capax = container.db.capax
+        cached = (_sorted([capax.get('x'), capax.get('y'), capax.get('z')]), capax.get('y'))
+        container.ndb.opening = cached
+    return cached
+
+def remaining(container):
+    """
+    The room, in litres, left in container.
+    """
+
+    room = container.ndb.rem_vol
+    if room is None:
+        room = container.db.capax['rem_vol']
+        container.ndb.rem_vol = room
+    return room
+
+def litra(obj):
+    """
+    The volume of obj; for a container that is not rigid, including what
+    is in it.
+    """
+
+    volume = obj.ndb.litra
+    if volume is None:
+        volume = (obj.db.physical or {}).get('litra') or 0
+        obj.ndb.litra = volume
+    return volume
+
+def fits(container, obj, room=None):
+    """
+    Whether obj can be put into container, if room litres are left in it
+    (by default, as many as there are now). Returns None if it fits and
+    VOLUME, HEIGHT or SHAPE if not.
+    """
+
+    if room is None:
+        room = remaining(container)
+    if litra(obj) > room:
+        return VOLUME
+
+    size = dimensions(obj)
+    if size:
+        space, depth = opening(container)
+        if space:
+            # Allow for objects sticking at most half out of container
+            if size[2] / 2 > depth and size[2] > space[2]:
+                return HEIGHT
+            if size[1] > space[1] or size[0] > space[0]:
+                return SHAPE
+    return None
+
+def plan(container, things):
+    """
+    Decide which of things go into container together, smallest first
+    so that as many as possible do. Returns the things that fit, in the
+    order given, and a list of (thing, reason) for those that do not.
+    """
+
+    room = remaining(container)
+    packed, refused = set(), []
+    for thing in sorted(things, key=litra):
+        reason = fits(container, thing, room)
+        if reason:
+            refused.append((thing, reason))
+        else:
+            packed.add(thing)
+            room -= litra(thing)
+    return [thing for thing in things if thing in packed], refused
+
+def _adjust(container, change):
+    room = remaining(container) - change
+    container.ndb.rem_vol = min(room, container.db.capax.get('max_vol', room))
+    if not (container.db.physical or {}).get('rigēns'):
+        container.ndb.litra = litra(container) + change
+    _changed.add(container)
+
+def entered(container, obj):
+    """
+    Take the room obj needs from container. Call from at_object_receive.
+    """
+
+    if container.db.capax:
+        _adjust(container, litra(obj))
+
+def left(container, obj):
+    """
+    Give the room obj took back to container. Call from at_object_leave.
+    """
+
+    if container.db.capax:
+        _adjust(container, -litra(obj))
+
+@writebehind.before_flush
+def checkpoint():
+    """
+    Store the room left and litra of the containers that have changed.
+    """
+
+    while _changed:
+        container = _changed.pop()
+        if container.db.capax is not None:
+            writebehind.put(container, 'capax', 'rem_vol', container.ndb.rem_vol)
+        if container.db.physical is not None and container.ndb.litra is not None:
+            writebehind.put(container, 'physical', 'litra', container.ndb.litra)
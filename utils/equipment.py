@@ -0,0 +1,73 @@
+# file mygame/utils/equipment.py
+"""
+What a character holds and wears.
+
+What is in each hand is kept by utils.hands, in db.manūs and its copy in
+ndb; held(), in_hand() and holding() answer from there, so there is one
+record of it. Whether something is worn (db.geritur) or covered by
+another garment (db.covered_by) is stored on the thing itself, so finding
+a character's clothes would mean reading those Attributes on everything
+they carry. Instead the answer is kept in the character's ndb and worked
+out again only after changed(character), which is called when something
+enters or leaves the character and wherever those Attributes are set:
+Vestīmentum.wear and remove, and the commands that set them directly.
+Anything that sets them somewhere else should call changed() too.
+"""
+
+from utils import hands
+
+def changed(character):
+    """
+    Note that what character holds or wears has changed.
+    """
+
+    if character is not None:
+        character.ndb.equipment = None
+
+def _worn(character):
+    worn = character.ndb.equipment
+    if worn is None or any(thing.location != character for thing, _ in worn):
+        worn = character.ndb.equipment = [
+                (thing, thing.db.covered_by) for thing in character.contents if thing.db.geritur]
+    return worn
+
+def held(character):
+    """
+    The things character holds, the right hand first.
+    """
+
+    return [thing for thing in hands.slots(character).values() if thing is not None]
+
+def in_hand(character, hand):
+    """
+    What character holds in hand ('dextrā' or 'sinistrā'), or None.
+    """
+
+    return hands.in_hand(character, hand)
+
+def holding(character, typename):
+    """
+    The first thing of the given typename character holds, e.g.
+    holding(caller, 'Ligātūra'), or None.
+    """
+
+    for thing in held(character):
+        if thing.typename == typename:
+            return thing
+    return None
+
+def worn(character, exclude_covered=False):
+    """
+    The clothes character wears, in the order they are carried; without
+    those covered by other clothes if exclude_covered.
+    """
+
+    return [thing for thing, covered_by in _worn(character)
+            if not (exclude_covered and covered_by)]
+
+def covered_by(character, garment):
+    """
+    The clothes character wears under garment.
+    """
+
+    return [thing for thing, cover in _worn(character) if cover == garment]
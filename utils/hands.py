@@ -0,0 +1,131 @@
+# file mygame/utils/hands.py
+"""
+What a character holds in each hand.
+
+Each character has two hands, 'dextrā' and 'sinistrā', and what is in
+them is kept in a single Attribute, db.manūs, mapping each hand to the
+thing it holds or None. The thing held has the hand in db.tenētur. A
+copy of the slots is kept in ndb, so that asking which hands are free
+reads nothing from the database. This is the only record of what is held:
+utils.equipment answers from it too.
+
+hold() and release() change the slots and the thing's tenētur together,
+in one transaction, writing db.manūs once. left(), called from
+Persōna.at_object_leave, empties the hand of anything that leaves a
+character without being released. Characters made before
+db.manūs existed have their slots worked out from the tenētur of what
+they carry the first time they are asked.
+
+'Free' and 'full' hands are listed with the dominant hand
+(db.handedness) first, which is the one hold() uses when it is not told
+which hand to use.
+"""
+
+from django.db import transaction
+
+HANDS = ('dextrā', 'sinistrā')
+
+def _order(character):
+    if character.db.handedness == 'sinistrā':
+        return ('sinistrā', 'dextrā')
+    return HANDS
+
+def _store(character, slots):
+    character.db.manūs = slots
+    character.ndb.manūs = dict(slots)
+
+def slots(character):
+    """
+    A dict from each hand of character to what it holds, or None.
+    """
+
+    cached = character.ndb.manūs
+    if cached is None:
+        stored = character.db.manūs
+        if stored is None:
+            stored = dict.fromkeys(HANDS)
+            for thing in character.contents:
+                if thing.db.tenētur in stored:
+                    stored[thing.db.tenētur] = thing
+            character.db.manūs = stored
+        cached = character.ndb.manūs = dict(stored)
+    return cached
+
+def in_hand(character, hand):
+    """
+    What character holds in hand, or None.
+    """
+
+    return slots(character).get(hand)
+
+def free(character):
+    """
+    The hands of character that are empty, the dominant hand first.
+    """
+
+    held = slots(character)
+    return [hand for hand in _order(character) if held[hand] is None]
+
+def full(character):
+    """
+    The hands of character that hold something, the dominant hand first.
+    """
+
+    held = slots(character)
+    return [hand for hand in _order(character) if held[hand] is not None]
+
+def hold(character, thing, hand=None):
+    """
+    Put thing into hand of character, by default into the dominant hand
+    if it is free and the other if not. A thing character already holds
+    changes hands. Returns the hand, or None if it is not free.
+    """
+
+    new = dict(slots(character))
+    if hand is None:
+        empty = free(character)
+        if not empty:
+            return None
+        hand = empty[0]
+    elif new.get(hand, thing) not in (None, thing):
+        return None
+
+    for other, held in new.items():
+        if held == thing:
+            new[other] = None
+    new[hand] = thing
+
+    with transaction.atomic():
+        _store(character, new)
+        thing.db.tenētur = hand
+    return hand
+
+def release(character, thing):
+    """
+    Take thing out of the hand of character holding it. Returns the hand,
+    or None if character did not hold it.
+    """
+
+    new = dict(slots(character))
+    hand = None
+    for other, held in new.items():
+        if held == thing:
+            new[other] = None
+            hand = other
+
+    with transaction.atomic():
+        if hand is not None:
+            _store(character, new)
+        thing.db.tenētur = False
+    return hand
+
+def left(character, thing):
+    """
+    Empty the hand of character that held thing, which has left them.
+    Its tenētur is left alone, since it may be in someone else's hand
+    already. Call from at_object_leave.
+    """
+
+    held = slots(character)
+    if thing in held.values():
+        _store(character, {hand: None if other == thing else other for hand, other in held.items()})
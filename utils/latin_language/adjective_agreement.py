@@ -1,6 +1,13 @@
 # file mygame/utils/latin/adjective_agreement.py
 
-from utils.latin_language.adjective_inflections import us_a_um_inflections
+from functools import lru_cache
+
+from utils.latin_language.adjective_inflections import us_a_um_inflections, is_e_inflections, quī_quae_quod
+
+INFLECTIONS = {
+        'us_a_um': us_a_um_inflections,
+        'is_e': is_e_inflections,
+        }
 
 def us_a_um(case,gender):
     ending = us_a_um_inflections[case][gender]
@@ -15,3 +22,68 @@ def us_a_um2(case,gender,noun=None):
     ending = us_a_um_inflections[case][gender]
     return ending
 
+def always_plural(noun):
+    """
+    Whether noun only has plural forms (soleae, castra), judging by its
+    genitive.
+    """
+
+    return noun.db.formae['gen_sg'][0][-2:] == 'um'
+
+def noun_case(noun, case):
+    """
+    The gender and case an adjective agreeing with noun should take: plural
+    if noun is always plural.
+    """
+
+    if always_plural(noun):
+        case = case[:-2] + 'pl'
+
+    return noun.db.sexus, case
+
+@lru_cache(maxsize=4096)
+def adjective(stem, case='nom_sg', gender='māre', declension='us_a_um', nom=None):
+    """
+    Decline an adjective or participle.
+
+    Args:
+        stem (str): the stem, e.g. 'ligāt' (ligātus) or 'ardent' (ardēns)
+        case (str): a case label such as 'nom_sg' or 'acc_pl'
+        gender (str): 'māre', 'muliebre' or 'neutrum'
+        declension (str): 'us_a_um' for first/second-declension adjectives
+            and perfect participles, 'is_e' for third-declension adjectives
+            and present participles
+        nom (str): the nominative singular of a one-termination
+            third-declension adjective ('ardēns'), which has no regular
+            ending
+
+    Returns:
+        form (str): e.g. adjective('ligāt', 'nom_sg', 'muliebre') == 'ligāta'
+    """
+
+    if nom and case in ('nom_sg', 'voc_sg'):
+        return nom
+    if nom and case == 'acc_sg' and gender == 'neutrum':
+        return nom
+
+    return stem + INFLECTIONS[declension][case][gender]
+
+def agree(stem, noun, case='nom_sg', declension='us_a_um', nom=None):
+    """
+    Decline an adjective or participle to agree with noun, an object with
+    db.sexus and db.formae, e.g. agree('ligāt', target) -> 'ligātus'.
+    """
+
+    gender, case = noun_case(noun, case)
+
+    return adjective(stem, case, gender, declension, nom)
+
+def relative(noun, case='nom_sg'):
+    """
+    The relative pronoun (quī, quae, quod) referring back to noun, in the
+    case it has in its own clause.
+    """
+
+    gender, case = noun_case(noun, case.replace('voc', 'nom'))
+
+    return quī_quae_quod[case][gender]
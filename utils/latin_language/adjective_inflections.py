@@ -8,7 +8,7 @@ us_a_um_inflections = {
             },
         'gen_sg' : {
             'māre' : 'ī',
-            'muliebre' : 'a',
+            'muliebre' : 'ae',
             'neutrum' : 'ī',
             },
         'dat_sg' : {
@@ -62,3 +62,123 @@ us_a_um_inflections = {
             'neutrum' : 'a',
             },
         }
+
+# Third-declension (i-stem) adjectives and present participles. For
+# one-termination adjectives (ardēns, ferōx) the nominative and vocative
+# singular, and the neuter accusative singular, are the dictionary form.
+is_e_inflections = {
+        'nom_sg' : {
+            'māre' : 'is',
+            'muliebre' : 'is',
+            'neutrum' : 'e',
+            },
+        'gen_sg' : {
+            'māre' : 'is',
+            'muliebre' : 'is',
+            'neutrum' : 'is',
+            },
+        'dat_sg' : {
+            'māre' : 'ī',
+            'muliebre' : 'ī',
+            'neutrum' : 'ī',
+            },
+        'acc_sg' : {
+            'māre' : 'em',
+            'muliebre' : 'em',
+            'neutrum' : 'e',
+            },
+        'abl_sg' : {
+            'māre' : 'ī',
+            'muliebre' : 'ī',
+            'neutrum' : 'ī',
+            },
+        'voc_sg' : {
+            'māre' : 'is',
+            'muliebre' : 'is',
+            'neutrum' : 'e',
+            },
+        'nom_pl' : {
+            'māre' : 'ēs',
+            'muliebre' : 'ēs',
+            'neutrum' : 'ia',
+            },
+        'gen_pl' : {
+            'māre' : 'ium',
+            'muliebre' : 'ium',
+            'neutrum' : 'ium',
+            },
+        'dat_pl' : {
+            'māre' : 'ibus',
+            'muliebre' : 'ibus',
+            'neutrum' : 'ibus',
+            },
+        'acc_pl' : {
+            'māre' : 'ēs',
+            'muliebre' : 'ēs',
+            'neutrum' : 'ia',
+            },
+        'abl_pl' : {
+            'māre' : 'ibus',
+            'muliebre' : 'ibus',
+            'neutrum' : 'ibus',
+            },
+        'voc_pl' : {
+            'māre' : 'ēs',
+            'muliebre' : 'ēs',
+            'neutrum' : 'ia',
+            },
+        }
+
+# The relative pronoun, in full
+quī_quae_quod = {
+        'nom_sg' : {
+            'māre' : 'quī',
+            'muliebre' : 'quae',
+            'neutrum' : 'quod',
+            },
+        'gen_sg' : {
+            'māre' : 'cuius',
+            'muliebre' : 'cuius',
+            'neutrum' : 'cuius',
+            },
+        'dat_sg' : {
+            'māre' : 'cui',
+            'muliebre' : 'cui',
+            'neutrum' : 'cui',
+            },
+        'acc_sg' : {
+            'māre' : 'quem',
+            'muliebre' : 'quam',
+            'neutrum' : 'quod',
+            },
+        'abl_sg' : {
+            'māre' : 'quō',
+            'muliebre' : 'quā',
+            'neutrum' : 'quō',
+            },
+        'nom_pl' : {
+            'māre' : 'quī',
+            'muliebre' : 'quae',
+            'neutrum' : 'quae',
+            },
+        'gen_pl' : {
+            'māre' : 'quōrum',
+            'muliebre' : 'quārum',
+            'neutrum' : 'quōrum',
+            },
+        'dat_pl' : {
+            'māre' : 'quibus',
+            'muliebre' : 'quibus',
+            'neutrum' : 'quibus',
+            },
+        'acc_pl' : {
+            'māre' : 'quōs',
+            'muliebre' : 'quās',
+            'neutrum' : 'quae',
+            },
+        'abl_pl' : {
+            'māre' : 'quibus',
+            'muliebre' : 'quibus',
+            'neutrum' : 'quibus',
+            },
+        }
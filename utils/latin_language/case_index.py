@@ -0,0 +1,43 @@
+# file mygame/utils/latin_language/case_index.py
+"""
+A reverse index from the normalized forms of a noun to the case and number
+labels ('acc_sg', 'dat_pl', ...) each form can stand for, so that a command
+can tell which case the player actually used: 'puellae' is gen_sg, dat_sg,
+nom_pl or voc_pl; 'puellam' is only acc_sg.
+
+The index is built from db.formae the first time it is needed and kept in
+ndb. populate_lemmata drops it whenever the forms of an object change.
+"""
+
+from utils.latin_language.normalize import normalize
+
+def case_index(obj):
+    """
+    Return the index of obj: normalized form -> frozenset of labels.
+    """
+
+    index = obj.ndb.case_index
+
+    if index is None:
+        cases = {}
+        for label, forms in (obj.db.formae or {}).items():
+            for form in forms:
+                cases.setdefault(normalize(form), set()).add(label)
+        index = {form: frozenset(labels) for form, labels in cases.items()}
+        obj.ndb.case_index = index
+
+    return index
+
+def cases_of(obj, form):
+    """
+    The labels form can stand for as a form of obj (empty if none).
+    """
+
+    return case_index(obj).get(normalize(form), frozenset())
+
+def forget(obj):
+    """
+    Drop the index of obj, e.g. after db.formae has changed.
+    """
+
+    obj.ndb.case_index = None
@@ -1,13 +1,46 @@
 # file /mygame/utils/latin/check_grammar.py
 
-from unidecode import unidecode
+from itertools import permutations
+
+from utils.latin_language.case_index import cases_of
+from utils.latin_language.form_index import find
 
 def check_case(caller, obj, intended_target, case):
     """ Notify the caller if the target was found but the wrong case was specified """
 
-    lower_case = [x.lower() for x in obj.db.formae[case]]
-    unidecoded_lower_case = [unidecode(x) for x in lower_case]
-    lower_case += unidecoded_lower_case
-    if intended_target.strip().lower() not in lower_case:
+    if case not in cases_of(obj, intended_target):
         caller.msg(f"(Did you mean '{obj.db.formae[case][0]}'?)")
         return False
+
+def assign_cases(args, cases, stuff):
+    """
+    Work out from their inflection which of args stands in which of cases,
+    e.g. for 'da Marcō gladium' which word is the accusative and which the
+    dative.
+
+    Args:
+        args (list): the words the player typed, one per role
+        cases (tuple): the labels of the roles, e.g. ('acc_sg', 'dat_sg')
+        stuff (list): the objects the words may refer to
+
+    Returns:
+        args, reordered to line up with cases, if exactly one ordering fits
+        the inflection of the objects they name; otherwise None, and the
+        caller has to fall back on other clues.
+    """
+
+    if len(args) != len(cases):
+        return None
+
+    possible = {}
+    for arg in args:
+        possible[arg] = set()
+        for obj in find(arg.split('-')[-1], stuff):
+            possible[arg] |= cases_of(obj, arg.split('-')[-1])
+
+    fits = [
+            ordering for ordering in permutations(args)
+            if all(case in possible[arg] for arg, case in zip(ordering, cases))
+            ]
+
+    return list(fits[0]) if len(fits) == 1 else None
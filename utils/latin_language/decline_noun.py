@@ -1,5 +1,97 @@
 # file mygame/utils/latin_language/decline_noun.py
 
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+# The number of distinct lemmata whose paradigms are kept in memory
+PARADIGM_CACHE_SIZE = 4096
+
+# Raise whenever the declension rules below (the endings, I_STEMS or the
+# declension methods) change, so that paradigms stored by the lexicon are
+# declined again.
+RULES_VERSION = 1
+
+LABELS = ['nom_sg','gen_sg','dat_sg','acc_sg','abl_sg','voc_sg','nom_pl','gen_pl','dat_pl','acc_pl','abl_pl','voc_pl']
+
+# Endings added to the base of a lemma, keyed by the class returned from
+# id_declension(). Singular classes (1-5) supply the forms after the
+# nominative and genitive; the always-plural classes (6-9) supply all twelve.
+ENDINGS = {
+        1: ('ae', 'am', 'ā', 'a', 'ae', 'ārum', 'īs', 'ās', 'īs', 'ae'),
+        2: ('ō', 'um','ō','e','ī','ōrum','īs','ōs','īs','ī'),
+        3: ('ī','em','e','blah','ēs','um','ibus','ēs','ibus','ēs'),
+        4: ('uī','um','ū','us','ūs','uum','ibus','ūs','ibus','ūs'),
+        5: ('ī', 'm', '', 's', 's', 'rum', 'bus', 's', 'bus', 's'),
+        6: ('ae','ārum','īs','ās','īs','ae','ae','ārum','īs','ās','īs','ae'),
+        7: ('ī','ōrum','īs','ōs','īs','ī','ī','ōrum','īs','ōs','īs','ī'),
+        8: ('a','ōrum','īs','a','īs','a','a','ōrum','īs','a','īs','a'),
+        9: ('ēs','um','ibus','ēs','ibus','ēs','ēs','um','ibus','ēs','ibus','ēs'),
+        }
+
+THIRD_PLURAL_NEUTER = ('a','um','ibus','a','ibus','a','a','um','ibus','a','ibus','a')
+
+VOWELS = 'aeiouyāēīōūȳ'
+DIPHTHONGS = ('ae', 'au', 'oe', 'eu')
+
+# Third-declension lemmata whose i-stem status is known in advance. This is
+# consulted before the syllable-counting rule, and also covers the nouns that
+# the rule gets wrong (canis, iuvenis, senex, ...).
+I_STEMS = {
+        ('animal', 'animālis'): True,
+        ('ars', 'artis'): True,
+        ('Caesō', 'Caesōnis'): False,
+        ('canis', 'canis'): False,
+        ('cīvis', 'cīvis'): True,
+        ('fīnis', 'fīnis'): True,
+        ('frāter', 'frātris'): False,
+        ('iuvenis', 'iuvenis'): False,
+        ('lūmen', 'lūminis'): False,
+        ('mare', 'maris'): True,
+        ('māter', 'mātris'): False,
+        ('mōns', 'montis'): True,
+        ('nāvis', 'nāvis'): True,
+        ('nox', 'noctis'): True,
+        ('Opiter', 'Opitris'): False,
+        ('pars', 'partis'): True,
+        ('pater', 'patris'): False,
+        ('rēx', 'rēgis'): False,
+        ('senex', 'senis'): False,
+        ('Sertor', 'Sertōris'): False,
+        ('urbs', 'urbis'): True,
+        }
+
+@lru_cache(maxsize=PARADIGM_CACHE_SIZE)
+def count_syllables(word):
+    """
+    Count the syllables of a Latin word by counting its vowel nuclei.
+
+    Diphthongs count once, the 'u' after 'q' is not a vowel, and an 'i'
+    standing before a vowel at the start of a word or between vowels is
+    consonantal (iānua, maior). This is all third_declension needs to
+    compare the nominative and genitive, so cltk is not required.
+    """
+
+    word = word.lower()
+    count = 0
+    i = 0
+
+    while i < len(word):
+        letter = word[i]
+        if letter not in VOWELS:
+            i += 1
+            continue
+        if letter == 'u' and i > 0 and word[i-1] == 'q':
+            i += 1
+            continue
+        if letter == 'i' and i + 1 < len(word) and word[i+1] in VOWELS:
+            if i == 0 or word[i-1] in VOWELS:
+                i += 1
+                continue
+        count += 1
+        i += 2 if word[i:i+2] in DIPHTHONGS else 1
+
+    return count
+
 class DeclineNoun:
     """
     This class requires a nominative singular, genitive singular, and gender
@@ -16,8 +108,19 @@ class DeclineNoun:
         self.gen = gen
         self.gender = gender
         self.irregular = irregular
+        self._declension = None
 
     def id_declension(self):
+        """
+        Return [declension class, base] for this lemma, working it out
+        only the first time it is asked for.
+        """
+
+        if self._declension is None:
+            self._declension = self._classify()
+        return self._declension
+
+    def _classify(self):
 
         if self.gen[-2:] == "ae":
             return [1, self.gen[:-2]]
@@ -43,12 +146,7 @@ class DeclineNoun:
 
         base = DeclineNoun.id_declension(self)[1] 
 
-        endings = ['ae', 'am', 'ā', 'a', 'ae', 'ārum', 'īs', 'ās', 'īs', 'ae']
-
-        forms = [self.nom, self.gen]
-
-        for i in endings:
-            forms.append(base + i)
+        forms = [self.nom, self.gen] + [base + i for i in ENDINGS[1]]
 
         return forms
 
@@ -56,12 +154,7 @@ class DeclineNoun:
 
         base = DeclineNoun.id_declension(self)[1] 
 
-        endings = ['ō', 'um','ō','e','ī','ōrum','īs','ōs','īs','ī']
-
-        forms = [self.nom,self.gen]
-
-        for i in endings:
-            forms.append(base + i)
+        forms = [self.nom, self.gen] + [base + i for i in ENDINGS[2]]
 
         if base[-1] == 'r':
             forms[5] = self.nom
@@ -80,38 +173,28 @@ class DeclineNoun:
 
     def third_declension(self):
 
-#        from cltk.stem.latin.syllabifier import Syllabifier
-#       Above deprecated with newer version of cltk
-        from cltk.phonology.lat.syllabifier import syllabify
-
-#        syllabifier = Syllabifier()
-
         vowels = ['a','e','i','o','u','ā','ē','ī','ō','ū']
 
         base = DeclineNoun.id_declension(self)[1]
 
-        forms = [self.nom,self.gen]
-
-        endings = ['ī','em','e','blah','ēs','um','ibus','ēs','ibus','ēs']
-
-        for i in endings:
-            forms.append(base + i)
+        forms = [self.nom, self.gen] + [base + i for i in ENDINGS[3]]
 
         forms[5] = self.nom
 
-#        nom_syllable = len(syllabifier.syllabify(self.nom))
-        nom_syllable = len(syllabify(self.nom))
-#        gen_syllable = len(syllabifier.syllabify(self.gen))
-        gen_syllable = len(syllabify(self.gen))
+        i_stem = I_STEMS.get((self.nom, self.gen))
+
+        if i_stem is None:
+            i_stem = False
 
-        i_stem = False
+            nom_syllable = count_syllables(self.nom)
+            gen_syllable = count_syllables(self.gen)
 
-        if nom_syllable == gen_syllable:
-            if self.nom[-2:] in ['is', 'es']:
-                i_stem = True
-        elif self.nom[-1] in ['x', 's']:
-             if base[-1] not in vowels and base[-2] not in vowels:
-                 i_stem = True
+            if nom_syllable == gen_syllable:
+                if self.nom[-2:] in ['is', 'es']:
+                    i_stem = True
+            elif self.nom[-1] in ['x', 's']:
+                 if base[-1] not in vowels and base[-2] not in vowels:
+                     i_stem = True
 
         if i_stem == True:
 
@@ -137,12 +220,7 @@ class DeclineNoun:
 
         base = DeclineNoun.id_declension(self)[1]
 
-        endings = ['uī','um','ū','us','ūs','uum','ibus','ūs','ibus','ūs']
-
-        forms = [self.nom,self.gen]
-
-        for i in endings:
-            forms.append(base + i)
+        forms = [self.nom, self.gen] + [base + i for i in ENDINGS[4]]
 
 #        if int(self.gender) == 3:
         if self.gender == 'neutrum':
@@ -161,12 +239,7 @@ class DeclineNoun:
 
         base = base[:-1] + "ē"
 
-        endings = ['ī', 'm', '', 's', 's', 'rum', 'bus', 's', 'bus', 's']
-
-        forms = [self.nom,self.gen]
-
-        for i in endings:
-            forms.append(base + i)
+        forms = [self.nom, self.gen] + [base + i for i in ENDINGS[5]]
 
         forms[3] = forms[3][:-2] + 'em'
 
@@ -180,88 +253,143 @@ class DeclineNoun:
 
         base = DeclineNoun.id_declension(self)[1]
 
-        endings = ['ae','ārum','īs','ās','īs','ae','ae','ārum','īs','ās','īs','ae']
+        return [base + i for i in ENDINGS[6]]
 
-        forms = []
+    def second_plural_masc(self):
 
-        for i in endings:
-            forms.append(base + i)
+        base = DeclineNoun.id_declension(self)[1]
 
-        return forms
+        return [base + i for i in ENDINGS[7]]
 
-    def second_plural_masc(self):
+    def second_plural_neut(self):
 
         base = DeclineNoun.id_declension(self)[1]
 
-        endings = ['ī','ōrum','īs','ōs','īs','ī','ī','ōrum','īs','ōs','īs','ī']
+        return [base + i for i in ENDINGS[8]]
 
-        forms = []
+    def third_plural(self):
 
-        for i in endings:
-            forms.append(base + i)
+        base = DeclineNoun.id_declension(self)[1]
 
-        return forms
+        if self.gender == 'neutrum':
+            endings = THIRD_PLURAL_NEUTER
+        else:
+            endings = ENDINGS[9]
 
-    def second_plural_neut(self):
+        return [base + i for i in endings]
 
-        base = DeclineNoun.id_declension(self)[1]
+    def decline(self):
+        """
+        Return the twelve forms of this lemma in the order of LABELS.
+        """
 
-        endings = ['a','ōrum','īs','a','īs','a','a','ōrum','īs','a','īs','a']
+        declension = DeclineNoun.id_declension(self)[0]
+        return DECLENSIONS.get(declension, DeclineNoun.third_plural)(self)
 
-        forms = []
+    def make_paradigm(self):
+        """
+        Return a dictionary of the forms of this lemma, keyed by LABELS.
+        Paradigms are shared through a process-wide cache, so the same
+        lemma is only ever declined once.
+        """
+
+        forms = _cached_forms(self.nom, self.gen, self.gender, self.irregular)
+
+        return dict(zip(LABELS, forms))
+
+DECLENSIONS = {
+        1: DeclineNoun.first_declension,
+        2: DeclineNoun.second_declension,
+        3: DeclineNoun.third_declension,
+        4: DeclineNoun.fourth_declension,
+        5: DeclineNoun.fifth_declension,
+        6: DeclineNoun.first_plural,
+        7: DeclineNoun.second_plural_masc,
+        8: DeclineNoun.second_plural_neut,
+        }
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# (nom, gen, gender, irregular) -> forms, the most recently used last
+_paradigms = OrderedDict()
+_hits = _misses = 0
+
+def cached_forms(nom, gen, gender, irregular=False):
+    """
+    The twelve forms of a lemma if its paradigm is in the cache, else
+    None. Nothing is declined.
+    """
 
-        for i in endings:
-            forms.append(base + i)
+    global _hits, _misses
 
-        return forms
+    key = (nom, gen, gender, irregular)
+    forms = _paradigms.get(key)
+    if forms is None:
+        _misses += 1
+        return None
+    _hits += 1
+    _paradigms.move_to_end(key)
+    return forms
 
-    def third_plural(self):
+def cache_forms(nom, gen, gender, forms, irregular=False):
+    """
+    Put the twelve forms of a lemma, however they were found, into the
+    cache, dropping the least recently used paradigm if it is full.
+    """
 
-        base = DeclineNoun.id_declension(self)[1]
+    forms = tuple(forms)
+    _paradigms[(nom, gen, gender, irregular)] = forms
+    if len(_paradigms) > PARADIGM_CACHE_SIZE:
+        _paradigms.popitem(last=False)
+    return forms
 
-        if self.gender == 'neutrum':
-            endings = ['a','um','ibus','a','ibus','a','a','um','ibus','a','ibus','a']
-        else:
-            endings = ['ēs','um','ibus','ēs','ibus','ēs','ēs','um','ibus','ēs','ibus','ēs']
+def _cached_forms(nom, gen, gender, irregular):
+    forms = cached_forms(nom, gen, gender, irregular)
+    if forms is None:
+        forms = cache_forms(nom, gen, gender, DeclineNoun(nom, gen, gender, irregular).decline(), irregular)
+    return forms
 
-        forms = []
+def paradigm_cache_info():
+    """
+    Hits, misses, maximum size and current size of the paradigm cache.
+    """
+    return CacheInfo(_hits, _misses, PARADIGM_CACHE_SIZE, len(_paradigms))
 
-        for i in endings:
-            forms.append(base + i)
+def decline_many(lemmata):
+    """
+    Decline a batch of lemmata in one pass.
 
-        return forms
+    Args:
+        lemmata (iterable): (nom, gen, gender) tuples, or (nom, gen,
+            gender, irregular), e.g. drawn from the prototypes or from
+            gens_class_praenomina.name_data.
 
-    def make_paradigm(self):
-        
-        labels = ['nom_sg','gen_sg','dat_sg','acc_sg','abl_sg','voc_sg','nom_pl','gen_pl','dat_pl','acc_pl','abl_pl','voc_pl']
-
-        forms = []
-
-        if DeclineNoun.id_declension(self)[0] == 1:
-            forms = self.first_declension()
-        elif DeclineNoun.id_declension(self)[0] == 2:
-            forms = DeclineNoun.second_declension(self)
-        elif DeclineNoun.id_declension(self)[0] == 3:
-            forms = DeclineNoun.third_declension(self)
-        elif DeclineNoun.id_declension(self)[0] == 4:
-            forms = DeclineNoun.fourth_declension(self)
-        elif DeclineNoun.id_declension(self)[0] == 5:
-            forms = DeclineNoun.fifth_declension(self)
-        elif DeclineNoun.id_declension(self)[0] == 6:
-            forms = DeclineNoun.first_plural(self)
-        elif DeclineNoun.id_declension(self)[0] == 7:
-            forms = DeclineNoun.second_plural_masc(self)
-        elif DeclineNoun.id_declension(self)[0] == 8:
-            forms = DeclineNoun.second_plural_neut(self)
-        else:
-            forms = DeclineNoun.third_plural(self)
+    Returns:
+        columns (dict): one tuple per label in LABELS, holding that form
+            for every lemma in the order given, so that
+            columns['acc_sg'][i] is the accusative singular of lemmata[i].
 
-        declension = {}
-        for index,value in enumerate(labels):
-            declension.update({value: forms[index]})
+    Duplicate lemmata are only declined once. The batch deliberately
+    bypasses the paradigm cache so that a bulk import does not evict the
+    lemmata in everyday use.
+    """
+
+    lemmata = [tuple(lemma) for lemma in lemmata]
+
+    declined = {lemma: DeclineNoun(*lemma).decline() for lemma in dict.fromkeys(lemmata)}
+    rows = [declined[lemma] for lemma in lemmata]
+
+    return dict(zip(LABELS, zip(*rows))) if rows else {label: () for label in LABELS}
+
+def clear_paradigm_cache():
+    """
+    Empty the paradigm cache, e.g. after the declension rules change.
+    """
 
+    global _hits, _misses
 
-        return declension
+    _paradigms.clear()
+    _hits = _misses = 0
 
 if __name__ == '__main__':
     word = DeclineNoun('puella','puellae','muliebre')
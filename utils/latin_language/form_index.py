@@ -0,0 +1,142 @@
+# file mygame/utils/latin_language/form_index.py
+"""
+An index, kept on each container (room, character, bag), from the surface
+forms of the things inside it to the things themselves, so that which_one
+can find 'gladiō' (or 'gladio') with a dictionary lookup instead of
+reading every alias of every object on every command.
+
+The index lives in the container's ndb and is built from its contents the
+first time it is needed. After that it is kept up to date by
+at_object_receive and at_object_leave, and by reindex() whenever an
+object's aliases change.
+
+Commands say where to look with within(), e.g.
+
+    which_one(self.args, caller, within(caller, caller.location))
+
+and find() then looks the form up in the index of each of those
+containers, which costs the same however many things are there. A list of
+objects may be given instead, for the few commands that search a list
+they have filtered or put together themselves; that is read once into a
+dictionary, so it costs time in proportion to its length.
+
+An object that leaves a container without passing through the hooks
+(moved with obj.location = ...) is skipped, since it is no longer there.
+One that arrives that way is not found in a container whose index is
+already built until add() is called for it; tests that place things like
+that should do so before the first lookup, when the index is built from
+the contents.
+"""
+
+from collections import namedtuple
+
+from utils.latin_language.normalize import normalize
+
+# The containers to search, in order, and a test the things found must
+# pass (or None); see within()
+Within = namedtuple('Within', ['containers', 'accept'])
+
+def surface_forms(obj):
+    """
+    Every normalized string under which obj can be addressed: its key and
+    all of its aliases.
+    """
+
+    return frozenset(normalize(form) for form in [obj.key] + obj.aliases.all())
+
+def get_index(container):
+    """
+    Return (forms, members) for container, building them if need be.
+    forms maps a surface form to the objects answering to it, members maps
+    each indexed object to its surface forms.
+    """
+
+    if container.ndb.form_index is None:
+        container.ndb.form_index = ({}, {})
+        for obj in container.contents:
+            add(container, obj)
+
+    return container.ndb.form_index
+
+def add(container, obj):
+    """
+    Index obj under container. Nothing is done if container has no index
+    yet; it will pick obj up when it is built.
+    """
+
+    if container is None or container.ndb.form_index is None:
+        return
+
+    forms, members = container.ndb.form_index
+
+    if obj in members:
+        remove(container, obj)
+
+    obj_forms = surface_forms(obj)
+    members[obj] = obj_forms
+    for form in obj_forms:
+        forms.setdefault(form, []).append(obj)
+
+def remove(container, obj):
+    """
+    Drop obj from the index of container.
+    """
+
+    if container is None or container.ndb.form_index is None:
+        return
+
+    forms, members = container.ndb.form_index
+
+    for form in members.pop(obj, ()):
+        matches = forms.get(form)
+        if matches:
+            matches[:] = [match for match in matches if match != obj]
+            if not matches:
+                del forms[form]
+
+def reindex(obj):
+    """
+    Refresh the entry of obj in the index of its location, e.g. after its
+    aliases have changed.
+    """
+
+    add(obj.location, obj)
+
+def within(*containers, accept=None):
+    """
+    Where find() should look: in containers, in the order given, keeping
+    only the things for which accept(thing) is true if accept is given.
+    """
+
+    return Within(tuple(container for container in containers if container is not None), accept)
+
+def find(form, stuff):
+    """
+    Return the objects answering to form in stuff, which is either what
+    within() returned or a list of objects, in the order of stuff.
+    """
+
+    form = normalize(form)
+
+    if isinstance(stuff, Within):
+        found = []
+        for container in stuff.containers:
+            for match in get_index(container)[0].get(form, ()):
+                if match.location == container and (stuff.accept is None or stuff.accept(match)):
+                    found.append(match)
+        return found
+
+    position = {}
+    for index, item in enumerate(stuff):
+        position.setdefault(item, index)
+
+    found = set()
+    for container in {item.location for item in position}:
+        if container is None:
+            found.update(item for item in position
+                         if item.location is None and form in surface_forms(item))
+        else:
+            found.update(match for match in get_index(container)[0].get(form, ())
+                         if match in position)
+
+    return sorted(found, key=position.get)
@@ -1,16 +1,21 @@
 # file mygame/utils/latin_language/get_numbered_name.py
 
-from evennia.utils import ansi
+# Alias category holding the singular and (count-free) plural of the key
+PLURAL_KEY = "plural_key"
 
 def get_numbered_name(self, count, looker, **kwargs):
     """
     Return the numbered (singular / plural) forms of this object's key.
-    This is by default called by return appearance and is used for 
-    grouping multiple same-named of this object. Note that this will 
+    This is by default called by return appearance and is used for
+    grouping multiple same-named of this object. Note that this will
     be called on *every* member of a group even though the plural name
     will be only shown once. Also the singular display version, such as
     'an apple', 'a tree' is determined from this method.
 
+    Unlike Evennia's version this never writes to the database, so that
+    looking at a room stays read-only; the plural aliases are kept up to
+    date by refresh_plural_aliases() when the forms of the object change.
+
     Args:
         count (int): Number of objects of this type
         looker (Object): onlooker. Not used by default
@@ -21,24 +26,31 @@ def get_numbered_name(self, count, looker, **kwargs):
         singular (str): the singular form to display
         plural (str): the determined plural form of the key, including count.
     """
-    key = kwargs.get("key", self.key)
-    key = ansi.ANSIString(key) # Needed to allow inflection of colored names
-    if self.db.formae:
-        plural = self.db.formae['nom_pl'][0]
-    else:
-        plural = self.key
-
-    plural = f"{count} {plural}"
-
-    singular = self.key
-
-    if not self.aliases.get(plural, category="plural_key"):
-        # We need to wipe any old plurals/an/a in case key changed in the interim
-        self.aliases.clear(category="plural_key")
-        self.aliases.add(plural, category="plural_key")
-
-        # save teh singular form as an aliases here too so we can display "an egg"
-        # and also look at "an egg"
-        self.aliases.add(singular, category="plural_key")
-        
-    return singular, plural
+
+    return self.key, f"{count} {plural_of(self)}"
+
+def plural_of(obj):
+    """
+    The nominative plural of obj, or its key if it is not a Latin noun.
+    """
+
+    if obj.db.formae:
+        return obj.db.formae['nom_pl'][0]
+    return obj.key
+
+def refresh_plural_aliases(obj):
+    """
+    Store the singular and plural of obj as aliases in the plural_key
+    category, so 'gladiī' finds a sword, writing only if they changed.
+    Returns True if anything was written.
+    """
+
+    wanted = {obj.key.lower(), plural_of(obj).lower()}
+    current = set(obj.aliases.get(category=PLURAL_KEY, return_list=True) or [])
+
+    if wanted != current:
+        obj.aliases.clear(category=PLURAL_KEY)
+        obj.aliases.add(sorted(wanted), category=PLURAL_KEY)
+        return True
+
+    return False
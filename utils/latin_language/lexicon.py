@@ -0,0 +1,223 @@
+# file mygame/utils/latin_language/lexicon.py
+"""
+An on-disk store of noun paradigms, so that typeclasses loading at server
+start or reload look their forms up instead of declining them again.
+
+The lexicon is a single SQLite file, keyed by the dictionary lemma
+(nominative, genitive, gender) with one column per case label. It is
+memory-mapped, so repeated lookups are served from the page cache.
+paradigm() looks in DeclineNoun's in-memory paradigm cache first and reads
+the file only for lemmata not there; lemmata that are not in the file yet
+either are declined with DeclineNoun and written back, so the lexicon
+grows as new nouns appear in the game.
+
+The file records the RULES_VERSION of decline_noun it was written with
+(as SQLite's user_version). When the rules change, every paradigm in it is
+declined again the first time it is opened.
+
+The file lives at settings.LATIN_LEXICON_FILE and can be rebuilt at any
+time by deleting it and calling build_lexicon().
+"""
+
+import os
+import sqlite3
+
+from utils.latin_language.decline_noun import (
+        DeclineNoun, LABELS, RULES_VERSION, cache_forms, cached_forms, decline_many)
+
+# How much of the lexicon file SQLite may map into memory
+MMAP_SIZE = 64 * 1024 * 1024
+
+_CREATE = (
+        "CREATE TABLE IF NOT EXISTS lexicon ("
+        "nom TEXT, gen TEXT, gender TEXT, "
+        + ", ".join(f"{label} TEXT" for label in LABELS)
+        + ", PRIMARY KEY (nom, gen, gender)) WITHOUT ROWID"
+        )
+_SELECT = (
+        "SELECT " + ", ".join(LABELS)
+        + " FROM lexicon WHERE nom = ? AND gen = ? AND gender = ?"
+        )
+_INSERT = (
+        "INSERT OR IGNORE INTO lexicon VALUES ("
+        + ", ".join("?" * (len(LABELS) + 3)) + ")"
+        )
+_REPLACE = _INSERT.replace("OR IGNORE", "OR REPLACE")
+
+_connection = None
+
+def lexicon_file():
+    """
+    Path of the lexicon file, from settings.LATIN_LEXICON_FILE if given.
+    """
+
+    from django.conf import settings
+
+    default = os.path.join(settings.GAME_DIR, 'server', 'lexicon.db')
+    return getattr(settings, 'LATIN_LEXICON_FILE', default)
+
+def connect(path=None):
+    """
+    Return the process-wide connection to the lexicon, opening (and if
+    need be creating) the file the first time. Returns None if the file
+    cannot be opened, in which case callers simply decline as before.
+    """
+
+    global _connection
+
+    if _connection is None:
+        try:
+            connection = sqlite3.connect(path or lexicon_file(), check_same_thread=False)
+            connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(_CREATE)
+            connection.commit()
+            _update_rules(connection)
+        except sqlite3.Error:
+            return None
+        _connection = connection
+
+    return _connection
+
+def _update_rules(connection):
+    """
+    Decline every lemma in the lexicon again if it was written with other
+    declension rules than the current ones.
+    """
+
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version == RULES_VERSION:
+        return
+
+    lemmata = connection.execute("SELECT nom, gen, gender FROM lexicon").fetchall()
+    with connection:
+        if lemmata:
+            columns = decline_many(lemmata)
+            connection.executemany(
+                    _REPLACE,
+                    ((*lemma, *(columns[label][i] for label in LABELS))
+                        for i, lemma in enumerate(lemmata))
+                    )
+        connection.execute(f"PRAGMA user_version = {RULES_VERSION}")
+
+def close():
+    """
+    Close the connection, e.g. before the file is replaced.
+    """
+
+    global _connection
+
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+def lookup(nom, gen, gender):
+    """
+    Return the stored paradigm of a lemma as a dictionary keyed by LABELS,
+    or None if the lemma is not in the lexicon.
+    """
+
+    row = _fetch(nom, gen, gender)
+    return dict(zip(LABELS, row)) if row else None
+
+def _fetch(nom, gen, gender):
+    connection = connect()
+    if connection is None:
+        return None
+
+    try:
+        return connection.execute(_SELECT, (nom, gen, gender)).fetchone()
+    except sqlite3.Error:
+        return None
+
+def store(rows):
+    """
+    Write paradigms to the lexicon in a single transaction.
+
+    Args:
+        rows (iterable): (nom, gen, gender, forms) tuples, where forms are
+            the twelve forms in the order of LABELS.
+    """
+
+    connection = connect()
+    if connection is None:
+        return
+
+    try:
+        with connection:
+            connection.executemany(
+                    _INSERT,
+                    ((nom, gen, gender, *forms) for nom, gen, gender, forms in rows)
+                    )
+    except sqlite3.Error:
+        pass
+
+def paradigm(nom, gen, gender):
+    """
+    The paradigm of a lemma: from the paradigm cache if it is there, else
+    read from the lexicon if it is known there, otherwise declined with
+    DeclineNoun and added to the lexicon.
+    """
+
+    forms = cached_forms(nom, gen, gender)
+
+    if forms is None:
+        forms = _fetch(nom, gen, gender)
+        if forms is None:
+            forms = DeclineNoun(nom=nom, gen=gen, gender=gender).decline()
+            store([(nom, gen, gender, forms)])
+        forms = cache_forms(nom, gen, gender, forms)
+
+    return dict(zip(LABELS, forms))
+
+def known_lemmata():
+    """
+    Every lemma the game is known to use: the prototypes and the names a
+    character can be given at character generation.
+    """
+
+    from world import prototypes
+    from utils.latin_language.gens_class_praenomina import name_data
+
+    lemmata = []
+
+    for value in vars(prototypes).values():
+        if isinstance(value, dict) and 'formae' in value and 'sexus' in value:
+            formae = value['formae']
+            for nom, gen in zip(formae['nom_sg'], formae['gen_sg']):
+                lemmata.append((nom, gen, value['sexus']))
+
+    irregular = {'Opiter': 'Opitris', 'Caesō': 'Caesōnis', 'Sertor': 'Sertōris'}
+
+    for gens, data in name_data.items():
+        nōmen = gens[:-1] + 'us'
+        lemmata.append((nōmen, nōmen[:-2] + 'ī', 'māre'))
+        lemmata.append((gens, gens + 'e', 'muliebre'))
+        for praenōmen in data['praenomina']['masculine']:
+            genitive = irregular.get(praenōmen, praenōmen[:-2] + 'ī')
+            lemmata.append((praenōmen, genitive, 'māre'))
+        for praenōmen in data['praenomina']['feminine']:
+            lemmata.append((praenōmen, praenōmen + 'e', 'muliebre'))
+
+    return lemmata
+
+def build_lexicon(lemmata=None):
+    """
+    Decline lemmata (by default every known lemma) in bulk and add them to
+    the lexicon. Lemmata already present are left alone, so this is safe to
+    run on every cold start.
+    """
+
+    lemmata = list(dict.fromkeys(lemmata if lemmata is not None else known_lemmata()))
+
+    if not lemmata:
+        return 0
+
+    columns = decline_many(lemmata)
+    rows = [
+            (nom, gen, gender, [columns[label][i] for label in LABELS])
+            for i, (nom, gen, gender) in enumerate(lemmata)
+            ]
+    store(rows)
+
+    return len(rows)
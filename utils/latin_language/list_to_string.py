@@ -1,5 +1,7 @@
 # file mygame/utils/latin/list_to_string.py
 
+from itertools import islice
+
 def list_to_string(inlist, endsep="et", addquote=False):
     """
     This pretty-formats a list as string output, adding an optional
@@ -28,18 +30,15 @@ def list_to_string(inlist, endsep="et", addquote=False):
         ```
 
     """
-    if not endsep:
-        endsep = ","
-    else:
-        endsep = " " + endsep
     if not inlist:
         return ""
+    endsep = " " + endsep if endsep else ","
+    last = len(inlist) - 1
     if addquote:
-        if len(inlist) == 1:
+        if not last:
             return '"%s"' % inlist[0]
-        return ", ".join('"%s"' % v for v in inlist[:-1]) + "%s %s" % (endsep, '"%s"' % inlist[-1])
+        return '"%s"%s "%s"' % ('", "'.join(map(str, islice(inlist, last))), endsep, inlist[-1])
     else:
-        if len(inlist) == 1:
+        if not last:
             return str(inlist[0])
-        return ", ".join(str(v) for v in inlist[:-1]) + "%s %s" % (endsep, inlist[-1])
-
+        return "%s%s %s" % (", ".join(map(str, islice(inlist, last))), endsep, inlist[-1])
@@ -0,0 +1,25 @@
+# file mygame/utils/latin_language/normalize.py
+"""
+Macron- and case-insensitive matching of Latin forms.
+
+Players may or may not type macrons, so every form is compared in its
+normalized shape: lowercased and stripped of diacritics ('Gladiō' and
+'gladio' are both 'gladio'). populate_forms stores the normalized forms of
+each object as aliases in the NORMALIZED category, which lets Evennia's
+own alias search find them; form_index indexes them alongside the rest.
+"""
+
+from functools import lru_cache
+
+from unidecode import unidecode
+
+# Alias category holding the normalized forms of an object
+NORMALIZED = 'normalized'
+
+@lru_cache(maxsize=16384)
+def normalize(form):
+    """
+    Lowercase form and strip its macrons (and any other diacritics).
+    """
+
+    return unidecode(form.strip().lower())
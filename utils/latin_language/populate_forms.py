@@ -1,23 +1,66 @@
 # file mygame/utils/latin_language/populate_forms.py
 
-from utils.latin_language.decline_noun import DeclineNoun
-from unidecode import unidecode
+from django.db import transaction
+
+from utils.latin_language.lexicon import paradigm
+from utils.latin_language.form_index import reindex
+from utils.latin_language.case_index import forget
+from utils.latin_language.normalize import normalize, NORMALIZED
+from utils.latin_language.get_numbered_name import refresh_plural_aliases
 
 def populate_forms(self,nom='cīvis',gen='cīvis',gender='muliebre'):
     """
     A helper function for at_object_creation() for Latin typeclasses
+
+    The forms are read from the lexicon; lemmata it does not know yet are
+    declined and added to it.
+    """
+
+    populate_lemmata(self, [(nom, gen, gender)])
+
+def populate_lemmata(self, lemmata):
+    """
+    Add the forms of several lemmata (e.g. a praenōmen and a nōmen) to an
+    object in one go.
+
+    Args:
+        lemmata (list): (nom, gen, gender) tuples, in the order their forms
+            should be listed in self.db.formae.
+
+    self.db.formae is written once, and only the aliases the object does
+    not have yet are added, together, in a single transaction. The plural
+    aliases used for grouping are refreshed here too, and only if they
+    changed, so that rendering never has to write them.
     """
 
-    word = DeclineNoun(nom=nom,gen=gen,gender=gender)
-    forms = word.make_paradigm()
+    formae = {key: list(value) for key, value in (self.db.formae or {}).items()}
+    changed = self.db.formae is None
+    new_forms = []
+
+    for nom, gen, gender in lemmata:
+        forms = paradigm(nom, gen, gender)
+        for key, value in forms.items():
+            if value not in formae.setdefault(key, []):
+                formae[key].append(value)
+                changed = True
+            new_forms.append(value)
+
+    if changed:
+        self.db.formae = formae
+        forget(self)
+
+    aliases = set(self.aliases.get(return_list=True) or [])
+    normalized = set(self.aliases.get(category=NORMALIZED, return_list=True) or [])
+
+    new_aliases = {form.lower() for form in new_forms} - aliases
+    new_normalized = {normalize(form) for form in new_forms} - normalized
 
-    for key, value in forms.items():
-        if key in self.db.formae:
-            if value not in self.db.formae[key]:
-                self.db.formae[key].append(value)
-        else:
-            self.db.formae.update({key: [value]})
+    with transaction.atomic():
+        if new_aliases:
+            self.aliases.add(sorted(new_aliases))
+        if new_normalized:
+            self.aliases.add(sorted(new_normalized), category=NORMALIZED)
+        plurals_changed = refresh_plural_aliases(self)
 
-    for form in forms.values():
-        self.aliases.add(form)
-        self.aliases.add(unidecode(form))
+    if new_aliases or new_normalized or plurals_changed:
+        reindex(self)
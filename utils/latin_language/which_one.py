@@ -1,6 +1,6 @@
 # file mygame/utils/latin/which_one.py
 
-from unidecode import unidecode
+from utils.latin_language.form_index import find
 
 def which_one(args, caller, stuff):
     """
@@ -14,14 +14,7 @@ def which_one(args, caller, stuff):
         args = thing[-1].strip().lower()
 
         # collect objects that have the same name
-        same = []
-        for item in stuff:
-            characteristics = item.aliases.all()
-            [x.lower() for x in characteristics]
-            unidecoded_characteristics = [unidecode(x) for x in characteristics]
-            characteristics += unidecoded_characteristics
-            if args in characteristics:
-                same.append(item)
+        same = find(args, stuff)
 
         # if nothing was found, provide feedback
         if len(same) == 0:
@@ -39,19 +32,9 @@ def which_one(args, caller, stuff):
 
     # If the user assumes there is only one of the particular type
     else: 
-        same = []
         args = args.strip().lower()
 
-        for item in stuff:
-            characteristics = [item.key] + item.aliases.all()
-
-            [x.lower() for x in characteristics]
-
-            unidecoded_characteristics = [unidecode(x) for x in characteristics]
-            characteristics += unidecoded_characteristics
-
-            if args in characteristics:
-                same.append(item)
+        same = find(args, stuff)
 
         # if nothing is found, provide feedback
         if len(same) == 0:
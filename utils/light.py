@@ -0,0 +1,92 @@
+# file mygame/utils/light.py
+"""
+Light sources (objects with db.ardēns) and whether a looker can see.
+
+A looker can see unless their location is āter and there is no lit source
+either lying in it or among what the looker carries; a lamp carried by
+someone else, or in a sack on the floor, does not light the room for them.
+
+Every container keeps the number of lit objects directly inside it in its
+ndb (lūmina), so 'can the looker see' is two lookups rather than an
+Attribute read for every object present. The count is worked out from the
+contents the first time it is asked for and afterwards kept up to date by
+entered() and left(), called from at_object_receive and at_object_leave,
+and by accende() and exstingue(), which should be used to light and put
+out a source instead of setting db.ardēns directly, as the 'accende' and
+'exstingue' commands and Inflammābilis.at_object_creation do.
+"""
+
+from utils import appearance
+
+def is_lit(obj):
+    """
+    Whether obj is burning.
+    """
+
+    return bool(obj.db.ardēns)
+
+def lit_sources(container):
+    """
+    The number of lit objects directly inside container.
+    """
+
+    if container.ndb.lūmina is None:
+        container.ndb.lūmina = sum(1 for con in container.contents if is_lit(con))
+    return container.ndb.lūmina
+
+def can_see(looker):
+    """
+    Whether looker can see in their location.
+    """
+
+    room = looker.location
+    if room is None or not room.db.āter:
+        return True
+    return bool(lit_sources(room) or lit_sources(looker))
+
+def _adjust(container, change):
+    # a count not worked out yet will include the change when it is
+    if container is not None and change and container.ndb.lūmina is not None:
+        container.ndb.lūmina += change
+
+def entered(container, obj):
+    """
+    Count the light obj brings into container. Call from at_object_receive.
+    """
+
+    _adjust(container, int(is_lit(obj)))
+
+def left(container, obj):
+    """
+    Count the light obj takes out of container. Call from at_object_leave.
+    """
+
+    _adjust(container, -int(is_lit(obj)))
+
+def _set_lit(obj, lit):
+    if is_lit(obj) == lit:
+        return False
+
+    obj.db.ardēns = lit
+    change = 1 if lit else -1
+    container = obj.location
+    if container is not None:
+        _adjust(container, change)
+        appearance.changed(container)
+        if container.location is not None:
+            appearance.changed(container.location)
+    return True
+
+def accende(obj):
+    """
+    Light obj. Returns False if it was already burning.
+    """
+
+    return _set_lit(obj, True)
+
+def exstingue(obj):
+    """
+    Put obj out. Returns False if it was not burning.
+    """
+
+    return _set_lit(obj, False)
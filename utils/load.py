@@ -0,0 +1,182 @@
+# file mygame/utils/load.py
+"""
+How much each character carries (toll_fer['ferēns']).
+
+The load is worked out from what moves rather than adjusted by hand in
+every command that moves things. entered() and left() are called from
+at_object_receive and at_object_leave of Rēs and Persōna; the mass of
+the object (physical['massa'], which for a container already includes
+what is in it) is added to or taken from
+
+    - each container it is in, whose physical['massa'] is the container's
+      own mass plus its contents, and
+    - the first character found going outwards, whose load is kept in
+      ndb.ferēns.
+
+So a sack carried by someone weighs on them with everything in it, and
+putting something into a sack one carries leaves one's load as it was.
+
+The load in ndb is the live value. toll_fer['ferēns'] is a checkpoint of
+it: the ndb value starts from it and checkpoint() hands the loads that
+have changed to utils.writebehind, which calls it before every flush.
+The containers' massa goes through writebehind too. recount() works a
+load out again from what a character actually carries, and repair() does
+so for every character in the game (the 'pondera' command), after
+weighing every container again from its own mass and its contents.
+
+A container's own mass, empty, is physical['massa_vacua']. Containers
+that do not have it yet are taken to weigh what they should the first
+time repair() sees them, and their own mass is worked out and kept from
+then on.
+"""
+
+from math import isclose
+
+from django.db import transaction
+
+from evennia.objects.models import ObjectDB
+
+from utils import writebehind
+
+# Characters whose load has changed since the last checkpoint
+_changed = set()
+
+def mass(obj):
+    """
+    The mass of obj, including anything in it.
+    """
+
+    return writebehind.value(obj, 'physical', 'massa') or 0
+
+def weighed(character):
+    """
+    The mass of everything character carries, worked out from scratch.
+    """
+
+    return sum(mass(thing) for thing in character.contents)
+
+def carried(character):
+    """
+    The mass character carries.
+    """
+
+    load = character.ndb.ferēns
+    if load is None:
+        toll_fer = character.db.toll_fer
+        if toll_fer and toll_fer.get('ferēns') is not None:
+            load = toll_fer['ferēns']
+        else:
+            load = weighed(character)
+        character.ndb.ferēns = load
+    return load
+
+def can_carry(character, extra):
+    """
+    Whether character can carry extra more mass.
+    """
+
+    return carried(character) + extra <= character.db.toll_fer['max']
+
+def _set(character, load):
+    character.ndb.ferēns = load
+    _changed.add(character)
+
+def _carry(container, change):
+    # add change to container and whatever it is in, up to the first
+    # character or the room
+    while container is not None and change:
+        if container.db.toll_fer is not None:
+            _set(container, carried(container) + change)
+            return
+        if container.location is None:
+            return
+        if container.db.physical:
+            writebehind.add(container, 'physical', 'massa', change)
+        container = container.location
+
+def entered(container, obj):
+    """
+    Count the mass of obj into container. Call from at_object_receive.
+    """
+
+    _carry(container, mass(obj))
+
+def left(container, obj):
+    """
+    Take the mass of obj out of container. Call from at_object_leave.
+    """
+
+    _carry(container, -mass(obj))
+
+def recount(character):
+    """
+    Work out the load of character from what they carry.
+    """
+
+    _set(character, weighed(character))
+    return character.ndb.ferēns
+
+@writebehind.before_flush
+def checkpoint():
+    """
+    Store the loads that have changed in toll_fer['ferēns'].
+    """
+
+    while _changed:
+        character = _changed.pop()
+        load = character.ndb.ferēns
+        if load is not None and character.db.toll_fer is not None:
+            writebehind.put(character, 'toll_fer', 'ferēns', load)
+
+def reweigh(container, weighed_already=None):
+    """
+    Work out the massa of container from its own mass and what is in it,
+    weighing any containers in it first. Returns the containers whose
+    massa was wrong, with the old and new massa.
+    """
+
+    if weighed_already is None:
+        weighed_already = set()
+    weighed_already.add(container)
+
+    repaired = []
+    contents = 0
+    for thing in container.contents:
+        if thing.db.capax and thing.db.physical and thing not in weighed_already:
+            repaired.extend(reweigh(thing, weighed_already))
+        contents += mass(thing)
+
+    old = mass(container)
+    own = writebehind.value(container, 'physical', 'massa_vacua')
+    if own is None:
+        own = old - contents
+        writebehind.put(container, 'physical', 'massa_vacua', own)
+
+    new = own + contents
+    if not isclose(old, new):
+        writebehind.put(container, 'physical', 'massa', new)
+        repaired.append((container, old, new))
+    return repaired
+
+def repair():
+    """
+    Weigh every container again, then work out the load of every
+    character again, and store them. Returns the containers and
+    characters whose stored massa or load was wrong, with the old and new
+    values.
+    """
+
+    repaired = []
+    with transaction.atomic():
+        weighed_already = set()
+        for container in ObjectDB.objects.get_by_attribute(key='capax'):
+            if container.db.capax and container.db.physical and container not in weighed_already:
+                repaired.extend(reweigh(container, weighed_already))
+
+        for character in ObjectDB.objects.get_by_attribute(key='toll_fer'):
+            old = character.db.toll_fer.get('ferēns')
+            new = recount(character)
+            if old is None or not isclose(old, new):
+                repaired.append((character, old, new))
+        writebehind.flush()
+    return repaired
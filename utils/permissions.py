@@ -0,0 +1,52 @@
+# file mygame/utils/permissions.py
+"""
+Whether a looker is a builder, worked out once per command.
+
+Names are displayed with dbrefs to builders, which means a 'perm(Builder)'
+lockstring check for every name shown: once per person in a room render and
+once per listener of 'dīc'. The answer is kept in the looker's ndb together
+with the number of the command it was worked out in, so it is worked out
+again after every command, whoever ran it, and for lookers nobody is
+playing as well. changed() starts a new count; the MuxCommands call it in
+at_post_cmd, and so do the perm and quell commands (see
+commands/default_cmdsets.py), so a change of permissions is seen at once.
+Looking in through puppeting changes the permissions that apply, so
+at_post_puppet and at_post_unpuppet call forget().
+"""
+
+BUILDER_LOCK = "perm(Builder)"
+
+# The number of the current command; answers from earlier ones are stale
+_command = 0
+
+def is_builder(looker):
+    """
+    Whether looker passes 'perm(Builder)'.
+    """
+
+    if looker is None:
+        return False
+
+    cached = looker.ndb.is_builder
+    if cached is None or cached[0] != _command:
+        cached = looker.ndb.is_builder = (
+                _command, bool(looker.locks.check_lockstring(looker, BUILDER_LOCK)))
+    return cached[1]
+
+def changed():
+    """
+    Forget every cached answer, after a command or a change of
+    permissions.
+    """
+
+    global _command
+
+    _command += 1
+
+def forget(looker):
+    """
+    Drop the cached builder status of looker.
+    """
+
+    if looker is not None:
+        looker.ndb.is_builder = None
@@ -0,0 +1,68 @@
+# file mygame/utils/status.py
+"""
+A character's vital signs, pushed to their client out of band.
+
+push(character) sends the 'status' outputfunc (GMCP/MSDP for telnet
+clients, a message of type 'status' for the webclient) with only those
+values that have changed since the last push, e.g.
+
+    status {'pv': {'nunc': 7, 'max': 12}}
+
+The values are:
+
+    pv                  health, {'nunc': ..., 'max': ...}
+    toll_fer            load, {'ferēns': ..., 'max': ...}
+    manūs               the number of free hands
+    combat_actionsleft  actions left this turn, None out of combat
+
+What was last sent is kept in the character's ndb; the 'status'
+inputfunc in server/conf/inputfuncs.py forgets it and so sends everything,
+for a client that has just connected. Characters no one is playing are
+skipped. The text prompt after each command is left as it was, for
+clients without OOB support.
+"""
+
+from utils import hands, load, writebehind
+
+def current(character):
+    """
+    The status values of character as they are now.
+    """
+
+    pv = character.db.pv or {}
+    toll_fer = character.db.toll_fer or {}
+
+    return {
+            'pv': {'nunc': writebehind.value(character, 'pv', 'nunc'), 'max': pv.get('max')},
+            'toll_fer': {'ferēns': load.carried(character) if toll_fer else None, 'max': toll_fer.get('max')},
+            'manūs': len(hands.free(character)) if character.db.handedness else None,
+            'combat_actionsleft': character.db.combat_actionsleft if character.db.combat_turnhandler else None,
+            }
+
+def forget(character):
+    """
+    Forget what was last sent, so that the next push sends everything.
+    """
+
+    character.ndb.status = None
+
+def push(character):
+    """
+    Send character's client the status values that have changed.
+    Returns the values sent.
+    """
+
+    sessions = character.sessions.all()
+    if not sessions:
+        return {}
+
+    now = current(character)
+    sent = character.ndb.status or {}
+    delta = {key: value for key, value in now.items() if key not in sent or sent[key] != value}
+
+    if delta:
+        character.ndb.status = now
+        for session in sessions:
+            session.data_out(status=((), delta))
+
+    return delta
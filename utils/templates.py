@@ -0,0 +1,64 @@
+# file mygame/utils/templates.py
+"""
+Message templates, checked and split up once when the module defining
+them is imported rather than every time a message is sent.
+
+A Template is an ordinary str.format template, e.g.
+
+    EXITS = Template("\\n|wAd hōs locōs īre licet:|n\\n {exits}\\n")
+    EXITS(exits=list_to_string(exit_strings))
+
+which is parsed when it is made, so a malformed template fails at import
+rather than in front of a player, and whose slots are then known. Filling
+it in is a single str.format_map call. join() puts the pieces of a
+message together with one str.join, instead of growing a string with +=.
+
+template() returns the Template for a string, compiling each distinct
+string only once; broadcast() uses it for the templates it is given.
+"""
+
+from functools import lru_cache
+from string import Formatter
+
+class Template:
+    """
+    A str.format template with its slots worked out.
+    """
+
+    __slots__ = ('text', 'slots', '_format')
+
+    def __init__(self, text):
+        self.text = text
+        self.slots = frozenset(
+                field.split('.')[0].split('[')[0]
+                for literal, field, spec, conversion in Formatter().parse(text)
+                if field)
+        self._format = text.format_map
+
+    def __call__(self, **values):
+        return self._format(values)
+
+    def render(self, values):
+        """
+        Fill in the template from the mapping values.
+        """
+
+        return self._format(values)
+
+    def __repr__(self):
+        return f"Template({self.text!r})"
+
+@lru_cache(maxsize=1024)
+def template(text):
+    """
+    The Template for text.
+    """
+
+    return Template(text)
+
+def join(*parts):
+    """
+    Join the non-empty parts of a message into one string.
+    """
+
+    return "".join([part for part in parts if part])
@@ -0,0 +1,102 @@
+# file mygame/utils/writebehind.py
+"""
+Changes to single keys of dict Attributes (pv['nunc'], physical['massa'],
+toll_fer['ferēns'], capax['rem_vol']), held back and saved together.
+
+Changing a key of a dict Attribute in place, as in
+
+    defender.db.pv['nunc'] -= damage
+
+saves the whole dict again, so a command that does it several times to
+the same Attribute saves it several times. Instead
+
+    writebehind.add(defender, 'pv', 'nunc', -damage)
+
+notes the new value here, value() reads it back (pending or stored), and
+flush() saves each Attribute that has changed once, all in one
+transaction. Flushing happens after every command (the at_post_cmd of
+both MuxCommands), after every walk through an exit (Exitus.at_traverse,
+since exits are commands of their own), after each tick of the combat
+turn handler and of the wandering script, and in at_server_stop, before
+a reload or shutdown. A script or command that changes one of these keys
+outside those paths should call flush() itself when it is done.
+
+Modules that keep a live value in ndb and store it as a checkpoint (the
+load ledger, the room left in containers) register their checkpoint with
+before_flush(), so that it is handed over here just before each flush.
+
+Anything that reads one of these keys between a change and the flush
+should read it with value() rather than from db.
+"""
+
+from django.db import transaction
+
+# (obj, attribute) -> {key: value} not yet saved
+_pending = {}
+
+# Called at the start of every flush
+_checkpoints = []
+
+def value(obj, attribute, key, default=None):
+    """
+    obj.db.<attribute>[key], including any change not yet saved.
+    """
+
+    changes = _pending.get((obj, attribute))
+    if changes and key in changes:
+        return changes[key]
+    stored = obj.attributes.get(attribute)
+    if stored is None:
+        return default
+    return stored.get(key, default)
+
+def put(obj, attribute, key, new):
+    """
+    Set obj.db.<attribute>[key] to new at the next flush.
+    """
+
+    _pending.setdefault((obj, attribute), {})[key] = new
+
+def add(obj, attribute, key, change):
+    """
+    Add change to obj.db.<attribute>[key] at the next flush.
+    """
+
+    put(obj, attribute, key, (value(obj, attribute, key) or 0) + change)
+
+def before_flush(checkpoint):
+    """
+    Have checkpoint() called at the start of every flush.
+    """
+
+    if checkpoint not in _checkpoints:
+        _checkpoints.append(checkpoint)
+    return checkpoint
+
+def flush():
+    """
+    Save every Attribute with pending changes, each once, in one
+    transaction.
+    """
+
+    for checkpoint in _checkpoints:
+        checkpoint()
+    if not _pending:
+        return
+
+    pending = list(_pending.items())
+    with transaction.atomic():
+        for (obj, attribute), changes in pending:
+            # Skip objects deleted since
+            if not obj.pk:
+                continue
+            stored = obj.attributes.get(attribute)
+            if stored is None:
+                continue
+            updated = dict(stored)
+            updated.update(changes)
+            if updated != stored:
+                obj.attributes.add(attribute, updated)
+    for key, changes in pending:
+        if _pending.get(key) is changes:
+            del _pending[key]
@@ -50,8 +50,11 @@ from commands.command import MuxCommand
 from evennia.commands.default.help import CmdHelp
 # adding the following to begin translation into Latin
 from utils.latin_language.which_one import which_one
+from utils.latin_language.form_index import within
 from utils.latin_language.check_grammar import check_case
-from utils.latin_language.adjective_agreement import us_a_um
+from utils.latin_language.adjective_agreement import agree
+from utils import equipment, status, writebehind
+from utils.broadcast import broadcast
 """
 ----------------------------------------------------------------------------
 OPTIONS
@@ -158,12 +161,9 @@ def get_damage(attacker, defender):
     # Changed damage to 5e unarmed values to match lower hp values
     good_hand = attacker.db.handedness
     weapon = False
-    stuff = attacker.contents
-    for thing in stuff:
-        if thing.db.tenētur:
-            if thing.db.tenētur == attacker.db.handedness:
-                if thing.db.vīs:
-                    weapon = thing
+    thing = equipment.in_hand(attacker, good_hand)
+    if thing and thing.db.vīs:
+        weapon = thing
 #                attacker.location.msg_contents(f"|gWEAPON|n")
     bonus = calc_bonus(attacker.db.ingenia['vīrēs'])
     if weapon:
@@ -183,10 +183,10 @@ def apply_damage(defender, damage):
         damage (int): Amount of damage being taken
     """
     # Adjusting so it recognizes my hp syntax
-    defender.db.pv['nunc'] -= damage  # Reduce defender's HP by the damage dealt.
-    # If this reduces it to 0 or less, set HP to 0.
-    if defender.db.pv['nunc'] <= 0:
-        defender.db.pv['nunc'] = 0
+    pv = writebehind.value(defender, 'pv', 'nunc') - damage  # Reduce defender's HP by the damage dealt.
+    # If this reduces it to 0 or less, set HP to 0; saved with the rest of the turn
+    writebehind.put(defender, 'pv', 'nunc', max(pv, 0))
+    status.push(defender)
 
 
 def at_defeat(defeated):
@@ -205,8 +205,8 @@ def at_defeat(defeated):
     # adding the following line to deal with dumb workaround to limit number
     # of initial combatants
     defeated.db.fighting = False
-    defeated.location.msg_contents(f"|c%s|n |rest vict{us_a_um('nom_sg',caller.db.sexus)}!|n" % defeated,exclude=defeated)
-    defeated.msg(f"|rTū es vict{us_a_um('nom_sg',caller.db.sexus)}!|n")
+    defeated.location.msg_contents(f"|c%s|n |rest {agree('vict', defeated)}!|n" % defeated,exclude=defeated)
+    defeated.msg(f"|rTū es {agree('vict', defeated)}!|n")
 
 
 def resolve_attack(attacker, defender, attack_value=None, defense_value=None):
@@ -223,12 +223,10 @@ def resolve_attack(attacker, defender, attack_value=None, defense_value=None):
     # get the attacker's weapon
     good_hand = attacker.db.handedness
     has_weapon = False
-    stuff = attacker.contents
     weapon = ''
-    for thing in stuff:
-        if thing.db.tenētur:
-            if thing.db.tenētur == good_hand:
-                weapon = thing.db.formae['abl_sg'][0]
+    thing = equipment.in_hand(attacker, good_hand)
+    if thing:
+        weapon = thing.db.formae['abl_sg'][0]
     if not weapon:
         weapon = 'manū'
 
@@ -240,26 +238,35 @@ def resolve_attack(attacker, defender, attack_value=None, defense_value=None):
         defense_value = get_defense(attacker, defender)
     # If the attack value is lower than the defense value, miss. Otherwise, hit.
     if (attack_value < defense_value or attack_roll == 1) and attack_roll != 20:
-        attacker.location.msg_contents("|c%s|n |C%s|n |w%s|n |gnōn percussit|n!" % (attacker.db.formae['nom_sg'][0], defender.db.formae['acc_sg'][0],weapon),exclude=(attacker,defender))
-        attacker.msg("|cTū|n |C%s|n |w%s|n |rnōn percussistī|n!" % (defender.db.formae['acc_sg'][0],weapon))
-        defender.msg("|C%s|n |ctē|n |w%s|n |gnōn percussit|n!" % (attacker,weapon))
+        broadcast(attacker.location, attacker, defender,
+                to_actor="|cTū|n |C{target:acc_sg}|n |w{weapon}|n |rnōn percussistī|n!",
+                to_target="|C{actor}|n |ctē|n |w{weapon}|n |gnōn percussit|n!",
+                to_room="|c{actor:nom_sg}|n |C{target:acc_sg}|n |w{weapon}|n |gnōn percussit|n!",
+                weapon=weapon,
+                )
     else:
         if attack_roll == 20:
             damage_value = 2 * (get_damage(attacker, defender))  # Calculate damage value.
-            attacker.location.msg_contents("|c%s|n |C%s|n |w%s|n |rFORTISSIME percussit|n!" % (attacker.db.formae['nom_sg'][0], defender.db.formae['acc_sg'][0],weapon),exclude=(attacker,defender))
-            attacker.msg("|cTū|n |C%s|n |w%s|n |gFORTISSIME percussistī|n!" % (defender.db.formae['acc_sg'][0],weapon))
-            defender.msg("|C%s|n |ctē|n |w%s|n |rFORTISSIME percussit|n!" % (attacker,weapon))
+            broadcast(attacker.location, attacker, defender,
+                    to_actor="|cTū|n |C{target:acc_sg}|n |w{weapon}|n |gFORTISSIME percussistī|n!",
+                    to_target="|C{actor}|n |ctē|n |w{weapon}|n |rFORTISSIME percussit|n!",
+                    to_room="|c{actor:nom_sg}|n |C{target:acc_sg}|n |w{weapon}|n |rFORTISSIME percussit|n!",
+                    weapon=weapon,
+                    )
         else:
             damage_value = get_damage(attacker, defender)  # Calculate damage value.
         # Announce damage dealt and apply damage.
-            attacker.location.msg_contents("|c%s|n |C%s|n |w%s|n |rpercussit|n!" % (attacker.db.formae['nom_sg'][0], defender.db.formae['acc_sg'][0],weapon),exclude=(attacker,defender))
-            attacker.msg("|cTū|n |C%s|n |w%s|n |gpercussistī|n!" % (defender.db.formae['acc_sg'][0],weapon))
-            defender.msg("|C%s|n |ctē|n |w%s|n |rpercussit|n!" % (attacker,weapon))
+            broadcast(attacker.location, attacker, defender,
+                    to_actor="|cTū|n |C{target:acc_sg}|n |w{weapon}|n |gpercussistī|n!",
+                    to_target="|C{actor}|n |ctē|n |w{weapon}|n |rpercussit|n!",
+                    to_room="|c{actor:nom_sg}|n |C{target:acc_sg}|n |w{weapon}|n |rpercussit|n!",
+                    weapon=weapon,
+                    )
         
         apply_damage(defender, damage_value)
         # If defender HP is reduced to 0 or less, call at_defeat.
         # Adjusting so that script recognizes my hp syntax
-        if defender.db.pv['nunc'] <= 0:
+        if writebehind.value(defender, 'pv', 'nunc') <= 0:
             at_defeat(defender)
             # adding the following to deal with my dumb workaround to limit
             # initial number of combatants
@@ -377,7 +384,7 @@ class TBBasicCharacter(DefaultCharacter):
             self.msg("Tibi pugnantī discēdere nōn licet!")
             return False  # Returning false keeps the character from moving.
         # Adjusting so that the script recognizes my hp
-        if self.db.pv['nunc'] <= 0:
+        if writebehind.value(self, 'pv', 'nunc') <= 0:
             self.msg(f"Tū discēdere nōn potes: es vict{'a' if self.db.gender == 1 else 'us' if self.db.gender == 2 else 'um'} atque fortasse moreris!")
             # adding the following to deal with dumb workaround for limiting
             # initial number of fighters
@@ -417,7 +424,7 @@ class TBBasicTurnHandler(DefaultScript):
         for thing in self.obj.contents:
             # adjusted so it would recognize my hp syntax
             if thing.db.pv:
-                if thing.db.pv['nunc'] > 0:
+                if writebehind.value(thing, 'pv', 'nunc') > 0:
                     if thing.db.fighting == True:
                         self.db.fighters.append(thing)
 
@@ -464,13 +471,13 @@ class TBBasicTurnHandler(DefaultScript):
             # adding following to have auto attack at timer end
             attacker = currentchar
             # In large battles defeated characters still involved
-            if attacker.db.pv['nunc'] <= 0:
+            if writebehind.value(attacker, 'pv', 'nunc') <= 0:
                 spend_action(currentchar, "all", action_name="disengage")  # Use up one action.
                 return
             # need to deal with group combat situations?
             victims = []
             for fighter in self.db.fighters:
-                if fighter != currentchar and fighter.db.pv['nunc'] > 0:
+                if fighter != currentchar and writebehind.value(fighter, 'pv', 'nunc') > 0:
                     victims.append(fighter)
             # commenting out for experiment in group combat and efficiency as folks
             # are defeated
@@ -485,6 +492,7 @@ class TBBasicTurnHandler(DefaultScript):
             else:
                 defender = choice(victims)
             resolve_attack(attacker,defender)
+            writebehind.flush()
             spend_action(currentchar, "all", action_name="attack")  # Use up one action.
             # Force current character to disengage if timer runs out.
 #            self.obj.msg_contents("%s's turn timed out!" % currentchar)
@@ -530,7 +538,9 @@ class TBBasicTurnHandler(DefaultScript):
         # Adjusting so script understands my hp syntax
         # Adjusting the following again to make the battles a little more legible
 #        character.msg("|wNunc tibi agere licet! Vita: |c%i|n|w.|n" % character.db.hp['current'])
-        character.msg("\n|wVīta: %i/%i)|n " % (character.db.pv['nunc'],character.db.pv['max']))
+        # Clients are sent the change in actions (and anything else) out of
+        # band rather than another full prompt
+        status.push(character)
 
     def next_turn(self):
         """
@@ -562,7 +572,7 @@ class TBBasicTurnHandler(DefaultScript):
                 fighter.db.combat_lastaction = 'null'
 #                fighter.location.msg_contents(f"cowards: {cowards}; hostiles: {hostiles}!")
             else:
-                if fighter.db.pv['nunc'] > 0:
+                if writebehind.value(fighter, 'pv', 'nunc') > 0:
                     hostiles.append(fighter)
 #                    fighter.location.msg_contents(f"cowards: {cowards}; hostiles: {hostiles}!")
         if len(cowards) == 0:
@@ -602,7 +612,7 @@ class TBBasicTurnHandler(DefaultScript):
         defeated_characters = 0
         for fighter in self.db.fighters:
             # Adjusting so the script recognizes my syntax for hp
-            if fighter.db.pv['nunc'] == 0:
+            if writebehind.value(fighter, 'pv', 'nunc') == 0:
                 # initial number of fighters
                 # added the following to deal with dumb workaround to limit
                 # now commenting out, bc combat seems to keep going for some reason
@@ -613,7 +623,7 @@ class TBBasicTurnHandler(DefaultScript):
         ):  # If only one character isn't defeated
             for fighter in self.db.fighters:
                 # Adjusting so that script recognizes my hp syntax
-                if fighter.db.pv['nunc'] != 0:
+                if writebehind.value(fighter, 'pv', 'nunc') != 0:
                     LastStanding = fighter  # Pick the one fighter left with HP remaining
             self.obj.msg_contents(f"|c%s|n |wvīcit! Pugna est peracta!|n" % LastStanding,exclude=LastStanding)
             LastStanding.msg(f"|gTū vīcistī!! Pugna est peracta!|n")
@@ -698,8 +708,7 @@ class CmdFight(MuxCommand):
             caller.msg("Usage: pugna <rem>")
             return
         else:
-            stuff = here.contents
-            target, self.args = which_one(self.args,caller,stuff)
+            target, self.args = which_one(self.args,caller,within(here))
             if not target:
                 return
         if check_case(caller, target, self.args, 'acc_sg') == False:
@@ -718,8 +727,8 @@ class CmdFight(MuxCommand):
             return
 
         # Adjusting so it recognizes my hp syntax
-        if not defender.db.pv['nunc']:  # Target object has no HP left or to begin with
-            caller.msg(f"{defender.db.formae['nom_sg'][0]} iam vict{us_a_um('nom_sg',defender.db.sexus)} est!")
+        if not writebehind.value(defender, 'pv', 'nunc'):  # Target object has no HP left or to begin with
+            caller.msg(f"{defender.db.formae['nom_sg'][0]} iam {agree('vict', defender)} est!")
             return
 
         if attacker == defender:  # Target and attacker are the same
@@ -727,8 +736,8 @@ class CmdFight(MuxCommand):
             return
 
         # Adjusting so script recognizes my syntax for hp
-        if not caller.db.pv['nunc']:  # If you don't have any hp
-            caller.msg(f"Vict{us_a_um('nom_sg',caller.db.sexus)} tū pugnāre nōn potes!")
+        if not writebehind.value(caller, 'pv', 'nunc'):  # If you don't have any hp
+            caller.msg(f"{agree('Vict', caller)} tū pugnāre nōn potes!")
             return
         if is_in_combat(caller):  # Already in a fight
             caller.msg("Tū iam pugnās!")
@@ -792,8 +801,7 @@ class CmdAttack(MuxCommand):
             caller.msg("Usage: pete <rem>")
             return
         else:
-            stuff = here.contents
-            target, self.args = which_one(self.args,caller,stuff)
+            target, self.args = which_one(self.args,caller,within(here))
             if not target:
                 return
         if check_case(caller,target,self.args,'acc_sg') == False:
@@ -810,8 +818,8 @@ class CmdAttack(MuxCommand):
         if not defender.db.pv:
             caller.msg(f"Tibi {defender.db.formae['acc_sg'][0]} pugnāre nōn licet!")
             return
-        if not defender.db.pv['nunc']:  # Target object has no HP left or to begin with
-            caller.msg(f"{defender.db.nom_sg[0]} iam vict{us_a_um('nom_sg',defender.db.sexus)} est!")           
+        if not writebehind.value(defender, 'pv', 'nunc'):  # Target object has no HP left or to begin with
+            caller.msg(f"{defender.db.nom_sg[0]} iam {agree('vict', defender)} est!")           
             return
 
         if attacker == defender:  # Target and attacker are the same
@@ -822,8 +830,8 @@ class CmdAttack(MuxCommand):
 
         # the blow used to be after 'is_turn'
         # Adjusting so it recognizes my hp syntax
-        if not caller.db.pv['nunc']:  # Can't attack if you have no HP.
-            caller.msg(f"Vict{us_a_um('nom_sg',caller.db.sexus)} tū pugnāre nōn potes!")
+        if not writebehind.value(caller, 'pv', 'nunc'):  # Can't attack if you have no HP.
+            caller.msg(f"{agree('Vict', caller)} tū pugnāre nōn potes!")
             return
 
         # after I moved the top block, the above was just after 'is_turn'
@@ -984,7 +992,7 @@ class CmdRest(MuxCommand):
             return
 
         # Adjusting so it recognizes the syntax of my hp
-        caller.db.pv['nunc'] = caller.db.pv['max']  # Set current HP to maximum
+        writebehind.put(caller, 'pv', 'nunc', caller.db.pv['max'])  # Set current HP to maximum
         caller.location.msg_contents("|c%s|n requiēvit ut vitam reficeret." % caller,exclude=caller)
         caller.msg("Requiēvistī ut vitam reficerēs.")
         """